@@ -0,0 +1,361 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+import httpx
+
+# Первинні ключі та значення за замовчуванням, які в Supabase проставляє сама база
+TABLE_DEFAULTS: Dict[str, Dict[str, Callable[[], Any]]] = {
+    "transactions": {
+        "transaction_id": lambda: str(uuid.uuid4()),
+        "created_at": lambda: datetime.now(timezone.utc).isoformat(),
+    },
+    "categories": {
+        "id": lambda: str(uuid.uuid4()),
+        "is_fop_only": lambda: False,
+    },
+    "profiles": {
+        "created_at": lambda: datetime.now(timezone.utc).isoformat(),
+    },
+    "fop_settings": {},
+}
+
+# Ключі для upsert (on_conflict), якщо клієнт не передав їх явно
+TABLE_KEYS: Dict[str, Tuple[str, ...]] = {
+    "transactions": ("transaction_id",),
+    "categories": ("id",),
+    "profiles": ("id",),
+    "fop_settings": ("user_id",),
+}
+
+# Зовнішні ключі: (таблиця, колонка) -> (таблиця, колонка), як обмеження в Supabase
+FOREIGN_KEYS: Dict[Tuple[str, str], Tuple[str, str]] = {
+    ("transactions", "category_id"): ("categories", "id"),
+}
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Ділить 'a.eq.1,and(b.eq.2,c.lt."x,y")' по комах верхнього рівня (з урахуванням дужок і лапок)."""
+    parts, depth, quoted, current = [], 0, False, ""
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0 and not quoted:
+            parts.append(current)
+            current = ""
+        else:
+            current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) >= 2 and value[0] == value[-1] == '"' else value
+
+
+def _coerce(row_value: Any, raw: str) -> Any:
+    """Приводить значення з фільтра до типу значення в рядку, щоб порівняння було як у Postgres."""
+    if isinstance(row_value, bool):
+        return raw == "true"
+    if isinstance(row_value, (int, float)):
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+def _compare(row_value: Any, op: str, raw: str) -> bool:
+    if op == "is":
+        if raw == "null":
+            return row_value is None
+        return row_value is (raw == "true")
+    if op == "in":
+        values = [_unquote(v) for v in _split_top_level(raw.strip("()"))]
+        return row_value is not None and str(row_value) in values
+    if row_value is None:
+        return False
+
+    value = _coerce(row_value, _unquote(raw))
+    left = float(row_value) if isinstance(value, float) and not isinstance(row_value, bool) else row_value
+    if not isinstance(value, float):
+        left = str(row_value)
+
+    if op == "eq": return left == value
+    if op == "neq": return left != value
+    if op == "gt": return left > value
+    if op == "gte": return left >= value
+    if op == "lt": return left < value
+    if op == "lte": return left <= value
+    raise ValueError(f"Непідтримуваний оператор фільтра: {op}")
+
+
+def _condition(expr: str) -> Callable[[dict], bool]:
+    """Умова з or=(...): 'col.op.value', 'and(...)' або 'or(...)'."""
+    for group, combine in (("and(", all), ("or(", any)):
+        if expr.startswith(group) and expr.endswith(")"):
+            nested = [_condition(e) for e in _split_top_level(expr[len(group):-1])]
+            return lambda row, nested=nested, combine=combine: combine(c(row) for c in nested)
+
+    column, op, raw = expr.split(".", 2)
+    negate = op == "not"
+    if negate:
+        op, raw = raw.split(".", 1)
+    return lambda row: _compare(row.get(column), op, raw) != negate
+
+
+def aggregate_transactions_by_month(tables: Dict[str, List[dict]], params: dict) -> List[dict]:
+    """Те саме, що функція з supabase/migrations/*_aggregate_transactions_by_month.sql."""
+    start, end = params.get("p_start_date"), params.get("p_end_date")
+    groups: Dict[tuple, List[Any]] = {}
+    for row in tables.get("transactions", []):
+        day = str(row["transaction_date"])[:10]
+        if str(row["user_id"]) != params["p_user_id"] or (start and day < start) or (end and day > end):
+            continue
+        currency = row.get("currency_code") if params.get("p_by_currency") else None
+        group = groups.setdefault((day[:7], row["transaction_type"], row.get("category_id"), currency), [0.0, 0.0, 0])
+        amount = row["transaction_amount"] or 0
+        group[0] += amount
+        group[1] += row["amount_original"] if row.get("amount_original") is not None else amount
+        group[2] += 1
+    return [
+        {"month": month, "transaction_type": tx_type, "category_id": category_id, "currency_code": currency,
+         "amount": amount, "amount_original": original, "tx_count": count}
+        for (month, tx_type, category_id, currency), (amount, original, count) in groups.items()
+    ]
+
+
+def patch_transaction_financials(tables: Dict[str, List[dict]], params: dict) -> List[dict]:
+    """Те саме, що функція з supabase/migrations/*_patch_transaction_financials.sql."""
+    row = next((r for r in tables.get("transactions", [])
+                if r["transaction_id"] == params["p_transaction_id"] and str(r["user_id"]) == params["p_user_id"]), None)
+    if row is None:
+        return []
+    old_date = str(row["transaction_date"])[:10]
+    new_amount = params.get("p_amount")
+    if new_amount is None:
+        new_amount = row["amount_original"] if row.get("amount_original") is not None else row["transaction_amount"]
+    new_date = params.get("p_date") or old_date
+    new_currency = params.get("p_currency") or row["currency_code"]
+    manual_rate = params.get("p_manual_rate")
+
+    if new_currency == "UAH":
+        rate = 1.0
+    elif manual_rate is not None and manual_rate > 0:
+        rate = manual_rate
+    elif params.get("p_reset_rate") or new_currency != row["currency_code"] or new_date != old_date:
+        matches = (new_currency, new_date) == (params.get("p_rate_currency"), params.get("p_rate_date"))
+        rate = params.get("p_nbu_rate") if matches else None
+    else:
+        rate = row["exchange_rate"]
+    if rate is None:
+        return []
+
+    old = {"old_transaction_date": row["transaction_date"], "old_transaction_type": row["transaction_type"],
+           "old_transaction_amount": row["transaction_amount"]}
+    for column, param in (("transaction_type", "p_transaction_type"), ("category_id", "p_category_id"), ("notes", "p_notes")):
+        if params.get(param) is not None:
+            row[column] = params[param]
+    row.update({
+        "transaction_date": new_date, "currency_code": new_currency, "is_foreign_currency": new_currency != "UAH",
+        "exchange_rate": rate, "amount_original": None if new_currency == "UAH" else new_amount,
+        "transaction_amount": round(new_amount * rate, 2),
+    })
+    return [{**row, **old}]
+
+
+# Функції бази, доступні через POST /rest/v1/rpc/<name>
+FUNCTIONS: Dict[str, Callable[[Dict[str, List[dict]], dict], List[dict]]] = {
+    "aggregate_transactions_by_month": aggregate_transactions_by_month,
+    "patch_transaction_financials": patch_transaction_financials,
+}
+
+
+def _error(code: Optional[str], message: str) -> dict:
+    """Тіло помилки у форматі PostgREST (postgrest-py очікує всі чотири поля)."""
+    return {"code": code, "message": message, "details": None, "hint": None}
+
+
+class FakePostgrest:
+    """
+    Мінімальний PostgREST у пам'яті для бенчмарків: таблиці — списки словників.
+    Підтримує те, чим користуються репозиторії: select з колонками, фільтри eq/neq/gt/gte/lt/lte/is/in,
+    or=(...) з вкладеними and(...), order, limit/offset, insert/upsert/update/delete
+    з Prefer: return=representation, зовнішні ключі з FOREIGN_KEYS (помилка 23503)
+    і виклики функцій з FUNCTIONS (rpc/<name>).
+    latency — штучна затримка на кожен запит (імітація мережі до Supabase), у секундах.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.tables: Dict[str, List[dict]] = {name: [] for name in TABLE_DEFAULTS}
+        self.functions = dict(FUNCTIONS)
+        self.requests = 0
+
+    # ---------- Наповнення ----------
+
+    def seed(self, table: str, rows: List[dict]) -> List[dict]:
+        stored = [self._with_defaults(table, row) for row in rows]
+        self.tables.setdefault(table, []).extend(stored)
+        return stored
+
+    def _with_defaults(self, table: str, row: dict) -> dict:
+        stored = dict(row)
+        for column, factory in TABLE_DEFAULTS.get(table, {}).items():
+            if stored.get(column) is None:
+                stored[column] = factory()
+        return stored
+
+    # ---------- Розбір запиту ----------
+
+    @staticmethod
+    def _filters(params: List[Tuple[str, str]]) -> List[Callable[[dict], bool]]:
+        reserved = {"select", "order", "limit", "offset", "columns", "on_conflict"}
+        conditions = []
+        for key, value in params:
+            if key in reserved:
+                continue
+            if key == "or":
+                nested = [_condition(e) for e in _split_top_level(value.strip("()"))]
+                conditions.append(lambda row, nested=nested: any(c(row) for c in nested))
+            else:
+                conditions.append(_condition(f"{key}.{value}"))
+        return conditions
+
+    @staticmethod
+    def _project(rows: List[dict], select: Optional[str]) -> List[dict]:
+        if not select or select == "*":
+            return [dict(r) for r in rows]
+        columns = [c.strip() for c in select.split(",") if c.strip()]
+        return [{c: r.get(c) for c in columns} for r in rows]
+
+    @staticmethod
+    def _order(rows: List[dict], order: Optional[str]) -> List[dict]:
+        if not order:
+            return rows
+        # Стабільне сортування: застосовуємо ключі з кінця
+        for part in reversed(order.split(",")):
+            column, _, direction = part.partition(".")
+            desc = direction.startswith("desc")
+            present = [r for r in rows if r.get(column) is not None]
+            missing = [r for r in rows if r.get(column) is None]
+            present.sort(key=lambda r: r[column], reverse=desc)
+            rows = present + missing
+        return rows
+
+    def _foreign_key_error(self, table: str, item: dict) -> Optional[httpx.Response]:
+        for (source, column), (target, target_column) in FOREIGN_KEYS.items():
+            value = item.get(column)
+            if source != table or value is None:
+                continue
+            if not any(r.get(target_column) == value for r in self.tables.get(target, [])):
+                return httpx.Response(409, json=_error(
+                    "23503", f'insert or update on table "{table}" violates foreign key constraint on "{column}"'
+                ))
+        return None
+
+    # ---------- Обробник httpx.MockTransport ----------
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+        if "/rest/v1/" not in path:
+            return httpx.Response(404, json=_error(None, f"Невідомий шлях {path}"))
+        table = path.split("/rest/v1/", 1)[1].strip("/")
+        if table.startswith("rpc/"):
+            return self._call(table[len("rpc/"):], json.loads(request.content or b"{}"))
+        rows = self.tables.setdefault(table, [])
+
+        params = [(k, unquote(v)) for k, v in request.url.params.multi_items()]
+        query = dict(params)
+        prefer = request.headers.get("prefer", "")
+        single = "vnd.pgrst.object" in request.headers.get("accept", "")
+
+        try:
+            conditions = self._filters(params)
+            matches = [r for r in rows if all(c(r) for c in conditions)]
+
+            if request.method in ("GET", "HEAD"):
+                result = self._order(matches, query.get("order"))
+                total = len(result)
+                offset = int(query.get("offset", 0))
+                limit = int(query["limit"]) if "limit" in query else None
+                result = result[offset:offset + limit if limit is not None else None]
+                body = self._project(result, query.get("select"))
+                headers = {"content-range": f"{offset}-{offset + len(body) - 1}/{total if 'count=' in prefer else '*'}"}
+                if single:
+                    if len(body) != 1:
+                        return httpx.Response(406, json=_error("PGRST116", "JSON object requested, multiple (or no) rows returned"))
+                    return httpx.Response(200, json=body[0], headers=headers)
+                return httpx.Response(200, json=body, headers=headers)
+
+            payload = json.loads(request.content or b"null")
+
+            if request.method == "POST":
+                items = payload if isinstance(payload, list) else [payload]
+                keys = tuple(query["on_conflict"].split(",")) if "on_conflict" in query else TABLE_KEYS.get(table, ())
+                upsert = "resolution=" in prefer
+                written = []
+                # Як у Postgres: один поганий рядок відхиляє весь insert
+                for item in items:
+                    error = self._foreign_key_error(table, item)
+                    if error is not None:
+                        return error
+                for item in items:
+                    existing = None
+                    if upsert and keys and all(item.get(k) is not None for k in keys):
+                        existing = next((r for r in rows if all(r.get(k) == item[k] for k in keys)), None)
+                    if existing is not None:
+                        if "resolution=merge-duplicates" in prefer:
+                            existing.update(item)
+                            written.append(existing)
+                        continue
+                    if not upsert and keys and all(item.get(k) is not None for k in keys) and \
+                            any(all(r.get(k) == item[k] for k in keys) for r in rows):
+                        return httpx.Response(409, json=_error("23505", "duplicate key value violates unique constraint"))
+                    stored = self._with_defaults(table, item)
+                    rows.append(stored)
+                    written.append(stored)
+                return self._written(written, prefer, 201)
+
+            if request.method == "PATCH":
+                error = self._foreign_key_error(table, payload or {})
+                if error is not None:
+                    return error
+                for row in matches:
+                    row.update(payload or {})
+                return self._written(matches, prefer, 200)
+
+            if request.method == "DELETE":
+                ids = {id(r) for r in matches}
+                self.tables[table] = [r for r in rows if id(r) not in ids]
+                return self._written(matches, prefer, 200)
+        except (ValueError, KeyError) as e:
+            return httpx.Response(400, json=_error("PGRST100", str(e)))
+
+        return httpx.Response(405, json=_error(None, f"Метод {request.method} не підтримується"))
+
+    def _call(self, name: str, params: dict) -> httpx.Response:
+        function = self.functions.get(name)
+        if function is None:
+            return httpx.Response(404, json=_error("PGRST202", f"Could not find the function public.{name}"))
+        return httpx.Response(200, json=function(self.tables, params))
+
+    def _written(self, rows: List[dict], prefer: str, status: int) -> httpx.Response:
+        if "return=representation" in prefer:
+            return httpx.Response(status, json=[dict(r) for r in rows])
+        return httpx.Response(204 if status == 200 else status)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
@@ -0,0 +1,106 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Бюджет часу імпорту main (мс): його платить кожен новий воркер під час автомасштабування
+DEFAULT_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "600"))
+
+# Модулі, які не мають завантажуватись під час імпорту застосунку —
+# клієнти сховища створюються ліниво (core/database.py)
+LAZY_MODULES = ("supabase", "postgrest", "supabase_auth", "realtime", "storage3", "supabase_functions", "asyncpg")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import sys, time\n"
+    "started = time.perf_counter()\n"
+    "import main\n"
+    "elapsed = (time.perf_counter() - started) * 1000\n"
+    "loaded = [m for m in {lazy!r} if m in sys.modules]\n"
+    "print(f'{{elapsed:.3f}}|{{\",\".join(loaded)}}')\n"
+)
+
+
+def _probe_env() -> Dict[str, str]:
+    # Без ключів Supabase і зовнішніх сховищ: імпорт не повинен їх вимагати
+    env = dict(os.environ)
+    env.pop("SUPABASE_URL", None)
+    env.pop("SUPABASE_KEY", None)
+    env.setdefault("ROLLUP_STORE_PATH", ":memory:")
+    env.setdefault("NBU_RATE_CACHE_PATH", ":memory:")
+    env["PYTHONPATH"] = BACKEND_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def measure_once() -> Tuple[float, List[str]]:
+    """Імпорт main у новому інтерпретаторі (як холодний старт воркера)."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(lazy=LAZY_MODULES)],
+        cwd=BACKEND_DIR, env=_probe_env(), capture_output=True, text=True, check=True,
+    )
+    elapsed, loaded = result.stdout.strip().splitlines()[-1].split("|")
+    return float(elapsed), [m for m in loaded.split(",") if m]
+
+
+def top_modules(limit: int) -> List[Tuple[int, str]]:
+    """Найдорожчі модулі за кумулятивним часом (python -X importtime)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, env=_probe_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Час імпорту main.py (холодний старт воркера) і бюджет на нього")
+    parser.add_argument("--runs", type=int, default=5, help="Скільки разів імпортувати (береться медіана)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Допустима медіана, мс")
+    parser.add_argument("--top", type=int, default=15, help="Показати N найдорожчих модулів")
+    args = parser.parse_args()
+
+    # Перший запуск лише компілює .pyc — у замір не входить
+    try:
+        measure_once()
+    except subprocess.CalledProcessError as e:
+        print("❌ import main завершився помилкою (без ключів Supabase імпорт має проходити):")
+        print(e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e)
+        sys.exit(1)
+    samples = []
+    loaded_lazy: List[str] = []
+    for _ in range(args.runs):
+        elapsed, loaded = measure_once()
+        samples.append(elapsed)
+        loaded_lazy = loaded_lazy or loaded
+
+    if args.top:
+        print(f"{'cumulative, ms':>14}  module")
+        for cumulative, name in top_modules(args.top):
+            print(f"{cumulative / 1000:>14.1f}  {name}")
+        print()
+
+    median = statistics.median(samples)
+    print(f"import main: median {median:.0f} ms, min {min(samples):.0f} ms, max {max(samples):.0f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if loaded_lazy:
+        print(f"❌ Під час імпорту завантажено модулі, що мають бути ліниві: {', '.join(loaded_lazy)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"❌ Перевищено бюджет часу імпорту на {median - args.budget_ms:.0f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("✅ У межах бюджету")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Бенчмарки не ходять ні в Supabase, ні в НБУ: до імпорту застосунку
+# підставляємо фіктивні ключі і локальні сховища в пам'яті.
+os.environ.setdefault("SUPABASE_URL", "http://benchmark.supabase.local")
+os.environ.setdefault("SUPABASE_KEY", "benchmark-key")
+os.environ.setdefault("ROLLUP_STORE_PATH", ":memory:")
+os.environ.setdefault("NBU_RATE_CACHE_PATH", ":memory:")
+os.environ["NBU_WARMUP_DAYS"] = "0"
+
+import httpx
+from supabase import acreate_client, AsyncClientOptions
+
+from benchmarks.fake_postgrest import FakePostgrest
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE_PATH = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+# (назва, метод, шлях, тіло запиту або None)
+Scenario = Tuple[str, str, Callable[[random.Random], str], Optional[Callable[[random.Random], dict]]]
+
+
+def seed_data(fake: FakePostgrest, transactions: int) -> List[str]:
+    """Профіль, налаштування, категорії і журнал з `transactions` рядків за ~3 роки."""
+    rng = random.Random(42)
+    fake.seed("profiles", [{"id": USER_ID, "full_name": "Тест Бенчмарк", "is_fop": True}])
+    fake.seed("fop_settings", [{
+        "user_id": USER_ID, "fop_group": 3, "income_tax_percent": 5.0, "military_tax_percent": 1,
+        "esv_value": 1760.0, "is_zed": False, "tax_system": "simplified", "activity_type": "services",
+        "reporting_period": "quarter", "has_employees": False, "employees_count": 0, "is_vat_payer": False
+    }])
+    system = fake.seed("categories", [
+        {"user_id": None, "name": f"Системна {i}", "type": "income" if i % 2 else "expense", "is_fop_only": i % 3 == 0}
+        for i in range(12)
+    ])
+    own = fake.seed("categories", [
+        {"user_id": USER_ID, "name": f"Власна {i}", "type": "expense", "is_fop_only": False} for i in range(5)
+    ])
+    category_ids = [c["id"] for c in system + own]
+
+    start = date.today() - timedelta(days=3 * 365)
+    rows = fake.seed("transactions", [
+        {
+            "user_id": USER_ID,
+            "category_id": rng.choice(category_ids),
+            "transaction_type": rng.choice(("income", "expense")),
+            "transaction_amount": round(rng.uniform(100, 5000), 2),
+            "transaction_date": (start + timedelta(days=rng.randrange(3 * 365))).isoformat(),
+            "notes": f"Операція {i}",
+            "is_foreign_currency": False,
+            "currency_code": "UAH",
+            "amount_original": None,
+            "exchange_rate": 1.0,
+        }
+        for i in range(transactions)
+    ])
+    return [r["transaction_id"] for r in rows]
+
+
+def build_scenarios(transaction_ids: List[str]) -> List[Scenario]:
+    user = f"user_id={USER_ID}"
+    return [
+        ("GET /transactions (offset)", "GET", lambda r: f"/transactions/?{user}&limit=50&offset={r.randrange(0, 500, 50)}", None),
+        ("GET /transactions (cursor)", "GET", lambda r: f"/transactions/?{user}&limit=50&pagination=cursor", None),
+        ("POST /transactions", "POST", lambda r: "/transactions/", lambda r: {
+            "user_id": USER_ID, "type": "expense", "amount": round(r.uniform(10, 1000), 2),
+            "currency": "UAH", "date": date.today().isoformat(), "description": "benchmark"
+        }),
+        ("PATCH /transactions/{id}", "PATCH", lambda r: f"/transactions/{r.choice(transaction_ids)}?{user}", lambda r: {"description": f"patched {r.random():.6f}"}),
+        ("GET /transactions/summary", "GET", lambda r: f"/transactions/summary?{user}", None),
+        ("GET /categories", "GET", lambda r: f"/categories/?{user}", None),
+        ("GET /tax/calculate", "GET", lambda r: f"/tax/calculate?{user}&annual_income={r.randrange(100000, 5000000)}", None),
+        ("GET /tax/calculate (ledger)", "GET", lambda r: f"/tax/calculate?{user}&source=ledger", None),
+        ("GET /settings/{user_id}", "GET", lambda r: f"/settings/{USER_ID}", None),
+        ("PATCH /settings/{user_id}", "PATCH", lambda r: f"/settings/{USER_ID}", lambda r: {"income_tax_percent": r.choice((3.0, 5.0))}),
+        ("GET /profile/{user_id}", "GET", lambda r: f"/profile/{USER_ID}", None),
+        ("PATCH /profile/{user_id}", "PATCH", lambda r: f"/profile/{USER_ID}", lambda r: {"full_name": r.choice(("Тест Бенчмарк", "Бенчмарк Тест"))}),
+        ("GET /dashboard", "GET", lambda r: f"/dashboard?user_id={USER_ID}", None),
+    ]
+
+
+def percentile(sorted_values: List[float], share: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(share * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class ScenarioRunner:
+    """Запити одного сценарію: власний генератор параметрів і лічильник помилок на всі прогони."""
+
+    def __init__(self, client: httpx.AsyncClient, scenario: Scenario):
+        self.client = client
+        self.name, self.method, self.path, self.body = scenario
+        self.rng = random.Random(self.name)
+        self.errors = 0
+        self.runs: List[Dict] = []
+
+    async def one(self) -> float:
+        url = self.path(self.rng)
+        payload = self.body(self.rng) if self.body else None
+        started = time.perf_counter()
+        response = await self.client.request(self.method, url, json=payload)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            self.errors += 1
+        return elapsed * 1000
+
+    async def warmup(self, requests: int) -> None:
+        for _ in range(requests):
+            await self.one()
+
+    async def run(self, requests: int, concurrency: int) -> None:
+        latencies: List[float] = []
+        queue = iter(range(requests))
+
+        async def worker() -> None:
+            for _ in queue:
+                latencies.append(await self.one())
+
+        gc.collect()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+        latencies.sort()
+        self.runs.append({
+            "throughput_rps": requests / wall if wall else 0.0,
+            "mean_ms": statistics.fmean(latencies),
+            "p50_ms": percentile(latencies, 0.50),
+            "p90_ms": percentile(latencies, 0.90),
+            "p99_ms": percentile(latencies, 0.99),
+            "max_ms": latencies[-1],
+        })
+
+    def result(self, requests: int) -> Dict:
+        """Кожна метрика — медіана по прогонах: один невдалий прогін (GC, сусідній процес) не зсуває результат."""
+        result = {"requests": requests, "repeats": len(self.runs), "errors": self.errors}
+        for metric in ("throughput_rps", "mean_ms", "p50_ms", "p90_ms", "p99_ms"):
+            result[metric] = round(statistics.median(run[metric] for run in self.runs), 1 if metric == "throughput_rps" else 3)
+        result["max_ms"] = round(max(run["max_ms"] for run in self.runs), 3)
+        # Розкид p50 між прогонами: якщо він співмірний з порогом регресії, результату не варто вірити
+        result["p50_runs_ms"] = [round(run["p50_ms"], 3) for run in self.runs]
+        return result
+
+
+async def run_benchmarks(args) -> Dict:
+    fake = FakePostgrest(latency=args.latency_ms / 1000.0)
+    transaction_ids = seed_data(fake, args.transactions)
+
+    # Підміняємо клієнт Supabase до першого звернення: get_db() поверне вже готовий
+    import core.database as database
+    from core.metrics import DependencyTransport
+    database._client = await acreate_client(
+        database.url, database.key,
+        options=AsyncClientOptions(httpx_client=httpx.AsyncClient(
+            transport=DependencyTransport("supabase", fake.transport())
+        ))
+    )
+
+    from main import app
+
+    scenarios = build_scenarios(transaction_ids)
+    if args.only:
+        scenarios = [s for s in scenarios if any(part.lower() in s[0].lower() for part in args.only)]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        runners = [ScenarioRunner(client, scenario) for scenario in scenarios]
+        for runner in runners:
+            await runner.warmup(args.warmup)
+        # Прогони йдуть по колу через усі сценарії: повільніший період машини
+        # зачіпає по одному прогону кожного сценарію, а не всі прогони одного
+        for _ in range(args.repeats):
+            for runner in runners:
+                await runner.run(args.requests, args.concurrency)
+        results = {runner.name: runner.result(args.requests) for runner in runners}
+
+    await database.close_db()
+    return {
+        "config": {
+            "transactions": args.transactions,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "repeats": args.repeats,
+            "latency_ms": args.latency_ms,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+
+
+# Поля конфігурації, які мають збігатися з базовими, щоб порівняння мало сенс
+COMPARABLE_CONFIG = ("transactions", "concurrency", "latency_ms")
+
+
+def print_report(report: Dict, baseline: Optional[Dict]) -> Dict[str, float]:
+    """Друкує таблицю; повертає відносну зміну p50 до базового результату по кожному сценарію."""
+    header = f"{'scenario':<32}{'rps':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}{'spread':>9}{'err':>6}"
+    if baseline:
+        header += f"{'p50 vs base':>14}"
+    print(header)
+    print("-" * len(header))
+
+    base_results = (baseline or {}).get("results", {})
+    deltas = {}
+    for name, r in report["results"].items():
+        runs = r["p50_runs_ms"]
+        spread = (max(runs) - min(runs)) / r["p50_ms"] if r["p50_ms"] else 0.0
+        line = f"{name:<32}{r['throughput_rps']:>10}{r['p50_ms']:>10}{r['p90_ms']:>10}{r['p99_ms']:>10}{r['max_ms']:>10}{spread:>9.0%}{r['errors']:>6}"
+        base = base_results.get(name)
+        if base and base.get("p50_ms"):
+            deltas[name] = (r["p50_ms"] - base["p50_ms"]) / base["p50_ms"]
+            line += f"{deltas[name]:>+13.1%}"
+        print(line)
+    return deltas
+
+
+def main() -> None:
+    # Запуск з папки backend:
+    #   python -m benchmarks.run                      — звіт + порівняння з benchmarks/baseline.json
+    #   python -m benchmarks.run --save-baseline      — оновити базові результати
+    #   python -m benchmarks.run --only summary tax   — лише частина сценаріїв
+    #   python -m benchmarks.run --max-regression 0.25 — код виходу 1 при регресії p50
+    # Поріг перевіряється тільки з --concurrency 1 (за замовчуванням): при кількох
+    # одночасних клієнтах в одному event loop p50 міряє чергу задач, а не обробник.
+    parser = argparse.ArgumentParser(description="Бенчмарк ендпоінтів з локальною заміною Supabase")
+    parser.add_argument("--requests", type=int, default=100, help="Запитів на сценарій в одному прогоні")
+    parser.add_argument("--repeats", type=int, default=7, help="Прогонів на сценарій (метрики — медіана по прогонах)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Одночасних клієнтів (для порогу регресії — лише 1)")
+    parser.add_argument("--warmup", type=int, default=20, help="Прогрівальних запитів (не враховуються)")
+    parser.add_argument("--transactions", type=int, default=5000, help="Рядків у журналі тестового користувача")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Штучна затримка кожного запиту до бази")
+    parser.add_argument("--only", nargs="*", help="Фільтр сценаріїв за частиною назви")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Файл базових результатів")
+    parser.add_argument("--save-baseline", action="store_true", help="Записати результати як базові")
+    parser.add_argument("--output", help="Записати звіт у JSON-файл")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="Код виходу 1, якщо медіанний p50 гірший за базовий більше ніж на цю частку (напр. 0.25)")
+    args = parser.parse_args()
+
+    if args.max_regression is not None and args.concurrency != 1:
+        parser.error("--max-regression порівнює час обслуговування запиту і потребує --concurrency 1")
+
+    report = asyncio.run(run_benchmarks(args))
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        mismatched = [key for key in COMPARABLE_CONFIG if baseline.get("config", {}).get(key) != report["config"][key]]
+        if mismatched:
+            print(f"Базові результати записані з іншими параметрами ({', '.join(mismatched)}) — порівняння пропущено")
+            baseline = None
+
+    deltas = print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"Базові результати записано в {args.baseline}")
+
+    if args.max_regression is not None:
+        if baseline is None and not args.save_baseline:
+            print("Немає порівнянних базових результатів — поріг регресії не перевірено")
+            sys.exit(1)
+        regressed = [name for name, delta in deltas.items() if delta > args.max_regression]
+        if regressed:
+            print(f"Регресія p50 понад {args.max_regression:.0%}: {', '.join(regressed)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
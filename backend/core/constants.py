@@ -19,6 +19,8 @@ MAX_ESV_VALUE = 160000.0
 MIN_ESV_VALUE = 1760.0
 
 # 2025 TAX RULES & CONSTANTS
+# Розрахунки беруть ставки з core/tax_rules.py (набори правил за датою набуття чинності);
+# ці значення — джерело для набору 2025 року.
 MIN_WAGE = 8000.0
 ESV_RATE = 0.22
 MIN_ESV = 1760.0 
@@ -1,13 +1,93 @@
+import asyncio
 import os
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Optional
+
+import httpx
 from dotenv import load_dotenv
+from core.sql_storage import DuplicateKeyError, InvalidRowError, SqlStorage, create_storage, is_invalid_row_code
+from core.metrics import DependencyTransport
+
+if TYPE_CHECKING:
+    # SDK Supabase (auth, storage, realtime, functions) важкий — імпортуємо лише при першому зверненні
+    from supabase import AsyncClient
 
 load_dotenv()
 
+# Де зберігаються дані: 'supabase' (PostgREST, за замовчуванням),
+# 'sqlite' (один вузол) або 'postgres' (пряме SQL-з'єднання, DATABASE_URL)
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "supabase").lower()
+if STORAGE_BACKEND not in ("supabase", "sqlite", "postgres"):
+    raise ValueError(f"Помилка: невідомий STORAGE_BACKEND={STORAGE_BACKEND} (supabase | sqlite | postgres)")
+
 url: str = os.environ.get("SUPABASE_URL")
 key: str = os.environ.get("SUPABASE_KEY")
 
-if not url or not key:
-    raise ValueError("Помилка: Немає ключів Supabase у .env. Перевір файл!")
+# Пул HTTP-з'єднань до PostgREST (спільний для всіх запитів процесу)
+SUPABASE_MAX_CONNECTIONS = int(os.environ.get("SUPABASE_MAX_CONNECTIONS", "100"))
+SUPABASE_MAX_KEEPALIVE = int(os.environ.get("SUPABASE_MAX_KEEPALIVE", "20"))
+SUPABASE_TIMEOUT = float(os.environ.get("SUPABASE_TIMEOUT", "10"))
+
+_client: Optional["AsyncClient"] = None
+_client_lock = asyncio.Lock()
+_storage: Optional[SqlStorage] = None
+
+async def get_db() -> "AsyncClient":
+    """
+    Асинхронний клієнт Supabase (один на процес).
+    Створюється при першому зверненні з налаштованим пулом з'єднань і HTTP/2;
+    тоді ж імпортується SDK і перевіряються ключі.
+    """
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                if not url or not key:
+                    raise ValueError("Помилка: Немає ключів Supabase у .env. Перевір файл!")
+                from supabase import acreate_client, AsyncClientOptions
+
+                # Пул з'єднань і HTTP/2 задаються транспорту, який ще й заміряє кожен виклик
+                http_client = httpx.AsyncClient(
+                    timeout=SUPABASE_TIMEOUT,
+                    follow_redirects=True,
+                    transport=DependencyTransport(
+                        "supabase",
+                        limits=httpx.Limits(
+                            max_connections=SUPABASE_MAX_CONNECTIONS,
+                            max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+                        ),
+                        http2=True,
+                    ),
+                )
+                _client = await acreate_client(url, key, options=AsyncClientOptions(httpx_client=http_client))
+    return _client
+
+def use_sql_storage() -> bool:
+    return STORAGE_BACKEND != "supabase"
+
+def get_storage() -> SqlStorage:
+    """SQL-сховище (STORAGE_BACKEND=sqlite | postgres), одне на процес."""
+    global _storage
+    if _storage is None:
+        _storage = create_storage(STORAGE_BACKEND)
+    return _storage
+
+async def warmup_db() -> None:
+    """
+    Створює клієнт і відкриває перше з'єднання до сховища (дешевий запит),
+    щоб перший запит користувача не платив за імпорт SDK, TLS і пул.
+    """
+    if use_sql_storage():
+        await get_storage().fetch("SELECT 1")
+    else:
+        db = await get_db()
+        await db.table("profiles").select("id").limit(1).execute()
 
-supabase: Client = create_client(url, key)
\ No newline at end of file
+async def close_db() -> None:
+    """Закриває пул з'єднань (викликається при зупинці сервера)."""
+    global _client, _storage
+    if _client is not None:
+        await _client.options.httpx_client.aclose()
+        _client = None
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
@@ -0,0 +1,233 @@
+import asyncio
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi.routing import APIRoute
+
+# METRICS_SERVER_TIMING=1 — додавати заголовок Server-Timing до кожної відповіді
+SERVER_TIMING_ENABLED = os.environ.get("METRICS_SERVER_TIMING", "0").lower() in ("1", "true", "yes")
+
+# Межі кошиків гістограм (секунди): від 1 мс до 10 с
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Гістограма у форматі Prometheus (кумулятивні кошики + _sum + _count) з довільними мітками."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # мітки -> [лічильники кошиків..., +Inf], сума
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(labels, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._series.items())
+        for labels, (counts, total) in series:
+            base = [f'{n}="{_escape(v)}"' for n, v in zip(self.label_names, labels)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                bucket_labels = ",".join(base + ['le="' + le + '"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            label_str = "{" + ",".join(base) + "}" if base else ""
+            lines.append(f"{self.name}_sum{label_str} {total:.6f}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            label_str = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(self.label_names, labels))
+            lines.append(f"{self.name}{{{label_str}}} {value:g}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Тривалість HTTP-запитів по маршрутах", ("method", "route", "status")
+)
+dependency_duration = Histogram(
+    "dependency_call_duration_seconds", "Тривалість викликів залежностей (Supabase, SQL, НБУ)",
+    ("dependency", "operation", "outcome")
+)
+dependency_errors = Counter(
+    "dependency_call_errors_total", "Помилки викликів залежностей", ("dependency", "operation", "outcome")
+)
+section_duration = Histogram(
+    "app_section_duration_seconds", "Тривалість частин обробки запиту (хендлер, агрегація тощо)", ("route", "section")
+)
+
+
+# ---------- Таймінги в межах одного запиту ----------
+
+# назва -> [кількість, сумарний час у секундах]; ділиться з задачами, створеними під час запиту
+_request_timings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar("request_timings", default=None)
+_request_route: ContextVar[str] = ContextVar("request_route", default="")
+
+
+def start_request() -> Dict[str, List[float]]:
+    timings: Dict[str, List[float]] = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def _add_to_request(name: str, seconds: float) -> None:
+    timings = _request_timings.get()
+    if timings is not None:
+        entry = timings.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+
+# Результат виклику залежності (мітка outcome)
+OUTCOME_OK = "ok"
+OUTCOME_HTTP_ERROR = "http_error"   # відповідь отримано, але зі статусом >= 400
+OUTCOME_ERROR = "error"             # виняток: таймаут, обрив з'єднання, помилка бази
+OUTCOME_CANCELLED = "cancelled"     # виклик скасовано (напр. клієнт закрив з'єднання)
+
+
+def record_dependency(dependency: str, operation: str, seconds: float, outcome: str = OUTCOME_OK) -> None:
+    dependency_duration.observe(seconds, dependency, operation, outcome)
+    if outcome != OUTCOME_OK:
+        dependency_errors.inc(dependency, operation, outcome)
+    _add_to_request(dependency, seconds)
+
+
+@contextmanager
+def timed(section: str):
+    """Заміряє частину обробки запиту: with timed("rollup"): ..."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        section_duration.observe(elapsed, _request_route.get() or "-", section)
+        _add_to_request(section, elapsed)
+
+
+class DependencyTransport(httpx.AsyncBaseTransport):
+    """
+    Транспорт httpx, що заміряє кожен HTTP-виклик залежності цілком — від відправки
+    до кінця читання тіла — і записує результат: ok / http_error / error / cancelled.
+    На відміну від хуків відповіді, бачить і виклики, що завершились винятком (таймаут, обрив).
+    Операція — метод і останній сегмент шляху (для PostgREST це таблиця).
+    """
+
+    def __init__(self, dependency: str, transport: Optional[httpx.AsyncBaseTransport] = None, **transport_kwargs):
+        self.dependency = dependency
+        self._transport = transport or httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        operation = f"{request.method} {request.url.path.rstrip('/').rsplit('/', 1)[-1]}"
+        started = time.perf_counter()
+        outcome = OUTCOME_ERROR
+        try:
+            response = await self._transport.handle_async_request(request)
+            try:
+                await response.aread()
+            except BaseException:
+                await response.aclose()
+                raise
+            outcome = OUTCOME_HTTP_ERROR if response.status_code >= 400 else OUTCOME_OK
+            return response
+        except asyncio.CancelledError:
+            outcome = OUTCOME_CANCELLED
+            raise
+        finally:
+            record_dependency(self.dependency, operation, time.perf_counter() - started, outcome)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def server_timing(timings: Dict[str, List[float]], total: float) -> str:
+    """
+    Заголовок Server-Timing: total, час кожної залежності / секції і залишок поза хендлером
+    (валідація параметрів і серіалізація відповіді).
+    """
+    parts = [f"total;dur={total * 1000:.2f}"]
+    for name, (count, seconds) in timings.items():
+        parts.append(f'{name};dur={seconds * 1000:.2f};desc="{int(count)}x"')
+    handler = timings.get("handler")
+    if handler:
+        parts.append(f'serialize;dur={max(total - handler[1], 0.0) * 1000:.2f};desc="params, response, middleware"')
+    return ", ".join(parts)
+
+
+class TimedRoute(APIRoute):
+    """
+    Маршрут, що окремо заміряє виконання хендлера (секція "handler").
+    Різниця між total і handler — розбір параметрів і серіалізація відповіді.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint, kwargs.get("name") or endpoint.__name__), **kwargs)
+
+
+def _timed_endpoint(endpoint: Callable, route_name: str) -> Callable:
+    # include_router створює маршрут заново з уже обгорнутим endpoint — не обгортаємо вдруге
+    if getattr(endpoint, "__metrics_timed__", False):
+        return endpoint
+
+    # Мітка секцій — ім'я хендлера (шаблон шляху з префіксом роутера тут ще невідомий)
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            _request_route.set(route_name)
+            with timed("handler"):
+                return await endpoint(*args, **kwargs)
+        async_wrapper.__metrics_timed__ = True
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        _request_route.set(route_name)
+        with timed("handler"):
+            return endpoint(*args, **kwargs)
+    sync_wrapper.__metrics_timed__ = True
+    return sync_wrapper
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in (request_duration, dependency_duration, dependency_errors, section_duration):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,487 @@
+import asyncio
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from core.metrics import OUTCOME_CANCELLED, OUTCOME_ERROR, OUTCOME_OK, record_dependency
+
+# Схема таблиць для прямого SQL (без PostgREST) — ті самі таблиці й типи колонок, що в Supabase:
+# у Postgres — UUID, DATE, TIMESTAMPTZ, NUMERIC (STORAGE_BACKEND=postgres може працювати з тією ж базою).
+# SQLite таких типів не має: дати й мітки часу там — ISO-рядки (як їх повертає PostgREST,
+# лексикографічний порядок збігається з хронологічним), гроші — REAL.
+# Типи: "uuid", "text", "date", "timestamp", "numeric", "int", "bool".
+TABLES: Dict[str, Dict[str, str]] = {
+    "transactions": {
+        "transaction_id": "uuid",
+        "user_id": "uuid",
+        "category_id": "uuid",
+        "transaction_type": "text",
+        "transaction_amount": "numeric",
+        "transaction_date": "date",
+        "notes": "text",
+        "is_foreign_currency": "bool",
+        "currency_code": "text",
+        "amount_original": "numeric",
+        "exchange_rate": "numeric",
+        "created_at": "timestamp",
+    },
+    "categories": {
+        "id": "uuid",
+        "user_id": "uuid",
+        "name": "text",
+        "type": "text",
+        "is_fop_only": "bool",
+        "created_at": "timestamp",
+    },
+    "profiles": {
+        "id": "uuid",
+        "full_name": "text",
+        "is_fop": "bool",
+        "created_at": "timestamp",
+    },
+    "fop_settings": {
+        "setting_id": "uuid",
+        "user_id": "uuid",
+        "fop_group": "int",
+        "is_zed": "bool",
+        "income_tax_percent": "numeric",
+        "esv_value": "numeric",
+        "military_tax_percent": "numeric",
+        "tax_system": "text",
+        "activity_type": "text",
+        "reporting_period": "text",
+        "has_employees": "bool",
+        "employees_count": "int",
+        "is_vat_payer": "bool",
+        "land_area_ha": "numeric",
+        "normative_land_value": "numeric",
+        "created_at": "timestamp",
+    },
+}
+
+PRIMARY_KEYS = {
+    "transactions": "transaction_id",
+    "categories": "id",
+    "profiles": "id",
+    "fop_settings": "setting_id",
+}
+
+# Значення, які в Supabase проставляє сама база (uuid, now())
+_DEFAULTS = {
+    "transactions": {"transaction_id": lambda: str(uuid.uuid4()), "created_at": lambda: _now()},
+    "categories": {"id": lambda: str(uuid.uuid4()), "is_fop_only": lambda: False, "created_at": lambda: _now()},
+    "profiles": {"is_fop": lambda: True, "created_at": lambda: _now()},
+    "fop_settings": {"setting_id": lambda: str(uuid.uuid4()), "created_at": lambda: _now()},
+}
+
+# Журнал читається сторінками по (user_id, transaction_date) — головний індекс
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_transactions_user_date ON transactions (user_id, transaction_date DESC, created_at DESC, transaction_id DESC)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_fop_settings_user ON fop_settings (user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_categories_user ON categories (user_id)",
+]
+
+_SQL_TYPES = {
+    "sqlite": {
+        "uuid": "TEXT", "text": "TEXT", "date": "TEXT", "timestamp": "TEXT",
+        "numeric": "REAL", "int": "INTEGER", "bool": "INTEGER",
+    },
+    "postgres": {
+        "uuid": "UUID", "text": "TEXT", "date": "DATE", "timestamp": "TIMESTAMPTZ",
+        "numeric": "NUMERIC", "int": "INTEGER", "bool": "BOOLEAN",
+    },
+}
+
+_BOOL_COLUMNS = {c for columns in TABLES.values() for c, t in columns.items() if t == "bool"}
+
+# Скільки різних текстів запитів пам'ятає PostgresStorage (IN-списки різної довжини — різні тексти)
+PARAM_TYPES_CACHE_SIZE = int(os.environ.get("POSTGRES_PARAM_TYPES_CACHE", "1024"))
+
+DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "fop.sqlite3")
+
+
+_TABLE_RE = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+(\w+)", re.IGNORECASE)
+
+class InvalidRowError(Exception):
+    """
+    База відхилила рядок через його дані: порушене обмеження (Postgres 23xxx — зовнішній ключ,
+    NOT NULL, CHECK) або некоректне значення (22xxx). Повтор того самого запиту не допоможе.
+    """
+
+
+class DuplicateKeyError(InvalidRowError):
+    """Порушено унікальність ключа (Postgres 23505 / SQLite UNIQUE constraint)."""
+
+
+def is_invalid_row_code(code: Optional[str]) -> bool:
+    """Код SQLSTATE помилки даних рядка (класи 22 і 23)."""
+    return bool(code) and str(code)[:2] in ("22", "23")
+
+
+def _operation(sql: str) -> str:
+    """'SELECT * FROM transactions ...' -> 'SELECT transactions' (мітка для метрик)."""
+    table = _TABLE_RE.search(sql)
+    return f"{sql.split(None, 1)[0].upper()} {table.group(1) if table else ''}".strip()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def schema_statements(dialect: str) -> List[str]:
+    types = _SQL_TYPES[dialect]
+    statements = []
+    for table, columns in TABLES.items():
+        definitions = [
+            f"{name} {types[kind]}" + (" PRIMARY KEY" if name == PRIMARY_KEYS[table] else "")
+            for name, kind in columns.items()
+        ]
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})")
+    return statements + INDEXES
+
+
+def select_columns(table: str, columns: str = "*") -> str:
+    """'transaction_id, transaction_amount' -> перевірений список колонок для SELECT / RETURNING."""
+    if columns.strip() == "*":
+        return "*"
+    names = [c.strip() for c in columns.split(",") if c.strip()]
+    unknown = [c for c in names if c not in TABLES[table]]
+    if unknown:
+        raise ValueError(f"Невідомі колонки {table}: {', '.join(unknown)}")
+    return ", ".join(names)
+
+
+def _db_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _pg_param(type_name: str, value: Any) -> Any:
+    """
+    Параметр запиту (ISO-рядок, float) -> тип, якого asyncpg чекає для колонки:
+    рядки дат не приводяться до DATE / TIMESTAMPTZ самі, а гроші йдуть у NUMERIC без похибки float.
+    """
+    if value is None or not isinstance(value, (str, float)):
+        return value
+    if type_name == "date" and isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if type_name == "timestamptz" and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if type_name == "uuid" and isinstance(value, str):
+        return uuid.UUID(value)
+    if type_name == "numeric":
+        return Decimal(str(value))
+    return value
+
+
+def _api_value(column: str, value: Any) -> Any:
+    """Значення з бази -> як його повернув би PostgREST (JSON-типи)."""
+    if value is None:
+        return None
+    if column in _BOOL_COLUMNS:
+        return bool(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+class SqlStorage(ABC):
+    """
+    Спільна частина SQL-сховищ. Запити пишуться з плейсхолдерами '?',
+    Postgres-реалізація перетворює їх на $1, $2, ...
+    Підкласи виконують запит у _execute і перекладають помилки драйвера
+    в DuplicateKeyError / InvalidRowError; метрики і решта API — тут.
+    """
+    dialect = "sqlite"
+
+    @abstractmethod
+    async def _execute(self, sql: str, params: List[Any]) -> List[dict]:
+        """Виконує один запит і повертає рядки як словники (значення — як у PostgREST)."""
+
+    async def fetch(self, sql: str, params: Sequence[Any] = ()) -> List[dict]:
+        started = time.perf_counter()
+        outcome = OUTCOME_ERROR
+        try:
+            rows = await self._execute(sql, [_db_value(p) for p in params])
+            outcome = OUTCOME_OK
+            return rows
+        except asyncio.CancelledError:
+            outcome = OUTCOME_CANCELLED
+            raise
+        finally:
+            record_dependency("sql", _operation(sql), time.perf_counter() - started, outcome)
+
+    def month_of(self, column: str) -> str:
+        """SQL-вираз 'YYYY-MM' для колонки дати."""
+        return f"substr({column}, 1, 7)"
+
+    async def close(self) -> None:
+        pass
+
+    async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[dict]:
+        rows = await self.fetch(sql, params)
+        return rows[0] if rows else None
+
+    async def insert(self, table: str, data: Union[dict, List[dict]], returning: str = "*") -> List[dict]:
+        """Вставка одного рядка або пачки одним INSERT ... RETURNING."""
+        rows = data if isinstance(data, list) else [data]
+        if not rows:
+            return []
+
+        prepared = []
+        for row in rows:
+            unknown = [c for c in row if c not in TABLES[table]]
+            if unknown:
+                raise ValueError(f"Невідомі колонки {table}: {', '.join(unknown)}")
+            full = dict(row)
+            for column, factory in _DEFAULTS[table].items():
+                if full.get(column) is None:
+                    full[column] = factory()
+            prepared.append(full)
+
+        columns = list(dict.fromkeys(c for row in prepared for c in row))
+        placeholders = ", ".join(["(" + ", ".join("?" * len(columns)) + ")"] * len(prepared))
+        params = [_db_value(row.get(c)) for row in prepared for c in columns]
+        return await self.fetch(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {placeholders} RETURNING {select_columns(table, returning)}",
+            params,
+        )
+
+    async def update(self, table: str, data: dict, where: Dict[str, Any], returning: str = "*") -> List[dict]:
+        """UPDATE ... WHERE col = ? AND ... RETURNING — один запит замість читання і запису."""
+        unknown = [c for c in list(data) + list(where) if c not in TABLES[table]]
+        if unknown:
+            raise ValueError(f"Невідомі колонки {table}: {', '.join(unknown)}")
+        if not data:
+            return await self.fetch(
+                f"SELECT {select_columns(table, returning)} FROM {table} WHERE {self._where(where)}",
+                [_db_value(v) for v in where.values()],
+            )
+        assignments = ", ".join(f"{c} = ?" for c in data)
+        return await self.fetch(
+            f"UPDATE {table} SET {assignments} WHERE {self._where(where)} RETURNING {select_columns(table, returning)}",
+            [_db_value(v) for v in data.values()] + [_db_value(v) for v in where.values()],
+        )
+
+    async def upsert(self, table: str, data: dict, conflict: Sequence[str], returning: str = "*") -> List[dict]:
+        """
+        INSERT ... ON CONFLICT (...) DO UPDATE ... RETURNING — створення або оновлення одним запитом.
+        Оновлюються лише передані колонки; однаковий синтаксис у SQLite (3.35+) і Postgres.
+        """
+        unknown = [c for c in list(data) + list(conflict) if c not in TABLES[table]]
+        if unknown:
+            raise ValueError(f"Невідомі колонки {table}: {', '.join(unknown)}")
+        full = dict(data)
+        for column, factory in _DEFAULTS[table].items():
+            if full.get(column) is None:
+                full[column] = factory()
+        columns = list(full)
+        # Ключові колонки не перезаписуємо; якщо більше нічого немає — "порожнє" оновлення, щоб RETURNING повернув рядок
+        assignments = [f"{c} = excluded.{c}" for c in data if c not in conflict] or [f"{conflict[0]} = excluded.{conflict[0]}"]
+        return await self.fetch(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT ({', '.join(conflict)}) DO UPDATE SET {', '.join(assignments)} RETURNING {select_columns(table, returning)}",
+            [_db_value(full[c]) for c in columns],
+        )
+
+    async def delete(self, table: str, where: Dict[str, Any], returning: str = "*") -> List[dict]:
+        return await self.fetch(
+            f"DELETE FROM {table} WHERE {self._where(where)} RETURNING {select_columns(table, returning)}",
+            [_db_value(v) for v in where.values()],
+        )
+
+    @staticmethod
+    def _where(where: Dict[str, Any]) -> str:
+        return " AND ".join(f"{c} = ?" for c in where)
+
+    @staticmethod
+    def _rows(columns: Iterable[str], records: Iterable[Sequence[Any]]) -> List[dict]:
+        columns = list(columns)
+        return [{c: _api_value(c, v) for c, v in zip(columns, record)} for record in records]
+
+
+class SqliteStorage(SqlStorage):
+    """
+    SQLite для однонодових розгортань. Одне з'єднання (WAL) під блокуванням;
+    запити виконуються в пулі потоків, щоб не блокувати event loop.
+    """
+    dialect = "sqlite"
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Викликається тільки під self._lock
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in schema_statements(self.dialect):
+                self._conn.execute(statement)
+            self._conn.commit()
+        return self._conn
+
+    def _run(self, statements: Sequence[Tuple[str, Sequence[Any]]]) -> List[List[dict]]:
+        """Запити однією транзакцією під блокуванням з'єднання; результат кожного — окремим списком."""
+        results = []
+        with self._lock:
+            conn = self._connection()
+            try:
+                for sql, params in statements:
+                    cursor = conn.execute(sql, params)
+                    columns = [d[0] for d in cursor.description] if cursor.description else []
+                    results.append((columns, cursor.fetchall() if columns else []))
+                conn.commit()
+            except sqlite3.IntegrityError as e:
+                conn.rollback()
+                if "UNIQUE" in str(e):
+                    raise DuplicateKeyError(str(e)) from e
+                raise InvalidRowError(str(e)) from e
+            except Exception:
+                conn.rollback()
+                raise
+        return [self._rows(columns, records) for columns, records in results]
+
+    async def _execute(self, sql: str, params: List[Any]) -> List[dict]:
+        return (await asyncio.to_thread(self._run, [(sql, params)]))[0]
+
+    async def fetch_many(self, statements: Sequence[Tuple[str, Sequence[Any]]]) -> List[List[dict]]:
+        """
+        Кілька запитів атомарно (інші запити до сховища між ними не вклинюються).
+        Для того, що Postgres робить одним запитом, а SQLite — ні: напр. RETURNING
+        у SQLite не бачить таблиць з UPDATE ... FROM, тож старі значення читаються окремо.
+        """
+        started = time.perf_counter()
+        outcome = OUTCOME_ERROR
+        try:
+            prepared = [(sql, [_db_value(p) for p in params]) for sql, params in statements]
+            rows = await asyncio.to_thread(self._run, prepared)
+            outcome = OUTCOME_OK
+            return rows
+        except asyncio.CancelledError:
+            outcome = OUTCOME_CANCELLED
+            raise
+        finally:
+            record_dependency("sql", _operation(statements[-1][0]), time.perf_counter() - started, outcome)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class PostgresStorage(SqlStorage):
+    """
+    Прямий доступ до Postgres через пул з'єднань asyncpg (без PostgREST).
+    asyncpg — необов'язкова залежність: потрібна лише для STORAGE_BACKEND=postgres.
+    """
+    dialect = "postgres"
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 20):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+        # Текст запиту -> імена типів його параметрів (для _pg_param)
+        self._param_types: Dict[str, Tuple[str, ...]] = {}
+
+    @staticmethod
+    def _placeholders(sql: str) -> str:
+        parts = sql.split("?")
+        return "".join(part + (f"${i + 1}" if i < len(parts) - 1 else "") for i, part in enumerate(parts))
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    try:
+                        import asyncpg
+                    except ImportError:
+                        raise RuntimeError("Для STORAGE_BACKEND=postgres встановіть asyncpg (pip install asyncpg)")
+                    pool = await asyncpg.create_pool(self.dsn, min_size=self.min_size, max_size=self.max_size)
+                    async with pool.acquire() as conn:
+                        for statement in schema_statements(self.dialect):
+                            await conn.execute(statement)
+                    self._pool = pool
+        return self._pool
+
+    def month_of(self, column: str) -> str:
+        return f"to_char({column}, 'YYYY-MM')"
+
+    def _coerce(self, types: Tuple[str, ...], params: List[Any]) -> List[Any]:
+        try:
+            return [_pg_param(t, p) for t, p in zip(types, params)]
+        except ValueError as e:
+            # Як 22P02 у Postgres: значення не відповідає типу колонки
+            raise InvalidRowError(str(e)) from e
+
+    async def _execute(self, sql: str, params: List[Any]) -> List[dict]:
+        pool = await self._get_pool()
+        query = self._placeholders(sql)
+        try:
+            async with pool.acquire() as conn:
+                types = self._param_types.get(query)
+                if types is None:
+                    # Перший раз для цього тексту: prepare дає типи параметрів (вони залежать
+                    # лише від тексту запиту і схеми, тож спільні для всіх з'єднань пулу)
+                    statement = await conn.prepare(query)
+                    types = tuple(t.name for t in statement.get_parameters())
+                    if len(self._param_types) >= PARAM_TYPES_CACHE_SIZE:
+                        self._param_types.pop(next(iter(self._param_types)))
+                    self._param_types[query] = types
+                    records = await statement.fetch(*self._coerce(types, params))
+                else:
+                    # Далі — звичайний fetch: він іде через кеш підготовлених запитів з'єднання
+                    # (statement_cache_size), без окремого Parse на кожен виклик
+                    records = await conn.fetch(query, *self._coerce(types, params))
+        except Exception as e:
+            if getattr(e, "sqlstate", None) == "23505":
+                raise DuplicateKeyError(str(e)) from e
+            if is_invalid_row_code(getattr(e, "sqlstate", None)):
+                raise InvalidRowError(str(e)) from e
+            raise
+        if not records:
+            return []
+        return self._rows(records[0].keys(), (tuple(r.values()) for r in records))
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+def create_storage(backend: str) -> SqlStorage:
+    if backend == "sqlite":
+        return SqliteStorage(os.environ.get("SQLITE_PATH", DEFAULT_SQLITE_PATH))
+    if backend == "postgres":
+        dsn = os.environ.get("DATABASE_URL")
+        if not dsn:
+            raise ValueError("Помилка: для STORAGE_BACKEND=postgres потрібен DATABASE_URL у .env")
+        return PostgresStorage(
+            dsn,
+            min_size=int(os.environ.get("POSTGRES_POOL_MIN", "1")),
+            max_size=int(os.environ.get("POSTGRES_POOL_MAX", "20")),
+        )
+    raise ValueError(f"Невідоме SQL-сховище: {backend}")
@@ -0,0 +1,117 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from models.common import FopGroup
+from core.constants import (
+    MIN_WAGE,
+    ESV_RATE,
+    MIN_ESV,
+    SINGLE_TAX_G1,
+    SINGLE_TAX_G2,
+    FIXED_MILITARY_TAX,
+    LIMIT_G1,
+    LIMIT_G2,
+    LIMIT_G3
+)
+
+
+@dataclass(frozen=True)
+class TaxRuleSet:
+    """
+    Податкові ставки й ліміти, що діють з effective_from до початку наступного набору.
+    """
+    effective_from: date
+    min_wage: float
+    esv_rate: float
+    min_esv: float
+    single_tax_g1: float
+    single_tax_g2: float
+    fixed_military_tax: float      # Військовий збір для 1, 2 і 4 груп (до 2025 — не сплачувався)
+    military_rate_g3: float        # Військовий збір 3-ї групи за замовчуванням (частка доходу)
+    limit_g1: float
+    limit_g2: float
+    limit_g3: float
+    vat_registration_threshold: float = 1000000.0
+
+    def limit_for(self, group: Optional[FopGroup]) -> float:
+        """Річний ліміт доходу групи (0 — ліміту немає)."""
+        if group == FopGroup.GROUP_1: return self.limit_g1
+        if group == FopGroup.GROUP_2: return self.limit_g2
+        if group == FopGroup.GROUP_3: return self.limit_g3
+        return 0.0
+
+
+# Набори правил у хронологічному порядку.
+# Ставки єдиного податку й ліміти фіксуються на 1 січня, мінімальний ЄСВ — від мінімальної зарплати.
+RULE_SETS: List[TaxRuleSet] = [
+    # 2024, січень–березень: мінімальна зарплата 7100
+    TaxRuleSet(
+        effective_from=date(2024, 1, 1),
+        min_wage=7100.0, esv_rate=0.22, min_esv=1562.0,
+        single_tax_g1=302.80, single_tax_g2=1420.0,
+        fixed_military_tax=0.0, military_rate_g3=0.0,
+        limit_g1=1185700.0, limit_g2=5921400.0, limit_g3=8285700.0,
+    ),
+    # 2024, з 1 квітня: мінімальна зарплата 8000 (ставки ЄП і ліміти — як на 1 січня)
+    TaxRuleSet(
+        effective_from=date(2024, 4, 1),
+        min_wage=8000.0, esv_rate=0.22, min_esv=1760.0,
+        single_tax_g1=302.80, single_tax_g2=1420.0,
+        fixed_military_tax=0.0, military_rate_g3=0.0,
+        limit_g1=1185700.0, limit_g2=5921400.0, limit_g3=8285700.0,
+    ),
+    # 2025: значення з core/constants.py + військовий збір для ФОП (Закон № 4015-IX)
+    TaxRuleSet(
+        effective_from=date(2025, 1, 1),
+        min_wage=MIN_WAGE, esv_rate=ESV_RATE, min_esv=MIN_ESV,
+        single_tax_g1=SINGLE_TAX_G1, single_tax_g2=SINGLE_TAX_G2,
+        fixed_military_tax=FIXED_MILITARY_TAX, military_rate_g3=0.01,
+        limit_g1=LIMIT_G1, limit_g2=LIMIT_G2, limit_g3=LIMIT_G3,
+    ),
+    # 2026: мінімальна зарплата 8647, прожитковий мінімум 3328
+    TaxRuleSet(
+        effective_from=date(2026, 1, 1),
+        min_wage=8647.0, esv_rate=0.22, min_esv=1902.34,
+        single_tax_g1=332.80, single_tax_g2=1729.40,
+        fixed_military_tax=864.70, military_rate_g3=0.01,
+        limit_g1=1444049.0, limit_g2=7211598.0, limit_g3=10091049.0,
+    ),
+]
+
+
+class CompiledTaxRules:
+    """
+    Індекс наборів правил: відсортовані дати початку дії + пошук bisect (O(log n)),
+    плюс кеш по місяцях, тож повторні звернення за ту ж дату — O(1).
+    Правила змінюються не частіше ніж раз на місяць, тому ключ кешу — (рік, місяць).
+    """
+
+    def __init__(self, rule_sets: List[TaxRuleSet]):
+        if not rule_sets:
+            raise ValueError("Потрібен хоча б один набір податкових правил")
+        ordered = sorted(rule_sets, key=lambda r: r.effective_from)
+        self._starts: Tuple[date, ...] = tuple(r.effective_from for r in ordered)
+        self._rules: Tuple[TaxRuleSet, ...] = tuple(ordered)
+        self._by_month: Dict[Tuple[int, int], TaxRuleSet] = {}
+
+    def for_date(self, on_date: Optional[date] = None) -> TaxRuleSet:
+        """Набір правил, що діє на дату (за замовчуванням — сьогодні)."""
+        on_date = on_date or date.today()
+        key = (on_date.year, on_date.month)
+        rules = self._by_month.get(key)
+        if rules is None:
+            # Дати до першого набору отримують найраніший відомий набір
+            index = max(bisect_right(self._starts, date(on_date.year, on_date.month, 1)) - 1, 0)
+            rules = self._rules[index]
+            self._by_month[key] = rules
+        return rules
+
+    @property
+    def rule_sets(self) -> Tuple[TaxRuleSet, ...]:
+        return self._rules
+
+
+# Компілюється один раз при імпорті (старт сервера)
+tax_rules = CompiledTaxRules(RULE_SETS)
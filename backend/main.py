@@ -1,9 +1,57 @@
-from fastapi import FastAPI
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from routers import transactions, categories, profiles, settings, tax
+from routers import transactions, categories, profiles, settings, tax, rates, dashboard, kveds
+from services.nbu_service import warmup_recent_days
+from services.nbu_client import nbu_client
+from services.kved_index import get_kved_index
+from core.database import close_db, warmup_db
+from core import metrics
 
-app = FastAPI(title="FOP Assistant API 🇺🇦")
+# STARTUP_WARMUP=0 — не відкривати з'єднання до сховища під час старту (ліниво, при першому запиті)
+STARTUP_WARMUP = os.environ.get("STARTUP_WARMUP", "1").lower() in ("1", "true", "yes")
+STARTUP_WARMUP_TIMEOUT = float(os.environ.get("STARTUP_WARMUP_TIMEOUT", "5"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Старт: клієнти сховища і НБУ створюються ліниво, тож імпорт main лишається дешевим.
+    Тут явно прогріваємо з'єднання до бази (щоб перший запит не платив за SDK, TLS і пул)
+    і запускаємо фоновий прогрів кешу курсів НБУ за останні NBU_WARMUP_DAYS днів (0 — вимкнено).
+    Класифікатор КВЕД (backend/data/kveds) індексується тут: без нього сервіс не стартує.
+    Зупинка: скасовуємо прогрів і закриваємо пули з'єднань.
+    """
+    started = time.perf_counter()
+    kved_index = await asyncio.to_thread(get_kved_index)
+    print(f"KVED index: {len(kved_index)} items, {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    if STARTUP_WARMUP:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(warmup_db(), STARTUP_WARMUP_TIMEOUT)
+            print(f"Storage warmup: {(time.perf_counter() - started) * 1000:.0f} ms")
+        except Exception as e:
+            # Недоступна база не заважає старту: клієнт перепідключиться при першому запиті
+            print(f"Storage warmup error: {e!r}")
+
+    nbu_warmup = None
+    days = int(os.environ.get("NBU_WARMUP_DAYS", "0"))
+    if days > 0:
+        nbu_warmup = asyncio.create_task(warmup_recent_days(days))
+
+    yield
+
+    if nbu_warmup is not None and not nbu_warmup.done():
+        nbu_warmup.cancel()
+    await nbu_client.aclose()
+    await close_db()
+
+app = FastAPI(title="FOP Assistant API 🇺🇦", lifespan=lifespan)
 
 # 2. CORS (Дозволяємо фронтенду доступ)
 app.add_middleware(
@@ -19,13 +67,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Гістограма тривалості по маршрутах + таймінги залежностей (Supabase / SQL / НБУ)
+    і секцій обробки в межах запиту. З METRICS_SERVER_TIMING=1 вони ж ідуть
+    у заголовок Server-Timing (видно в DevTools браузера).
+    Для потокових відповідей (експорт) час рахується до початку передачі тіла.
+    """
+    timings = metrics.start_request()
+    started = time.perf_counter()
+    response = await call_next(request)
+    elapsed = time.perf_counter() - started
+
+    # Шаблон шляху ('/transactions/{transaction_id}'), а не сам шлях — щоб не плодити серії
+    route = request.scope.get("route")
+    route_label = getattr(route, "path", "unmatched")
+    metrics.request_duration.observe(elapsed, request.method, route_label, str(response.status_code))
+
+    if metrics.SERVER_TIMING_ENABLED:
+        response.headers["Server-Timing"] = metrics.server_timing(timings, elapsed)
+    return response
+
 @app.get("/")
 def read_root():
     return {"status": "active", "service": "FOP Assistant Modular Backend"}
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Метрики у форматі Prometheus (text exposition 0.0.4)."""
+    return PlainTextResponse(metrics.render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # Підключаємо модулі
 app.include_router(transactions.router)
 app.include_router(categories.router)
 app.include_router(profiles.router)
 app.include_router(settings.router)
-app.include_router(tax.router)
\ No newline at end of file
+app.include_router(tax.router)
+app.include_router(rates.router)
+app.include_router(dashboard.router)
+app.include_router(kveds.router)
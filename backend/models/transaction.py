@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date as date_type
 from models.common import CommonType
 from core.constants import(
@@ -30,4 +30,19 @@ class TransactionPatch(BaseModel):
     description: Optional[str] = Field(None, max_length=MAX_DESCRIPTION_LENGTH)
     date: Optional[date_type] = None
     currency: Optional[str] = Field(None, pattern=CURRENCY_REGEX)
-    manual_rate: Optional[float] = Field(None, gt=MIN_MANUAL_RATE)
\ No newline at end of file
+    manual_rate: Optional[float] = Field(None, gt=MIN_MANUAL_RATE)
+
+class TransactionFilter(BaseModel):
+    """Фільтр для масових операцій: усі умови поєднуються через AND."""
+    start_date: Optional[date_type] = None
+    end_date: Optional[date_type] = None
+    category_id: Optional[str] = None
+    type: Optional[CommonType] = None
+
+class TransactionSelection(BaseModel):
+    # Або список ID, або фільтр — рівно щось одне
+    ids: Optional[List[str]] = None
+    filter: Optional[TransactionFilter] = None
+
+class TransactionBulkPatch(TransactionSelection):
+    patch: TransactionPatch
@@ -0,0 +1,14 @@
+# Доступ до таблиці categories. Реалізація обирається за STORAGE_BACKEND:
+# repositories/rest — Supabase (PostgREST), repositories/sql — SQLite / Postgres напряму.
+from core.database import use_sql_storage
+
+if use_sql_storage():
+    from repositories.sql import categories as _impl
+else:
+    from repositories.rest import categories as _impl
+
+list_system = _impl.list_system
+list_own = _impl.list_own
+insert = _impl.insert
+update_name = _impl.update_name
+delete = _impl.delete
@@ -0,0 +1,14 @@
+# Доступ до таблиці profiles. Реалізація обирається за STORAGE_BACKEND:
+# repositories/rest — Supabase (PostgREST), repositories/sql — SQLite / Postgres напряму.
+from core.database import use_sql_storage
+
+if use_sql_storage():
+    from repositories.sql import profiles as _impl
+else:
+    from repositories.rest import profiles as _impl
+
+get = _impl.get
+list_ids = _impl.list_ids
+insert = _impl.insert
+update = _impl.update
+delete = _impl.delete
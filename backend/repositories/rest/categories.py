@@ -0,0 +1,35 @@
+from typing import List
+from core.database import get_db
+
+async def list_system() -> List[dict]:
+    """Системні категорії (user_id IS NULL) — спільні для всіх користувачів."""
+    db = await get_db()
+    response = await db.table("categories").select("*").is_("user_id", "null").execute()
+    return response.data
+
+async def list_own(user_id: str) -> List[dict]:
+    """Власні категорії користувача."""
+    db = await get_db()
+    response = await db.table("categories").select("*").eq("user_id", user_id).execute()
+    return response.data
+
+async def insert(data: dict) -> List[dict]:
+    db = await get_db()
+    response = await db.table("categories").insert(data).execute()
+    return response.data
+
+async def update_name(category_id: str, user_id: str, name: str) -> List[dict]:
+    db = await get_db()
+    response = await db.table("categories").update({"name": name})\
+        .eq("id", category_id)\
+        .eq("user_id", user_id)\
+        .execute()
+    return response.data
+
+async def delete(category_id: str, user_id: str) -> List[dict]:
+    db = await get_db()
+    response = await db.table("categories").delete()\
+        .eq("id", category_id)\
+        .eq("user_id", user_id)\
+        .execute()
+    return response.data
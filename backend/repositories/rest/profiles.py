@@ -0,0 +1,37 @@
+from typing import List, Optional
+from core.database import DuplicateKeyError, get_db
+
+async def get(user_id: str, columns: str = "*") -> Optional[dict]:
+    db = await get_db()
+    response = await db.table("profiles").select(columns).eq("id", user_id).execute()
+    return response.data[0] if response.data else None
+
+async def list_ids(offset: int, limit: int) -> List[str]:
+    db = await get_db()
+    response = await db.table("profiles")\
+        .select("id")\
+        .order("id")\
+        .range(offset, offset + limit - 1)\
+        .execute()
+    return [p["id"] for p in response.data]
+
+async def insert(data: dict) -> List[dict]:
+    """Вставка профілю; дубль id (23505) піднімається як DuplicateKeyError."""
+    db = await get_db()
+    try:
+        response = await db.table("profiles").insert(data).execute()
+    except Exception as e:
+        if getattr(e, "code", None) == "23505": # postgrest APIError
+            raise DuplicateKeyError(str(getattr(e, "message", e))) from e
+        raise
+    return response.data
+
+async def update(user_id: str, data: dict) -> List[dict]:
+    db = await get_db()
+    response = await db.table("profiles").update(data).eq("id", user_id).execute()
+    return response.data
+
+async def delete(user_id: str) -> List[dict]:
+    db = await get_db()
+    response = await db.table("profiles").delete().eq("id", user_id).execute()
+    return response.data
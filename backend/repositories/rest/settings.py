@@ -0,0 +1,39 @@
+from typing import List, Optional
+from core.database import get_db
+
+async def get(user_id: str, columns: str = "*") -> Optional[dict]:
+    db = await get_db()
+    response = await db.table("fop_settings").select(columns).eq("user_id", user_id).execute()
+    return response.data[0] if response.data else None
+
+async def insert(data: dict) -> List[dict]:
+    db = await get_db()
+    response = await db.table("fop_settings").insert(data).execute()
+    return response.data
+
+async def update(user_id: str, data: dict) -> List[dict]:
+    db = await get_db()
+    response = await db.table("fop_settings")\
+        .update(data)\
+        .eq("user_id", user_id)\
+        .execute()
+    return response.data
+
+async def upsert(user_id: str, data: dict) -> List[dict]:
+    """
+    Створює або оновлює налаштування одним запитом (on_conflict=user_id, merge-duplicates).
+    Потребує унікального обмеження на fop_settings.user_id; якщо його немає (42P10) —
+    повертаємося до перевірки і окремого insert / update.
+    """
+    db = await get_db()
+    try:
+        response = await db.table("fop_settings")\
+            .upsert({**data, "user_id": user_id}, on_conflict="user_id")\
+            .execute()
+        return response.data
+    except Exception as e:
+        if getattr(e, "code", None) != "42P10": # postgrest APIError
+            raise
+    if await get(user_id, "setting_id"):
+        return await update(user_id, data)
+    return await insert({**data, "user_id": user_id})
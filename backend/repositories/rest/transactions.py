@@ -0,0 +1,255 @@
+from datetime import date as date_type
+from typing import List, Optional, Tuple, Union
+from core.database import get_db, InvalidRowError, is_invalid_row_code
+
+# (transaction_date, created_at, transaction_id) — позиція в журналі для keyset-пагінації
+LedgerCursor = Tuple[str, str, str]
+
+def apply_filters(query, start_date: Optional[date_type] = None, end_date: Optional[date_type] = None, type: Optional[str] = None):
+    """Спільні фільтри журналу: період і тип операції."""
+    if start_date:
+        query = query.gte("transaction_date", start_date.isoformat()) # >= start_date
+        
+    if end_date:
+        query = query.lte("transaction_date", end_date.isoformat())   # <= end_date
+        
+    if type:
+        query = query.eq("transaction_type", type)
+    return query
+
+def _quote(value: str) -> str:
+    """Значення для or=(...) PostgREST: у лапках, щоб ',', '.', ':', '(' не ламали розбір фільтра."""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def apply_cursor(query, cursor: LedgerCursor):
+    """
+    Keyset-пагінація: одразу переходимо за останній рядок попередньої сторінки
+    (сортування transaction_date DESC, created_at DESC, transaction_id DESC).
+    Усі значення в лапках (timestamp містить ':' та '+').
+    """
+    tx_date, created_at, transaction_id = (_quote(v) for v in cursor)
+    return query.or_(
+        f'transaction_date.lt.{tx_date},'
+        f'and(transaction_date.eq.{tx_date},created_at.lt.{created_at}),'
+        f'and(transaction_date.eq.{tx_date},created_at.eq.{created_at},transaction_id.lt.{transaction_id})'
+    )
+
+async def insert(data: Union[dict, List[dict]]) -> List[dict]:
+    """
+    Вставляє один рядок або пачку рядків одним запитом.
+    Відмова через дані рядка (код 22xxx / 23xxx) піднімається як InvalidRowError.
+    """
+    db = await get_db()
+    try:
+        response = await db.table("transactions").insert(data).execute()
+    except Exception as e:
+        if is_invalid_row_code(getattr(e, "code", None)): # postgrest APIError
+            raise InvalidRowError(str(getattr(e, "message", e))) from e
+        raise
+    return response.data
+
+async def get(transaction_id: str, user_id: str, columns: str = "*") -> Optional[dict]:
+    db = await get_db()
+    response = await db.table("transactions")\
+        .select(columns)\
+        .eq("transaction_id", transaction_id)\
+        .eq("user_id", user_id)\
+        .execute()
+    return response.data[0] if response.data else None
+
+async def list_page(
+    user_id: str,
+    offset: int,
+    limit: int,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None
+) -> List[dict]:
+    db = await get_db()
+    query = apply_filters(db.table("transactions").select("*").eq("user_id", user_id), start_date, end_date, type)
+    response = await query\
+        .order("transaction_date", desc=True)\
+        .order("created_at", desc=True)\
+        .range(offset, offset + limit - 1)\
+        .execute()
+    return response.data
+
+async def list_after(
+    user_id: str,
+    cursor: Optional[LedgerCursor],
+    limit: int,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None,
+    columns: str = "*"
+) -> List[dict]:
+    """Наступні limit рядків журналу після курсора (або з початку, якщо курсора немає)."""
+    db = await get_db()
+    query = apply_filters(db.table("transactions").select(columns).eq("user_id", user_id), start_date, end_date, type)
+    if cursor:
+        query = apply_cursor(query, cursor)
+    response = await query\
+        .order("transaction_date", desc=True)\
+        .order("created_at", desc=True)\
+        .order("transaction_id", desc=True)\
+        .limit(limit)\
+        .execute()
+    return response.data
+
+async def update(transaction_id: str, user_id: str, data: dict) -> List[dict]:
+    db = await get_db()
+    response = await db.table("transactions")\
+        .update(data)\
+        .eq("transaction_id", transaction_id)\
+        .eq("user_id", user_id)\
+        .execute()
+    return response.data
+
+async def delete(transaction_id: str, user_id: str) -> List[dict]:
+    db = await get_db()
+    response = await db.table("transactions")\
+        .delete()\
+        .eq("transaction_id", transaction_id)\
+        .eq("user_id", user_id)\
+        .execute()
+    return response.data
+
+async def list_by_ids(user_id: str, ids: List[str], columns: str = "*") -> List[dict]:
+    """Рядки користувача з переданими ID (одним запитом, transaction_id IN (...))."""
+    db = await get_db()
+    response = await db.table("transactions")\
+        .select(columns)\
+        .eq("user_id", user_id)\
+        .in_("transaction_id", ids)\
+        .execute()
+    return response.data
+
+async def list_matching(
+    user_id: str,
+    after_id: Optional[str],
+    limit: int,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None,
+    category_id: Optional[str] = None,
+    columns: str = "*"
+) -> List[dict]:
+    """Наступні limit рядків за фільтром у порядку transaction_id (keyset: після after_id)."""
+    db = await get_db()
+    query = apply_filters(db.table("transactions").select(columns).eq("user_id", user_id), start_date, end_date, type)
+    if category_id:
+        query = query.eq("category_id", category_id)
+    if after_id:
+        query = query.gt("transaction_id", after_id)
+    response = await query.order("transaction_id").limit(limit).execute()
+    return response.data
+
+async def update_many(user_id: str, ids: List[str], data: dict) -> List[dict]:
+    """Однакові зміни для пачки рядків одним UPDATE; повертає оновлені рядки."""
+    db = await get_db()
+    response = await db.table("transactions")\
+        .update(data)\
+        .eq("user_id", user_id)\
+        .in_("transaction_id", ids)\
+        .execute()
+    return response.data
+
+async def delete_many(user_id: str, ids: List[str]) -> List[dict]:
+    """Видаляє пачку рядків одним DELETE; повертає видалені рядки."""
+    db = await get_db()
+    response = await db.table("transactions")\
+        .delete()\
+        .eq("user_id", user_id)\
+        .in_("transaction_id", ids)\
+        .execute()
+    return response.data
+
+# Функція з supabase/migrations/*_aggregate_transactions_by_month.sql
+AGGREGATE_FUNCTION = "aggregate_transactions_by_month"
+# PostgREST: функцію не знайдено в кеші схеми (міграцію ще не застосовано)
+FUNCTION_NOT_FOUND = "PGRST202"
+# Сторінка вузького сканування для запасного шляху агрегації
+AGGREGATE_PAGE_SIZE = 1000
+
+async def aggregate_by_month(
+    user_id: str,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    by_currency: bool = False
+) -> List[dict]:
+    """
+    Суми по (місяць, тип, категорія[, валюта]) у тому ж вигляді, що GROUP BY у sql/transactions.py.
+    Групує база: один виклик RPC, у відповіді — по рядку на групу, а не всі транзакції.
+    """
+    db = await get_db()
+    params = {
+        "p_user_id": user_id,
+        "p_start_date": start_date.isoformat() if start_date else None,
+        "p_end_date": end_date.isoformat() if end_date else None,
+        "p_by_currency": by_currency,
+    }
+    try:
+        response = await db.rpc(AGGREGATE_FUNCTION, params).execute()
+    except Exception as e:
+        if getattr(e, "code", None) != FUNCTION_NOT_FOUND: # postgrest APIError
+            raise
+        print(f"Aggregate error: {e}; apply supabase/migrations, falling back to paged scan")
+        return await _aggregate_by_paging(user_id, start_date, end_date, by_currency)
+    return response.data
+
+async def _aggregate_by_paging(
+    user_id: str,
+    start_date: Optional[date_type],
+    end_date: Optional[date_type],
+    by_currency: bool
+) -> List[dict]:
+    """Запасний шлях для бази без функції агрегації: вузькі сторінки по transaction_id, суми в один прохід."""
+    columns = "transaction_id, transaction_date, transaction_type, category_id, transaction_amount, amount_original"
+    if by_currency:
+        columns += ", currency_code"
+    groups = {}
+    after_id = None
+    while True:
+        rows = await list_matching(user_id, after_id, AGGREGATE_PAGE_SIZE, start_date, end_date, columns=columns)
+        for row in rows:
+            key = (row["transaction_date"][:7], row["transaction_type"], row["category_id"], row.get("currency_code"))
+            amount = row["transaction_amount"] or 0
+            original = row["amount_original"] if row["amount_original"] is not None else amount
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [amount, original, 1]
+            else:
+                group[0] += amount
+                group[1] += original
+                group[2] += 1
+        if len(rows) < AGGREGATE_PAGE_SIZE:
+            break
+        after_id = rows[-1]["transaction_id"]
+
+    return [
+        {"month": month, "transaction_type": tx_type, "category_id": category_id, "currency_code": currency,
+         "amount": amount, "amount_original": original, "tx_count": count}
+        for (month, tx_type, category_id, currency), (amount, original, count) in groups.items()
+    ]
+
+# Функція з supabase/migrations/*_patch_transaction_financials.sql
+PATCH_FUNCTION = "patch_transaction_financials"
+
+async def patch_financials(transaction_id: str, user_id: str, patch: dict) -> List[dict]:
+    """
+    Часткове оновлення з перерахунком сум одним UPDATE у базі (виклик RPC).
+    patch: transaction_type, category_id, notes, amount, date, currency, manual_rate, reset_rate,
+    nbu_rate, rate_currency, rate_date (None — не змінювати / немає).
+    Повертає оновлений рядок із old_transaction_date, old_transaction_type, old_transaction_amount
+    або [] — рядка немає чи потрібного курсу НБУ не передано.
+    """
+    db = await get_db()
+    params = {"p_transaction_id": transaction_id, "p_user_id": user_id}
+    params.update({f"p_{key}": value for key, value in patch.items()})
+    try:
+        response = await db.rpc(PATCH_FUNCTION, params).execute()
+    except Exception as e:
+        if is_invalid_row_code(getattr(e, "code", None)): # postgrest APIError
+            raise InvalidRowError(str(getattr(e, "message", e))) from e
+        raise
+    return response.data
@@ -0,0 +1,13 @@
+# Доступ до таблиці fop_settings. Реалізація обирається за STORAGE_BACKEND:
+# repositories/rest — Supabase (PostgREST), repositories/sql — SQLite / Postgres напряму.
+from core.database import use_sql_storage
+
+if use_sql_storage():
+    from repositories.sql import settings as _impl
+else:
+    from repositories.rest import settings as _impl
+
+get = _impl.get
+insert = _impl.insert
+update = _impl.update
+upsert = _impl.upsert
@@ -0,0 +1,19 @@
+from typing import List
+from core.database import get_storage
+
+async def list_system() -> List[dict]:
+    """Системні категорії (user_id IS NULL) — спільні для всіх користувачів."""
+    return await get_storage().fetch("SELECT * FROM categories WHERE user_id IS NULL")
+
+async def list_own(user_id: str) -> List[dict]:
+    """Власні категорії користувача."""
+    return await get_storage().fetch("SELECT * FROM categories WHERE user_id = ?", [user_id])
+
+async def insert(data: dict) -> List[dict]:
+    return await get_storage().insert("categories", data)
+
+async def update_name(category_id: str, user_id: str, name: str) -> List[dict]:
+    return await get_storage().update("categories", {"name": name}, {"id": category_id, "user_id": user_id})
+
+async def delete(category_id: str, user_id: str) -> List[dict]:
+    return await get_storage().delete("categories", {"id": category_id, "user_id": user_id})
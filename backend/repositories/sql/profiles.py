@@ -0,0 +1,22 @@
+from typing import List, Optional
+from core.database import get_storage
+from core.sql_storage import select_columns
+
+async def get(user_id: str, columns: str = "*") -> Optional[dict]:
+    return await get_storage().fetch_one(
+        f"SELECT {select_columns('profiles', columns)} FROM profiles WHERE id = ?", [user_id]
+    )
+
+async def list_ids(offset: int, limit: int) -> List[str]:
+    rows = await get_storage().fetch("SELECT id FROM profiles ORDER BY id LIMIT ? OFFSET ?", [limit, offset])
+    return [p["id"] for p in rows]
+
+async def insert(data: dict) -> List[dict]:
+    """Вставка профілю; дубль id піднімається як DuplicateKeyError."""
+    return await get_storage().insert("profiles", data)
+
+async def update(user_id: str, data: dict) -> List[dict]:
+    return await get_storage().update("profiles", data, {"id": user_id})
+
+async def delete(user_id: str) -> List[dict]:
+    return await get_storage().delete("profiles", {"id": user_id})
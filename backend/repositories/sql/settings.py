@@ -0,0 +1,18 @@
+from typing import List, Optional
+from core.database import get_storage
+from core.sql_storage import select_columns
+
+async def get(user_id: str, columns: str = "*") -> Optional[dict]:
+    return await get_storage().fetch_one(
+        f"SELECT {select_columns('fop_settings', columns)} FROM fop_settings WHERE user_id = ?", [user_id]
+    )
+
+async def insert(data: dict) -> List[dict]:
+    return await get_storage().insert("fop_settings", data)
+
+async def update(user_id: str, data: dict) -> List[dict]:
+    return await get_storage().update("fop_settings", data, {"user_id": user_id})
+
+async def upsert(user_id: str, data: dict) -> List[dict]:
+    """Створює або оновлює налаштування одним запитом (унікальний індекс по user_id)."""
+    return await get_storage().upsert("fop_settings", {**data, "user_id": user_id}, ["user_id"])
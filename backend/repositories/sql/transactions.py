@@ -0,0 +1,234 @@
+from datetime import date as date_type
+from typing import List, Optional, Tuple, Union
+from core.database import get_storage
+from core.sql_storage import TABLES, select_columns
+
+# (transaction_date, created_at, transaction_id) — позиція в журналі для keyset-пагінації
+LedgerCursor = Tuple[str, str, str]
+
+# Порядок журналу; збігається з індексом idx_transactions_user_date
+LEDGER_ORDER = "ORDER BY transaction_date DESC, created_at DESC, transaction_id DESC"
+
+def apply_filters(where: List[str], params: list, start_date: Optional[date_type] = None, end_date: Optional[date_type] = None, type: Optional[str] = None) -> None:
+    """Спільні фільтри журналу: період і тип операції."""
+    if start_date:
+        where.append("transaction_date >= ?")
+        params.append(start_date.isoformat())
+    if end_date:
+        where.append("transaction_date <= ?")
+        params.append(end_date.isoformat())
+    if type:
+        where.append("transaction_type = ?")
+        params.append(type)
+
+async def insert(data: Union[dict, List[dict]]) -> List[dict]:
+    """
+    Вставляє один рядок або пачку рядків одним запитом.
+    Відмова через дані рядка піднімається як InvalidRowError (core/sql_storage.py).
+    """
+    return await get_storage().insert("transactions", data)
+
+async def get(transaction_id: str, user_id: str, columns: str = "*") -> Optional[dict]:
+    return await get_storage().fetch_one(
+        f"SELECT {select_columns('transactions', columns)} FROM transactions WHERE transaction_id = ? AND user_id = ?",
+        [transaction_id, user_id],
+    )
+
+async def list_page(
+    user_id: str,
+    offset: int,
+    limit: int,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None
+) -> List[dict]:
+    where, params = ["user_id = ?"], [user_id]
+    apply_filters(where, params, start_date, end_date, type)
+    return await get_storage().fetch(
+        f"SELECT * FROM transactions WHERE {' AND '.join(where)} {LEDGER_ORDER} LIMIT ? OFFSET ?",
+        params + [limit, offset],
+    )
+
+async def list_after(
+    user_id: str,
+    cursor: Optional[LedgerCursor],
+    limit: int,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None,
+    columns: str = "*"
+) -> List[dict]:
+    """Наступні limit рядків журналу після курсора (або з початку, якщо курсора немає)."""
+    where, params = ["user_id = ?"], [user_id]
+    apply_filters(where, params, start_date, end_date, type)
+    if cursor:
+        # Порівняння кортежів іде по індексу (усі колонки в одному напрямку сортування)
+        where.append("(transaction_date, created_at, transaction_id) < (?, ?, ?)")
+        params.extend(cursor)
+    return await get_storage().fetch(
+        f"SELECT {select_columns('transactions', columns)} FROM transactions WHERE {' AND '.join(where)} {LEDGER_ORDER} LIMIT ?",
+        params + [limit],
+    )
+
+async def update(transaction_id: str, user_id: str, data: dict) -> List[dict]:
+    return await get_storage().update("transactions", data, {"transaction_id": transaction_id, "user_id": user_id})
+
+async def delete(transaction_id: str, user_id: str) -> List[dict]:
+    return await get_storage().delete("transactions", {"transaction_id": transaction_id, "user_id": user_id})
+
+def _in_ids(ids: List[str]) -> str:
+    return f"transaction_id IN ({', '.join('?' * len(ids))})"
+
+async def list_by_ids(user_id: str, ids: List[str], columns: str = "*") -> List[dict]:
+    """Рядки користувача з переданими ID (одним запитом, transaction_id IN (...))."""
+    return await get_storage().fetch(
+        f"SELECT {select_columns('transactions', columns)} FROM transactions WHERE user_id = ? AND {_in_ids(ids)}",
+        [user_id] + list(ids),
+    )
+
+async def list_matching(
+    user_id: str,
+    after_id: Optional[str],
+    limit: int,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None,
+    category_id: Optional[str] = None,
+    columns: str = "*"
+) -> List[dict]:
+    """Наступні limit рядків за фільтром у порядку transaction_id (keyset: після after_id)."""
+    where, params = ["user_id = ?"], [user_id]
+    apply_filters(where, params, start_date, end_date, type)
+    if category_id:
+        where.append("category_id = ?")
+        params.append(category_id)
+    if after_id:
+        where.append("transaction_id > ?")
+        params.append(after_id)
+    return await get_storage().fetch(
+        f"SELECT {select_columns('transactions', columns)} FROM transactions WHERE {' AND '.join(where)} ORDER BY transaction_id LIMIT ?",
+        params + [limit],
+    )
+
+async def update_many(user_id: str, ids: List[str], data: dict) -> List[dict]:
+    """Однакові зміни для пачки рядків одним UPDATE; повертає оновлені рядки."""
+    unknown = [c for c in data if c not in TABLES["transactions"]]
+    if unknown:
+        raise ValueError(f"Невідомі колонки transactions: {', '.join(unknown)}")
+    assignments = ", ".join(f"{c} = ?" for c in data)
+    return await get_storage().fetch(
+        f"UPDATE transactions SET {assignments} WHERE user_id = ? AND {_in_ids(ids)} RETURNING *",
+        list(data.values()) + [user_id] + list(ids),
+    )
+
+async def delete_many(user_id: str, ids: List[str]) -> List[dict]:
+    """Видаляє пачку рядків одним DELETE; повертає видалені рядки."""
+    return await get_storage().fetch(
+        f"DELETE FROM transactions WHERE user_id = ? AND {_in_ids(ids)} RETURNING *",
+        [user_id] + list(ids),
+    )
+
+async def aggregate_by_month(
+    user_id: str,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    by_currency: bool = False
+) -> List[dict]:
+    """
+    Суми по (місяць, тип, категорія[, валюта]) — GROUP BY у базі.
+    Рядки: month, transaction_type, category_id, currency_code, amount, amount_original, tx_count.
+    """
+    where, params = ["user_id = ?"], [user_id]
+    apply_filters(where, params, start_date, end_date)
+    currency = "currency_code" if by_currency else "NULL"
+    storage = get_storage()
+    return await storage.fetch(
+        f"""
+        SELECT {storage.month_of("transaction_date")} AS month, transaction_type, category_id, {currency} AS currency_code,
+               SUM(transaction_amount) AS amount,
+               SUM(COALESCE(amount_original, transaction_amount)) AS amount_original,
+               COUNT(*) AS tx_count
+        FROM transactions WHERE {' AND '.join(where)}
+        GROUP BY 1, 2, 3, 4
+        """,
+        params,
+    )
+
+# Колонки старої версії рядка, які patch_financials повертає поруч із новою (для лічильників) -> їх імена в calc
+PREVIOUS_COLUMNS = {"transaction_date": "old_date", "transaction_type": "old_type", "transaction_amount": "old_amount"}
+
+def _financial_patch_sql(dialect: str) -> str:
+    """
+    UPDATE ... FROM (поточний рядок) ... RETURNING: нові сума, курс і валютні поля рахуються з
+    поточного рядка в самій базі. Курс НБУ (p_nbu_rate) береться, лише якщо він потрібен і виданий
+    саме для нової пари (валюта, дата); інакше рядок не оновлюється (calc.rate IS NULL).
+    """
+    def param(pg_type: str) -> str:
+        # Postgres виводить тип параметра з контексту ("? > 0" — integer), тому явне приведення;
+        # у SQLite дати — текст, і CAST(? AS DATE) зіпсував би їх
+        return f"CAST(? AS {pg_type})" if dialect == "postgres" else "?"
+
+    lock = " FOR UPDATE" if dialect == "postgres" else ""
+    # У Postgres "*" у RETURNING включив би й колонки calc; SQLite не приймає "transactions.*"
+    returning = "transactions.*" if dialect == "postgres" else "*"
+    return f"""
+        UPDATE transactions SET
+            transaction_type = COALESCE({param('TEXT')}, calc.old_type),
+            category_id = COALESCE({param('UUID')}, calc.old_category_id),
+            notes = COALESCE({param('TEXT')}, calc.old_notes),
+            transaction_date = calc.new_date,
+            currency_code = calc.new_currency,
+            is_foreign_currency = calc.new_currency <> 'UAH',
+            exchange_rate = calc.rate,
+            amount_original = CASE WHEN calc.new_currency = 'UAH' THEN NULL ELSE calc.new_amount END,
+            transaction_amount = ROUND(calc.new_amount * calc.rate, 2)
+        FROM (
+            SELECT n.*, CASE
+                WHEN n.new_currency = 'UAH' THEN 1
+                WHEN {param('NUMERIC')} > 0 THEN {param('NUMERIC')}
+                WHEN {param('BOOLEAN')} OR n.new_currency <> n.old_currency OR n.new_date <> n.old_date
+                    THEN CASE WHEN n.new_currency = {param('TEXT')} AND n.new_date = {param('DATE')} THEN {param('NUMERIC')} END
+                ELSE n.old_rate
+            END AS rate
+            FROM (
+                SELECT transaction_id AS id, transaction_type AS old_type, category_id AS old_category_id, notes AS old_notes,
+                       transaction_date AS old_date, transaction_amount AS old_amount, currency_code AS old_currency,
+                       exchange_rate AS old_rate,
+                       COALESCE({param('NUMERIC')}, amount_original, transaction_amount) AS new_amount,
+                       COALESCE({param('DATE')}, transaction_date) AS new_date,
+                       COALESCE({param('TEXT')}, currency_code) AS new_currency
+                FROM transactions WHERE transaction_id = {param('UUID')} AND user_id = {param('UUID')}{lock}
+            ) AS n
+        ) AS calc
+        WHERE transactions.transaction_id = calc.id AND calc.rate IS NOT NULL
+        RETURNING {returning}"""
+
+async def patch_financials(transaction_id: str, user_id: str, patch: dict) -> List[dict]:
+    """
+    Часткове оновлення з перерахунком сум одним UPDATE (див. routers/transactions.py, patch_transaction).
+    patch: transaction_type, category_id, notes, amount, date, currency, manual_rate, reset_rate,
+    nbu_rate, rate_currency, rate_date (None — не змінювати / немає).
+    Повертає оновлений рядок із old_transaction_date, old_transaction_type, old_transaction_amount
+    або [] — рядка немає чи потрібного курсу НБУ не передано.
+    """
+    storage = get_storage()
+    params = [
+        patch.get("transaction_type"), patch.get("category_id"), patch.get("notes"),
+        patch.get("manual_rate"), patch.get("manual_rate"), bool(patch.get("reset_rate")),
+        patch.get("rate_currency"), patch.get("rate_date"), patch.get("nbu_rate"),
+        patch.get("amount"), patch.get("date"), patch.get("currency"),
+        transaction_id, user_id,
+    ]
+    sql = _financial_patch_sql(storage.dialect)
+    if storage.dialect == "postgres":
+        previous = ", ".join(f"calc.{alias} AS old_{c}" for c, alias in PREVIOUS_COLUMNS.items())
+        return await storage.fetch(f"{sql}, {previous}", params)
+
+    # SQLite: RETURNING не бачить таблиць з FROM — стару версію читаємо в тій самій транзакції
+    before, updated = await storage.fetch_many([
+        (f"SELECT {', '.join(PREVIOUS_COLUMNS)} FROM transactions WHERE transaction_id = ? AND user_id = ?", [transaction_id, user_id]),
+        (sql, params),
+    ])
+    if not updated:
+        return []
+    return [{**updated[0], **{f"old_{c}": before[0][c] for c in PREVIOUS_COLUMNS}}]
@@ -0,0 +1,23 @@
+# Доступ до таблиці transactions. Реалізація обирається за STORAGE_BACKEND:
+# repositories/rest — Supabase (PostgREST), repositories/sql — SQLite / Postgres напряму.
+from core.database import use_sql_storage
+
+if use_sql_storage():
+    from repositories.sql import transactions as _impl
+else:
+    from repositories.rest import transactions as _impl
+
+LedgerCursor = _impl.LedgerCursor
+
+insert = _impl.insert
+get = _impl.get
+list_page = _impl.list_page
+list_after = _impl.list_after
+update = _impl.update
+delete = _impl.delete
+list_by_ids = _impl.list_by_ids
+list_matching = _impl.list_matching
+update_many = _impl.update_many
+delete_many = _impl.delete_many
+aggregate_by_month = _impl.aggregate_by_month
+patch_financials = _impl.patch_financials
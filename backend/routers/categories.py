@@ -1,57 +1,69 @@
+import hashlib
+import json
+import re
 from typing import Optional
-from fastapi import APIRouter, HTTPException
-from core.database import supabase
+from fastapi import APIRouter, HTTPException, Request, Response
 from models.category import CategoryCreate
+from repositories import categories as categories_repo
+from services.category_service import get_visible_categories
+from services.analytics_service import invalidate_analytics
+from core.metrics import TimedRoute
 
-router = APIRouter(prefix="/categories", tags=["Categories"])
+router = APIRouter(prefix="/categories", tags=["Categories"], route_class=TimedRoute)
+
+# Один ETag у списку If-None-Match: необов'язковий префікс W/ і значення в лапках (кома всередині лапок — частина значення)
+_ETAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Чи збігається ETag з If-None-Match (RFC 9110, 13.1.2): "*" — будь-яка наявна версія,
+    інакше список ETag через кому. Порівняння слабке: W/"x" і "x" — той самий тег.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return opaque in _ETAG_RE.findall(if_none_match)
 
 @router.get("/")
-def get_categories(user_id: Optional[str] = None):
+async def get_categories(request: Request, user_id: Optional[str] = None):
     """
     Отримує список категорій.
     Адаптується під тип користувача (ФОП чи ні).
+    Відповідь має ETag: якщо дані не змінились, повертаємо 304 Not Modified.
     """
     try:
-        # 1. Визначаємо статус користувача (ФОП чи ні?)
-        user_is_fop = True # За замовчуванням (якщо user_id не передали або сталася помилка)
+        # 1. Статус користувача (ФОП чи ні?) + Системні і Свої категорії
+        categories, user_is_fop = await get_visible_categories(user_id)
         
-        if user_id:
-            profile_response = supabase.table("profiles").select("is_fop").eq("id", user_id).execute()
-            if profile_response.data:
-                user_is_fop = profile_response.data[0]['is_fop']
-
-        # 2. Будуємо запит на категорії
-        query = supabase.table("categories").select("*")
+        # 2. Розкладаємо на доходи/витрати за один прохід
+        income_cats, expense_cats = [], []
+        for c in categories:
+            if c['type'] == 'income':
+                income_cats.append(c)
+            elif c['type'] == 'expense':
+                expense_cats.append(c)
         
-        # Фільтр по власнику (Системні + Свої)
-        if user_id:
-            query = query.or_(f"user_id.is.null,user_id.eq.{user_id}")
-        else:
-            query = query.is_("user_id", "null")
-            
-        # 3. Фільтр "ФОП / Не ФОП"
-        # Якщо користувач НЕ ФОП -> показуємо тільки ті, де is_fop_only = FALSE
-        # Якщо користувач ФОП -> показуємо ВСЕ (фільтр не потрібен)
-        if not user_is_fop:
-            query = query.eq("is_fop_only", False)
-
-        response = query.execute()
-        
-        income_cats = [c for c in response.data if c['type'] == 'income']
-        expense_cats = [c for c in response.data if c['type'] == 'expense']
-        
-        return {
+        payload = {
             "income": income_cats,
             "expense": expense_cats,
-            "all": response.data,
+            "all": categories,
             "user_is_fop": user_is_fop # Повертаємо фронтенду інфо про статус
         }
     except Exception as e:
         print(f"Categories error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    # no-cache: браузер може зберігати відповідь, але щоразу перевіряє її через If-None-Match
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.post("/")
-def create_category(cat: CategoryCreate):
+async def create_category(cat: CategoryCreate):
     """Створити нову категорію користувача"""
     try:
         data = {
@@ -59,47 +71,42 @@ def create_category(cat: CategoryCreate):
             "type": cat.type,
             "user_id": cat.user_id
         }
-        response = supabase.table("categories").insert(data).execute()
-        return response.data
+        return await categories_repo.insert(data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{category_id}")
-def delete_category(category_id: str, user_id: str):
+async def delete_category(category_id: str, user_id: str):
     """Видалити власну категорію"""
     try:
         # Спробуємо видалити. RLS (політики бази) не дадуть видалити системну категорію.
-        response = supabase.table("categories").delete()\
-            .eq("id", category_id)\
-            .eq("user_id", user_id)\
-            .execute()
+        deleted = await categories_repo.delete(category_id, user_id)
             
         # Якщо список data порожній, значить нічого не видалилось (бо не знайшли або немає прав)
-        if not response.data:
+        if not deleted:
             raise HTTPException(status_code=403, detail="Не можна видалити цю категорію (можливо, вона системна)")
-            
+
+        # Транзакції видаленої категорії в аналітиці переходять у "без категорії"
+        invalidate_analytics(user_id)
         return {"message": "Категорію видалено"}
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.patch("/{category_id}")
-def update_category(category_id: str, user_id: str, payload: dict):
+async def update_category(category_id: str, user_id: str, payload: dict):
     """Оновити назву власної категорії"""
     try:
         new_name = payload.get("name")
         if not new_name:
             raise HTTPException(status_code=400, detail="Назва не може бути порожньою")
 
-        response = supabase.table("categories").update({"name": new_name})\
-            .eq("id", category_id)\
-            .eq("user_id", user_id)\
-            .execute()
+        updated = await categories_repo.update_name(category_id, user_id, new_name)
             
-        if not response.data:
+        if not updated:
             raise HTTPException(status_code=403, detail="Не можна змінити цю категорію (вона системна або не знайдена)")
             
-        return response.data[0]
+        return updated[0]
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
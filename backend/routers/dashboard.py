@@ -0,0 +1,88 @@
+import asyncio
+from calendar import monthrange
+from datetime import date as date_type
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from models.common import ReportingPeriod
+from repositories import transactions as transactions_repo, categories as categories_repo
+from services.category_service import get_system_categories, filter_visible
+from services.user_cache import get_profile, get_fop_settings
+from services.rollup_service import ensure_built, rollup_store
+from services.tax_service import TaxService, ledger_tax_income
+from core.metrics import TimedRoute, timed
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"], route_class=TimedRoute)
+
+@router.get("")
+async def get_dashboard(
+    user_id: str,
+    start_date: Optional[date_type] = None, # Період журналу (за замовчуванням — поточний місяць)
+    end_date: Optional[date_type] = None,   # Він же — кінець підсумку summary (без нього — за весь час)
+    limit: int = Query(100, ge=1, le=500),  # Скільки транзакцій періоду повернути
+    period: ReportingPeriod = ReportingPeriod.MONTH,
+    as_of: Optional[date_type] = None       # Дата розрахунку податків (за замовчуванням — сьогодні)
+):
+    """
+    Усе для головного екрана одним запитом замість п'яти:
+    профіль, налаштування ФОП, категорії, транзакції періоду, підсумки і податки.
+    Незалежні читання йдуть паралельно (asyncio.gather), а профіль, налаштування
+    і агрегати завантажуються один раз і діляться між розділами відповіді.
+    Податки рахуються з доходу за журналом (як /tax/calculate?source=ledger);
+    порушення обмежень групи повертаються в tax.errors, а не як 400.
+    summary — як /transactions/summary: від початку часів, а з явним end_date — до нього;
+    типовий період (поточний місяць) стосується лише списку транзакцій.
+    """
+    as_of = as_of or date_type.today()
+    summary_end = end_date
+    if start_date is None and end_date is None:
+        start_date = as_of.replace(day=1)
+        end_date = as_of.replace(day=monthrange(as_of.year, as_of.month)[1])
+
+    async def load_rollups():
+        # Агрегати будуються один раз; підсумок і доходи за періоди — з уже готових
+        await ensure_built(user_id)
+        with timed("rollup"):
+            return await asyncio.to_thread(
+                lambda: (rollup_store.summary(user_id, summary_end), rollup_store.income_totals(user_id, as_of))
+            )
+
+    try:
+        profile, settings, system_categories, own_categories, transactions, (summary, income) = await asyncio.gather(
+            get_profile(user_id),
+            get_fop_settings(user_id),
+            get_system_categories(),
+            categories_repo.list_own(user_id),
+            transactions_repo.list_page(user_id, 0, limit, start_date, end_date),
+            load_rollups()
+        )
+
+        categories, user_is_fop = filter_visible(system_categories + own_categories, profile)
+
+        tax = None
+        if user_is_fop and settings:
+            annual_income, income_for_calc = ledger_tax_income(income, period)
+            tax = {
+                "taxes": TaxService.calculate_taxes(settings, income_for_calc, period, as_of),
+                "warnings": TaxService.get_warnings(settings, annual_income, as_of),
+                "errors": TaxService.verify_group_restrictions(settings, annual_income, as_of),
+                "calendar": TaxService.get_payment_calendar(as_of),
+                "income": income
+            }
+
+        return {
+            "profile": profile,
+            "settings": settings.dict() if settings else None,
+            "categories": {
+                "income": [c for c in categories if c['type'] == 'income'],
+                "expense": [c for c in categories if c['type'] == 'expense'],
+                "all": categories,
+                "user_is_fop": user_is_fop
+            },
+            "transactions": transactions,
+            "period": {"start_date": start_date, "end_date": end_date},
+            "summary": summary,
+            "tax": tax
+        }
+    except Exception as e:
+        print(f"Dashboard error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,62 @@
+from fastapi import APIRouter, HTTPException, Query, Response
+from services.kved_index import get_kved_index
+from core.metrics import TimedRoute, timed
+
+router = APIRouter(prefix="/kveds", tags=["KVED"], route_class=TimedRoute)
+
+# Класифікатор змінюється лише з новою версією backend (scripts/update_kveds.py)
+CATALOG_CACHE_CONTROL = "public, max-age=3600"
+
+@router.get("/search")
+def search_kveds(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """
+    Пошук видів діяльності КВЕД за кодом ("62", "62.01") або назвою ("хліб", "компютерне програмування").
+    Слова назви шукаються за префіксом, з опечатками — за схожістю; результати ранжовані (score).
+    """
+    try:
+        index = get_kved_index()
+        with timed("kved_search"):
+            results = index.search(q, limit)
+        return {"query": q, "results": results}
+    except Exception as e:
+        print(f"KVED search error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/sections")
+def list_kved_sections(response: Response):
+    """Секції класифікатора без вмісту (id, назва, кількість видів діяльності) — для каталогу на фронтенді."""
+    try:
+        sections = get_kved_index().section_list
+    except Exception as e:
+        print(f"KVED sections error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
+    return sections
+
+@router.get("/sections/{section_id}")
+def get_kved_section(section_id: str, response: Response):
+    """Одна секція з розділами і видами діяльності: фронтенд вантажить її, коли користувач розгортає секцію."""
+    try:
+        section = get_kved_index().section(section_id)
+    except Exception as e:
+        print(f"KVED section error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if section is None:
+        raise HTTPException(status_code=404, detail="Секцію КВЕД не знайдено")
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
+    return section
+
+@router.get("/{code}")
+def get_kved(code: str):
+    """Вид діяльності за кодом ('62.01' або '6201') разом із секцією і розділом."""
+    try:
+        kved = get_kved_index().get(code)
+    except Exception as e:
+        print(f"KVED lookup error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if kved is None:
+        raise HTTPException(status_code=404, detail="КВЕД не знайдено")
+    return kved
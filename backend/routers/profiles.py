@@ -1,51 +1,53 @@
 from fastapi import APIRouter, HTTPException
-from core.database import supabase
 from models.profile import ProfileCreate, ProfileUpdate
+from repositories import profiles as profiles_repo
+from services.user_cache import get_profile as get_cached_profile, invalidate_profile
+from core.database import DuplicateKeyError
+from core.metrics import TimedRoute
 
-router = APIRouter(prefix="/profile", tags=["Profiles"])
+router = APIRouter(prefix="/profile", tags=["Profiles"], route_class=TimedRoute)
 
 @router.post("/", status_code=201)
-def create_profile(profile: ProfileCreate):
+async def create_profile(profile: ProfileCreate):
     """
     Явне створення профілю (якщо авто-тригер не спрацював).
     """
     try:
-        # Перевірка, чи профіль вже існує
-        existing = supabase.table("profiles").select("id").eq("id", profile.user_id).execute()
-        if existing.data:
-            raise HTTPException(status_code=409, detail="Профіль для цього користувача вже існує")
-
         data = {
             "id": profile.user_id,
             "is_fop": profile.is_fop,
             "full_name": profile.full_name
         }
-        response = supabase.table("profiles").insert(data).execute()
-        return response.data[0]
+        # Без попередньої перевірки: наявний профіль відсікає первинний ключ
+        inserted = await profiles_repo.insert(data)
+        invalidate_profile(profile.user_id)
+        return inserted[0]
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Профіль для цього користувача вже існує")
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         raise HTTPException(status_code=500, detail=f"Помилка створення профілю: {str(e)}")
 
 @router.get("/{user_id}")
-def get_profile(user_id: str):
+async def get_profile(user_id: str):
     """
     Отримати профіль. 
     Більше не створює 'фейковий' профіль, якщо його немає в БД, 
     а чесно каже 404 (або фронтенд має викликати POST).
     """
     try:
-        response = supabase.table("profiles").select("*").eq("id", user_id).execute()
+        profile = await get_cached_profile(user_id)
         
-        if not response.data:
+        if not profile:
             raise HTTPException(status_code=404, detail="Профіль не знайдено")
             
-        return response.data[0]
+        return profile
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.patch("/{user_id}")
-def update_profile(user_id: str, profile: ProfileUpdate):
+async def update_profile(user_id: str, profile: ProfileUpdate):
     """
     Оновлення даних. Валідація через Pydantic не пропустить довгі імена.
     """
@@ -56,26 +58,28 @@ def update_profile(user_id: str, profile: ProfileUpdate):
         if not update_data:
             raise HTTPException(status_code=400, detail="Не передано даних для оновлення")
 
-        response = supabase.table("profiles").update(update_data).eq("id", user_id).execute()
+        updated = await profiles_repo.update(user_id, update_data)
+        invalidate_profile(user_id)
         
-        if not response.data:
+        if not updated:
             raise HTTPException(status_code=404, detail="Профіль не знайдено для оновлення")
             
-        return response.data[0]
+        return updated[0]
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{user_id}")
-def delete_profile(user_id: str):
+async def delete_profile(user_id: str):
     """
     Повне видалення профілю (GDPR).
     Увага: це видалить запис з profiles, але user в auth.users залишиться.
     """
     try:
-        response = supabase.table("profiles").delete().eq("id", user_id).execute()
+        deleted = await profiles_repo.delete(user_id)
+        invalidate_profile(user_id)
         
-        if not response.data:
+        if not deleted:
              raise HTTPException(status_code=404, detail="Профіль не знайдено")
              
         return {"message": "✅ Профіль успішно видалено"}
@@ -0,0 +1,46 @@
+from typing import Optional
+from datetime import date as date_type
+from fastapi import APIRouter, HTTPException
+from services.nbu_service import get_rate_cache_stats, get_nbu_client_stats, prefetch_range
+from core.metrics import TimedRoute
+
+router = APIRouter(prefix="/rates", tags=["Rates"], route_class=TimedRoute)
+
+# Захист від випадкового прогріву за десятки років одним запитом
+MAX_PREFETCH_DAYS = 3660
+
+@router.get("/cache")
+def get_cache_stats():
+    """
+    Статистика кешу курсів НБУ (влучання в пам'ять/диск, промахи, кількість записів).
+    """
+    try:
+        return get_rate_cache_stats()
+    except Exception as e:
+        print(f"Rate cache stats error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/client")
+def get_client_stats():
+    """
+    Стан клієнта НБУ: circuit breaker, кількість запитів, злитих і відхилених викликів.
+    """
+    return get_nbu_client_stats()
+
+@router.post("/prefetch")
+async def prefetch_rates(start_date: date_type, end_date: Optional[date_type] = None, force: bool = False):
+    """
+    Завантажує в кеш курси всіх валют за період: один запит до НБУ на дату.
+    Дати, які вже є в кеші, пропускаються (якщо не передано force=true).
+    """
+    end_date = end_date or date_type.today()
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date не може бути раніше за start_date")
+    if (end_date - start_date).days + 1 > MAX_PREFETCH_DAYS:
+        raise HTTPException(status_code=400, detail=f"Період не може перевищувати {MAX_PREFETCH_DAYS} днів")
+
+    try:
+        return await prefetch_range(start_date, end_date, force=force)
+    except Exception as e:
+        print(f"Rate prefetch error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,19 +1,28 @@
 from fastapi import APIRouter, HTTPException
-from core.database import supabase
 from models.setting import FopSettingsUpdate
+from repositories import settings as settings_repo
+from services.user_cache import invalidate_settings, get_cache_stats
+from core.metrics import TimedRoute
 
-router = APIRouter(prefix="/settings", tags=["Settings"])
+router = APIRouter(prefix="/settings", tags=["Settings"], route_class=TimedRoute)
+
+@router.get("/cache/stats")
+def get_user_cache_stats():
+    """
+    Статистика кешу налаштувань і профілів (влучання, промахи, інвалідації).
+    """
+    return get_cache_stats()
 
 @router.get("/{user_id}")
-def get_fop_settings(user_id: str):
+async def get_fop_settings(user_id: str):
     """
     Отримати податкові налаштування користувача (група, ставки, ЗЕД).
     """
     try:
-        response = supabase.table("fop_settings").select("*").eq("user_id", user_id).execute()
+        existing = await settings_repo.get(user_id)
         
         # Якщо налаштувань ще немає, спробуємо створити дефолтні (або повернемо помилку)
-        if not response.data:
+        if not existing:
             # Варіант: Створити дефолтні налаштування автоматично
             default_data = {
                 "user_id": user_id,
@@ -29,16 +38,17 @@ def get_fop_settings(user_id: str):
                 "employees_count": 0,
                 "is_vat_payer": False
             }
-            new_settings = supabase.table("fop_settings").insert(default_data).execute()
-            return new_settings.data[0]
+            new_settings = await settings_repo.insert(default_data)
+            invalidate_settings(user_id)
+            return new_settings[0]
             
-        return response.data[0]
+        return existing
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         raise HTTPException(status_code=500, detail=f"Error getting settings: {str(e)}")
 
 @router.patch("/{user_id}")
-def update_fop_settings(user_id: str, settings: FopSettingsUpdate):
+async def update_fop_settings(user_id: str, settings: FopSettingsUpdate):
     """
     Оновити налаштування (наприклад, змінити групу ФОП або ставку податку).
     """
@@ -49,21 +59,13 @@ def update_fop_settings(user_id: str, settings: FopSettingsUpdate):
         if not update_data:
             raise HTTPException(status_code=400, detail="Немає даних для оновлення")
 
-        # Спочатку перевіримо, чи існує запис
-        check = supabase.table("fop_settings").select("setting_id").eq("user_id", user_id).execute()
-        
-        if not check.data:
-            # Якщо запису немає - створюємо новий з переданими даними
-            update_data["user_id"] = user_id
-            response = supabase.table("fop_settings").insert(update_data).execute()
-        else:
-            # Якщо є - оновлюємо
-            response = supabase.table("fop_settings")\
-                .update(update_data)\
-                .eq("user_id", user_id)\
-                .execute()
+        # Створюємо запис, якщо його немає, або оновлюємо передані поля — одним запитом
+        saved = await settings_repo.upsert(user_id, update_data)
+
+        # Скидаємо кеш, щоб /tax/calculate одразу побачив нові налаштування
+        invalidate_settings(user_id)
             
-        return response.data[0]
+        return saved[0]
     except Exception as e:
         print(f"Settings Update Error: {e}")
         raise HTTPException(status_code=500, detail="Помилка оновлення налаштувань")
\ No newline at end of file
@@ -1,53 +1,143 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Optional
-from services.tax_service import TaxService
-from models.setting import FopSettingsBase
+import asyncio
+from datetime import date as date_type
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional
+from pydantic import NonNegativeFloat
+from services.tax_service import TaxService, ledger_tax_income
 from models.common import ReportingPeriod
-from core.database import supabase
+from services.user_cache import get_fop_settings
+from services.rollup_service import get_income_totals
+from services.limit_monitor import get_limit_status
+from core.tax_rules import tax_rules
+from core.metrics import TimedRoute
 
-router = APIRouter(prefix="/tax", tags=["Tax"])
+router = APIRouter(prefix="/tax", tags=["Tax"], route_class=TimedRoute)
+
+# Максимальна кількість точок сітки доходів у /tax/simulate
+MAX_SIMULATION_STEPS = 200
 
 @router.get("/calculate")
-def calculate_tax(
+async def calculate_tax(
     user_id: str,
     annual_income: float = 0.0,
     monthly_income: float = 0.0,
-    period: ReportingPeriod = ReportingPeriod.MONTH
+    period: ReportingPeriod = ReportingPeriod.MONTH,
+    source: str = "query",             # 'query' — дохід з параметрів, 'ledger' — з транзакцій
+    as_of: Optional[date_type] = None  # Дата, на яку рахуємо (за замовчуванням — сьогодні)
 ):
     """
     Розрахунок податків на основі налаштувань користувача та доходу.
+    З source=ledger дохід не передається клієнтом, а береться з транзакцій (тільки income):
+    за місяць, квартал і рік до as_of. Ліміти перевіряються по доходу з початку року,
+    а податок — по доходу обраного періоду.
+    Ставки, ліміти і календар беруться з правил, чинних на as_of.
     """
+    as_of = as_of or date_type.today()
+    if source not in ("query", "ledger"):
+        raise HTTPException(status_code=400, detail="source має бути 'query' або 'ledger'")
+
     try:
         # 1. Отримуємо налаштування ФОП
-        settings_res = supabase.table("fop_settings").select("*").eq("user_id", user_id).execute()
-        if not settings_res.data:
+        # Провалідовані налаштування з кешу (скидається при PATCH /settings)
+        income = None
+        if source == "ledger":
+            settings, income = await asyncio.gather(
+                get_fop_settings(user_id),
+                get_income_totals(user_id, as_of)
+            )
+            annual_income, income_for_calc = ledger_tax_income(income, period)
+        else:
+            settings = await get_fop_settings(user_id)
+
+        if not settings:
             raise HTTPException(status_code=404, detail="Налаштування ФОП не знайдено")
         
-        settings_data = settings_res.data[0]
-        settings = FopSettingsBase(**settings_data)
-        
         # 2. Перевіряємо ліміти та обмеження
-        errors = TaxService.verify_group_restrictions(settings, annual_income)
+        errors = TaxService.verify_group_restrictions(settings, annual_income, as_of)
         if errors:
             raise HTTPException(status_code=400, detail={"errors": errors})
             
         # 3. Отримуємо попередження
-        warnings = TaxService.get_warnings(settings, annual_income)
+        warnings = TaxService.get_warnings(settings, annual_income, as_of)
         
         # 4. Рахуємо податки
-        # Для розрахунку використовуємо або місячний дохід, або річний розділений на місяці
-        income_for_calc = monthly_income if monthly_income > 0 else (annual_income / 12)
-        taxes = TaxService.calculate_taxes(settings, income_for_calc, period)
+        # Дохід з журналу — як є (місяць без доходу дає 0); з параметрів —
+        # місячний дохід, а якщо його не передали, річний розділений на місяці
+        if income is None:
+            income_for_calc = monthly_income if monthly_income > 0 else (annual_income / 12)
+        taxes = TaxService.calculate_taxes(settings, income_for_calc, period, as_of)
         
         # 5. Календар
-        calendar = TaxService.get_payment_calendar()
+        calendar = TaxService.get_payment_calendar(as_of)
         
-        return {
+        result = {
             "taxes": taxes,
             "warnings": warnings,
             "calendar": calendar
         }
+        if income is not None:
+            result["income"] = income
+        return result
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         print(f"Tax Calculation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/simulate")
+async def simulate_tax(
+    user_id: str,
+    income_min: float = Query(0.0, ge=0),
+    income_max: Optional[float] = Query(None, gt=0),  # За замовчуванням — ліміт 3-ї групи на as_of
+    steps: int = Query(20, ge=1, le=MAX_SIMULATION_STEPS),
+    incomes: Optional[List[NonNegativeFloat]] = Query(None),  # Явний список річних доходів замість діапазону (>= 0)
+    period: ReportingPeriod = ReportingPeriod.MONTH,
+    as_of: Optional[date_type] = None  # Дата, правила якої застосовуються (за замовчуванням — сьогодні)
+):
+    """
+    Порівняння груп ФОП: податки для кожної групи (1–4) і статусу ПДВ
+    на сітці річних доходів однією відповіддю.
+    Сітка — або явний список incomes, або steps точок від income_min до income_max.
+    """
+    if incomes:
+        if len(incomes) > MAX_SIMULATION_STEPS:
+            raise HTTPException(status_code=400, detail=f"Не більше {MAX_SIMULATION_STEPS} значень доходу")
+        grid = incomes
+    else:
+        if income_max is None:
+            income_max = tax_rules.for_date(as_of).limit_g3
+        if income_max < income_min:
+            raise HTTPException(status_code=400, detail="income_max не може бути менше за income_min")
+        step = (income_max - income_min) / (steps - 1) if steps > 1 else 0.0
+        grid = [round(income_min + i * step, 2) for i in range(steps)]
+
+    try:
+        settings = await get_fop_settings(user_id)
+        if not settings:
+            raise HTTPException(status_code=404, detail="Налаштування ФОП не знайдено")
+
+        return TaxService.simulate(settings, grid, period, as_of)
+    except Exception as e:
+        if isinstance(e, HTTPException): raise e
+        print(f"Tax Simulation error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+
+@router.get("/limits")
+async def get_tax_limits(user_id: str, year: Optional[int] = None):
+    """
+    Стан ліміту доходу групи за податковий рік (за замовчуванням — поточний).
+    Дохід береться з лічильника, який оновлюється при кожному записі транзакцій,
+    тож відповідь не залежить від розміру журналу. alerts — перетини порогів 90% і 100%,
+    зафіксовані в момент запису.
+    """
+    try:
+        status = await get_limit_status(user_id, year)
+        if status is None:
+            raise HTTPException(status_code=404, detail="Налаштування ФОП не знайдено")
+        return status
+    except Exception as e:
+        if isinstance(e, HTTPException): raise e
+        print(f"Tax Limits error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,67 +1,278 @@
-from typing import Optional
-from fastapi import APIRouter, HTTPException
-from core.database import supabase
+import asyncio
+import base64
+import csv
+import io
+import json
+import uuid
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from repositories import transactions as transactions_repo
+from services.category_service import get_all_categories
 from services.nbu_service import get_nbu_rate
-from models.transaction import TransactionCreate, TransactionPatch  
-from datetime import date as date_type
+from services.rollup_service import get_summary, record_rows, rebuild_user
+from services.limit_monitor import check_limits
+from services.analytics_service import get_analytics, invalidate_analytics, GRANULARITIES
+from services.statement_parser import StatementParser, StatementRowError, STATEMENT_FORMATS, iter_records
+from models.transaction import TransactionCreate, TransactionPatch, TransactionSelection, TransactionBulkPatch
+from datetime import date as date_type, datetime
+from core.metrics import TimedRoute
+from core.database import InvalidRowError
 
-router = APIRouter(prefix="/transactions", tags=["Transactions"])
+router = APIRouter(prefix="/transactions", tags=["Transactions"], route_class=TimedRoute)
+
+# Скільки рядків імпорту записуємо в базу одним insert
+IMPORT_BATCH_SIZE = 500
+
+# Скільки рядків читаємо з бази за один запит під час експорту
+EXPORT_CHUNK_SIZE = 1000
+
+def build_transaction_row(tx: TransactionCreate, final_rate: float) -> dict:
+    """
+    Готує рядок для таблиці transactions.
+    Важливо: назви полів мають співпадати з базою даних!
+    """
+    amount_uah = tx.amount * final_rate if tx.currency != "UAH" else tx.amount
+    return {
+        "user_id": tx.user_id,
+        "category_id": tx.category_id,
+        "transaction_type": tx.type,
+        "transaction_amount": round(amount_uah, 2), # Гривня
+        "transaction_date": tx.date.isoformat(),
+        "notes": tx.description,
+        "is_foreign_currency": tx.currency != "UAH",
+        "currency_code": tx.currency,
+        "amount_original": tx.amount if tx.currency != "UAH" else None,
+        "exchange_rate": final_rate
+    }
 
 @router.post("/")
-def create_transaction(tx: TransactionCreate):
+async def create_transaction(tx: TransactionCreate):
     """
     Створює транзакцію. Тягне курс НБУ, якщо не заданий вручну.
+    Хендлер асинхронний: очікування НБУ і бази не займає потік з пулу.
     """
     final_rate = 1.0
-    amount_uah = tx.amount
 
     # Валютна магія
     if tx.currency != "UAH":
         if tx.manual_rate and tx.manual_rate > 0:
             final_rate = tx.manual_rate
         else:
-            nbu_rate = get_nbu_rate(tx.currency, tx.date)
+            nbu_rate = await get_nbu_rate(tx.currency, tx.date)
             if nbu_rate == 0:
                 raise HTTPException(status_code=400, detail="НБУ не відповідає. Введіть курс вручну.")
             final_rate = nbu_rate
-        
-        amount_uah = tx.amount * final_rate
 
     # Підготовка даних для Supabase
-    # Важливо: назви полів мають співпадати з базою даних!
-    data_to_insert = {
-        "user_id": tx.user_id,
-        "category_id": tx.category_id,
-        "transaction_type": tx.type,
-        "transaction_amount": round(amount_uah, 2), # Гривня
-        "transaction_date": tx.date.isoformat(),
-        "notes": tx.description,
-        "is_foreign_currency": tx.currency != "UAH",
-        "currency_code": tx.currency,
-        "amount_original": tx.amount if tx.currency != "UAH" else None,
-        "exchange_rate": final_rate
-    }
+    data_to_insert = build_transaction_row(tx, final_rate)
 
     try:
-        response = supabase.table("transactions").insert(data_to_insert).execute()
+        inserted = await transactions_repo.insert(data_to_insert)
+        limit_alerts = await check_limits(tx.user_id, await record_rows(tx.user_id, inserted=inserted))
         return {
             "message": "✅ Транзакцію успішно створено",
             "used_rate": final_rate,
-            "amount_uah": round(amount_uah, 2),
-            "db_response": response.data
+            "amount_uah": data_to_insert["transaction_amount"],
+            "db_response": inserted,
+            "limit_alerts": limit_alerts
         }
     except Exception as e:
         print(f"DB Error: {e}")
         raise HTTPException(status_code=500, detail=f"Помилка запису в базу: {str(e)}")
+
+async def _insert_rows(rows: List[dict], isolating: bool = False) -> List[object]:
+    """
+    Вставляє пачку одним insert. Якщо база відхилила пачку через дані якогось рядка
+    (напр. неіснуюча category_id), ділить її навпіл, доки не знайде погані рядки:
+    решта записується, а помилка дістається лише поганим.
+    Повертає для кожного рядка вставлений рядок бази або виняток.
+    Інші помилки (мережа, доступ) не стосуються окремих рядків: для всієї пачки
+    піднімаються далі, а під час пошуку поганих рядків — позначають лише ще не записані.
+    """
+    try:
+        inserted = await transactions_repo.insert(rows) or []
+    except InvalidRowError as e:
+        if len(rows) == 1:
+            return [e]
+        middle = len(rows) // 2
+        return await _insert_rows(rows[:middle], True) + await _insert_rows(rows[middle:], True)
+    except Exception as e:
+        if not isolating:
+            raise
+        return [e] * len(rows)
+    return inserted + [None] * (len(rows) - len(inserted))
+
+async def _insert_import_batch(batch: List[Tuple[int, TransactionCreate]], rates: Dict[Tuple[str, date_type], float], report: List[dict]) -> Dict[int, float]:
+    """
+    Вставляє пачку рядків імпорту одним multi-row insert.
+    Курси тягнуться один раз на кожну нову пару (валюта, дата).
+    Повертає зміну доходу по роках (з record_rows).
+    """
+    missing = {(tx.currency, tx.date) for _, tx in batch
+               if tx.currency != "UAH" and not tx.manual_rate and (tx.currency, tx.date) not in rates}
+    if missing:
+        pairs = list(missing)
+        resolved = await asyncio.gather(*(get_nbu_rate(c, d) for c, d in pairs))
+        rates.update(zip(pairs, resolved))
+
+    rows = []
+    row_numbers = []
+    for row_number, tx in batch:
+        if tx.currency == "UAH":
+            final_rate = 1.0
+        elif tx.manual_rate:
+            final_rate = tx.manual_rate
+        else:
+            final_rate = rates.get((tx.currency, tx.date), 0.0)
+            if final_rate == 0:
+                report.append({"row": row_number, "status": "error", "error": "НБУ не відповідає. Вкажіть manual_rate."})
+                continue
+        rows.append(build_transaction_row(tx, final_rate))
+        row_numbers.append(row_number)
+
+    if not rows:
+        return {}
+
+    try:
+        results = await _insert_rows(rows)
+    except Exception as e:
+        print(f"Bulk insert error: {e}")
+        report.extend({"row": n, "status": "error", "error": f"Помилка запису в базу: {str(e)}"} for n in row_numbers)
+        return {}
+
+    inserted = []
+    for row_number, row, result in zip(row_numbers, rows, results):
+        if isinstance(result, InvalidRowError):
+            report.append({"row": row_number, "status": "error", "error": f"Рядок відхилено базою: {result}"})
+            continue
+        if isinstance(result, Exception):
+            report.append({"row": row_number, "status": "error", "error": f"Помилка запису в базу: {result}"})
+            continue
+        if result:
+            inserted.append(result)
+        report.append({
+            "row": row_number,
+            "status": "created",
+            "transaction_id": result.get("transaction_id") if result else None,
+            "amount_uah": row["transaction_amount"],
+            "used_rate": row["exchange_rate"]
+        })
+    return await record_rows(batch[0][1].user_id, inserted=inserted) if inserted else {}
+
+def _merge_year_deltas(total: Dict[int, float], year_deltas: Dict[int, float]) -> None:
+    for year, delta in year_deltas.items():
+        total[year] = total.get(year, 0.0) + delta
+
+@router.post("/bulk")
+async def import_transactions(
+    request: Request,
+    user_id: str,
+    format: Optional[str] = None,       # generic | monobank | privatbank (за замовчуванням — визначаємо за заголовком)
+    dry_run: bool = False               # Тільки перевірити файл, нічого не записувати
+):
+    """
+    Масовий імпорт транзакцій з банківської виписки.
+    Тіло запиту — CSV (Monobank, PrivatBank або колонки date,type,amount,currency,...)
+    чи NDJSON (один JSON-об'єкт TransactionCreate без user_id на рядок).
+    Файл читається потоково, курси тягнуться раз на (валюта, дата),
+    запис у базу — пачками по IMPORT_BATCH_SIZE рядків.
+    Повертає звіт по кожному рядку.
+    """
+    if format is not None and format not in STATEMENT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Невідомий формат виписки. Доступні: {', '.join(STATEMENT_FORMATS)}")
+
+    content_type = request.headers.get("content-type", "")
+    is_json = "json" in content_type
+    parser = StatementParser(format)
+
+    report: List[dict] = []
+    batch: List[Tuple[int, TransactionCreate]] = []
+    rates: Dict[Tuple[str, date_type], float] = {}
+    year_deltas: Dict[int, float] = {}
+    row_number = 0
+
+    try:
+        async for record in iter_records(request.stream(), csv_quoting=not is_json):
+            if not is_json and parser.header is None:
+                parser.parse_csv_record(record) # Заголовок CSV
+                continue
+
+            row_number += 1
+            try:
+                data = parser.parse_json_record(record) if is_json else parser.parse_csv_record(record)
+                tx = TransactionCreate(**{**data, "user_id": user_id})
+            except StatementRowError as e:
+                report.append({"row": row_number, "status": "error", "error": str(e)})
+                continue
+            except ValidationError as e:
+                errors = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                report.append({"row": row_number, "status": "error", "error": errors})
+                continue
+
+            if dry_run:
+                report.append({"row": row_number, "status": "valid"})
+                continue
+
+            batch.append((row_number, tx))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                _merge_year_deltas(year_deltas, await _insert_import_batch(batch, rates, report))
+                batch = []
+
+        if batch:
+            _merge_year_deltas(year_deltas, await _insert_import_batch(batch, rates, report))
+    except StatementRowError as e:
+        # Помилка заголовка — файл взагалі не вдалося розібрати
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Bulk import error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    report.sort(key=lambda r: r["row"])
+    created = sum(1 for r in report if r["status"] == "created")
+    failed = sum(1 for r in report if r["status"] == "error")
+    # Пороги ліміту перевіряємо один раз на весь імпорт, а не на кожну пачку
+    limit_alerts = await check_limits(user_id, year_deltas)
+
+    return {
+        "message": f"✅ Імпортовано {created} з {row_number} рядків",
+        "total": row_number,
+        "created": created,
+        "failed": failed,
+        "limit_alerts": limit_alerts,
+        "rows": report
+    }
     
+def encode_cursor(row: dict) -> str:
+    """Непрозорий курсор: (transaction_date, created_at, transaction_id) останнього рядка сторінки."""
+    payload = json.dumps([row["transaction_date"], row["created_at"], row["transaction_id"]])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, str, str]:
+    """
+    Курсор приходить від клієнта, тож кожне поле перевіряється за типом колонки
+    (дата, timestamp, UUID) до того, як потрапить у фільтр запиту.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        tx_date, created_at, transaction_id = json.loads(payload)
+        date_type.fromisoformat(tx_date)
+        datetime.fromisoformat(created_at)
+        return tx_date, created_at, str(uuid.UUID(transaction_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Некоректний курсор пагінації")
+
 @router.get("/")
-def get_transactions(
+async def get_transactions(
     user_id: str, 
     limit: int = 50, 
     offset: int = 0,             # Для пагінації (гортати сторінки)
     start_date: Optional[date_type] = None, # Фільтр: З якої дати
     end_date: Optional[date_type] = None,   # Фільтр: По яку дату
-    type: Optional[str] = None         # Фільтр: 'income' або 'expense'
+    type: Optional[str] = None,        # Фільтр: 'income' або 'expense'
+    pagination: str = "offset",        # 'offset' (за замовчуванням) або 'cursor'
+    cursor: Optional[str] = None       # next_cursor з попередньої сторінки (вмикає режим 'cursor')
 ):
     """
     Отримує список транзакцій з можливістю фільтрації.
@@ -70,112 +281,445 @@ def get_transactions(
     - start_date / end_date: Вибірка за період (напр. квартал).
     - type: Показати тільки доходи або витрати.
     - limit / offset: Пагінація.
+    - pagination=cursor / cursor: Keyset-пагінація для нескінченного скролу.
+      Повертає {"items": [...], "next_cursor": "..."}; next_cursor = null на останній сторінці.
+      Вартість сторінки не залежить від глибини, а нові транзакції не зсувають рядки.
     """
+    if pagination not in ("offset", "cursor"):
+        raise HTTPException(status_code=400, detail="pagination має бути 'offset' або 'cursor'")
+    use_cursor = pagination == "cursor" or cursor is not None
+
     try:
-        # 1. Починаємо будувати запит
-        query = supabase.table("transactions")\
-            .select("*")\
-            .eq("user_id", user_id)
-            
-        # 2. Накладаємо фільтри, якщо вони передані
-        if start_date:
-            query = query.gte("transaction_date", start_date.isoformat()) # >= start_date
-            
-        if end_date:
-            query = query.lte("transaction_date", end_date.isoformat())   # <= end_date
-            
-        if type:
-            query = query.eq("transaction_type", type)
-
-        # 3. Сортування та ліміти (завжди в кінці)
-        response = query\
-            .order("transaction_date", desc=True)\
-            .order("created_at", desc=True)\
-            .range(offset, offset + limit - 1)\
-            .execute()
-            
-        return response.data
+        if not use_cursor:
+            return await transactions_repo.list_page(user_id, offset, limit, start_date, end_date, type)
+
+        # Беремо на один рядок більше, щоб знати, чи є наступна сторінка
+        rows = await transactions_repo.list_after(
+            user_id, decode_cursor(cursor) if cursor else None, limit + 1, start_date, end_date, type
+        )
+
+        items = rows[:limit]
+        has_more = len(rows) > limit
+        return {
+            "items": items,
+            "next_cursor": encode_cursor(items[-1]) if has_more and items else None
+        }
         
     except Exception as e:
+        if isinstance(e, HTTPException): raise e
         print(f"Error fetching transactions: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/summary")
-def get_transaction_summary(
+async def get_transaction_summary(
     user_id: str,
     end_date: Optional[date_type] = None
 ):
     """
     Повертає агреговану статистику (дохід, витрати, баланс).
     Якщо передати end_date, рахує все від початку часів до цієї дати.
+    Відповідь береться з помісячних агрегатів (services/rollup_service.py),
+    а не з повного сканування журналу.
     """
     try:
-        # Використовуємо rpc або просто витягуємо суми через select
-        # Для простоти на Supabase Python SDK ми можемо додати .sum() 
-        # але нативне SDK не завжди це підтримує зручно без RPC.
-        # Тому просто витягнемо необхідні поля і просумуємо.
-        # (У реальному проекті краще мати RPC функцію в Postgres).
-        
-        query = supabase.table("transactions")\
-            .select("transaction_amount, transaction_type, transaction_date")\
-            .eq("user_id", user_id)
-        
-        if end_date:
-            query = query.lte("transaction_date", end_date.isoformat())
+        return await get_summary(user_id, end_date)
+    except Exception as e:
+        print(f"Summary Error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        response = query.execute()
-        
-        income = 0.0
-        expense = 0.0
-        months = set()
-        
-        for tx in response.data:
-            amount = float(tx["transaction_amount"])
-            date_str = tx.get("transaction_date", "")
-            if date_str:
-                months.add(date_str[:7])
-
-            if tx["transaction_type"] == "income":
-                income += amount
-            else:
-                expense += amount
-        
+@router.get("/analytics")
+async def get_transaction_analytics(
+    user_id: str,
+    granularity: str = "month",             # 'month' або 'quarter'
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    by_currency: bool = False               # Окремі ряди для кожної валюти (+ суми в оригінальній валюті)
+):
+    """
+    Ряди доходів і витрат по місяцях або кварталах з розбивкою за категоріями —
+    готові масиви для графіків: periods (спільна вісь без пропусків), totals і series.
+    Рахується груповою агрегацією (GROUP BY у базі; для Supabase — один прохід
+    по вузьких колонках) і кешується до наступного запису користувача.
+    """
+    if granularity not in GRANULARITIES:
+        raise HTTPException(status_code=400, detail=f"granularity має бути одним з: {', '.join(GRANULARITIES)}")
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date не може бути пізніше за end_date")
+
+    try:
+        return await get_analytics(user_id, granularity, start_date, end_date, by_currency)
+    except Exception as e:
+        print(f"Analytics error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/summary/rebuild")
+async def rebuild_transaction_summary(user_id: str):
+    """
+    Перебудовує агрегати користувача з журналу
+    (напр. після імпорту історії напряму в базу, в обхід API).
+    """
+    try:
+        await rebuild_user(user_id)
         return {
-            "totalIncome": round(income, 2),
-            "totalExpense": round(expense, 2),
-            "balance": round(income - expense, 2),
-            "monthsCount": len(months)
+            "message": "✅ Агрегати перебудовано",
+            "summary": await get_summary(user_id)
         }
     except Exception as e:
-        print(f"Summary Error: {e}")
+        print(f"Summary rebuild error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+EXPORT_COLUMNS = [
+    "transaction_id", "transaction_date", "transaction_type", "category_id", "category_name",
+    "transaction_amount", "currency_code", "amount_original", "exchange_rate", "notes", "created_at"
+]
+
+async def _iter_ledger_chunks(user_id: str, start_date: Optional[date_type], end_date: Optional[date_type], type: Optional[str]):
+    """Читає журнал шматками по EXPORT_CHUNK_SIZE рядків через keyset-курсор."""
+    columns = ", ".join(c for c in EXPORT_COLUMNS if c != "category_name")
+    cursor = None
+    while True:
+        rows = await transactions_repo.list_after(user_id, cursor, EXPORT_CHUNK_SIZE, start_date, end_date, type, columns)
+
+        if rows:
+            yield rows
+        if len(rows) < EXPORT_CHUNK_SIZE:
+            return
+        last = rows[-1]
+        cursor = (last["transaction_date"], last["created_at"], last["transaction_id"])
+
+@router.get("/export")
+async def export_transactions(
+    user_id: str,
+    format: str = "csv",                    # 'csv' або 'ndjson'
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    type: Optional[str] = None
+):
+    """
+    Потокове вивантаження журналу (CSV або NDJSON) з назвами категорій.
+    Дані читаються з бази шматками і одразу віддаються клієнту,
+    тому пам'ять не залежить від розміру журналу.
+    """
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format має бути 'csv' або 'ndjson'")
+
+    try:
+        # Категорій у користувача небагато — завантажуємо один раз на весь експорт
+        categories = await get_all_categories(user_id)
+        category_names = {c["id"]: c["name"] for c in categories}
+    except Exception as e:
+        print(f"Export error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+    async def generate():
+        if format == "csv":
+            # BOM, щоб Excel коректно відкривав кирилицю
+            yield "\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n"
+
+        async for rows in _iter_ledger_chunks(user_id, start_date, end_date, type):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer) if format == "csv" else None
+            for row in rows:
+                row["category_name"] = category_names.get(row.get("category_id"))
+                if writer:
+                    writer.writerow([row.get(c) for c in EXPORT_COLUMNS])
+                else:
+                    buffer.write(json.dumps({c: row.get(c) for c in EXPORT_COLUMNS}, ensure_ascii=False) + "\n")
+            yield buffer.getvalue()
+
+    filename = f"transactions.{format}"
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        generate(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
     
+# Поля PATCH, що змінюють суму в гривні (потребують перерахунку курсу)
+FINANCIAL_PATCH_FIELDS = ('amount', 'date', 'currency', 'manual_rate')
+
+# Колонки, які перераховує PATCH з фінансовими полями
+FINANCIAL_COLUMNS = ('transaction_amount', 'transaction_date', 'is_foreign_currency', 'currency_code', 'amount_original', 'exchange_rate')
+
+# Стара версія рядка, яку повертає patch_financials (old_<колонка>) — для лічильників доходу
+PREVIOUS_ROW_COLUMNS = ('transaction_date', 'transaction_type', 'transaction_amount')
+
+# Скільки ID передаємо в одному UPDATE / DELETE ... WHERE transaction_id IN (...)
+BULK_MUTATION_CHUNK = 200
+
+# Максимум транзакцій в одному масовому запиті
+MAX_BULK_MUTATION_ITEMS = 5000
+
+def _patch_dates(old_data: dict, patch: TransactionPatch) -> Tuple[date_type, str]:
+    new_date = patch.date if patch.date is not None else date_type.fromisoformat(old_data['transaction_date'])
+    new_currency = patch.currency if patch.currency is not None else old_data['currency_code']
+    return new_date, new_currency
+
+def _patch_rate_key(old_data: dict, patch: TransactionPatch, patch_fields: dict) -> Optional[Tuple[str, date_type]]:
+    """
+    (валюта, дата), для яких PATCH потребує курсу НБУ, або None.
+    Курс НБУ потрібен, якщо користувач ЯВНО передав порожній курс (null або 0),
+    або якщо змінилась валюта чи дата валютної транзакції.
+    """
+    if not any(f in patch_fields for f in FINANCIAL_PATCH_FIELDS):
+        return None
+    new_date, new_currency = _patch_dates(old_data, patch)
+    provided_manual_rate = patch_fields.get('manual_rate')
+    if new_currency == "UAH" or (provided_manual_rate and provided_manual_rate > 0):
+        return None
+    if ('manual_rate' in patch_fields and not provided_manual_rate) or \
+       new_currency != old_data['currency_code'] or \
+       new_date.isoformat() != old_data['transaction_date']:
+        return (new_currency, new_date)
+    return None
+
+async def _patch_rate_pair(transaction_id: str, user_id: str, patch: TransactionPatch, patch_fields: dict) -> Optional[Tuple[str, date_type]]:
+    """
+    (валюта, дата), для яких PATCH однієї транзакції може потребувати курсу НБУ, або None.
+    Пара береться з самого PATCH; поточні валюта й дата читаються, лише якщо PATCH
+    передає тільки одну з них або скидає курс. Чи курс справді потрібен, вирішує UPDATE.
+    """
+    provided_manual_rate = patch_fields.get('manual_rate')
+    if patch.currency == "UAH" or (provided_manual_rate and provided_manual_rate > 0):
+        return None
+    if patch.currency is None and patch.date is None and 'manual_rate' not in patch_fields:
+        return None # Лише сума чи тип — курс лишається старим
+    if patch.currency is not None and patch.date is not None:
+        return (patch.currency, patch.date)
+    current = await transactions_repo.get(transaction_id, user_id, "currency_code, transaction_date")
+    return _patch_rate_key(current, patch, patch_fields) if current else None
+
+def _plain_fields(patch: TransactionPatch) -> dict:
+    """Передані поля, що не впливають на суми: категорія, тип, опис."""
+    data = {}
+    if patch.category_id is not None: data["category_id"] = patch.category_id
+    if patch.type is not None: data["transaction_type"] = patch.type
+    if patch.description is not None: data["notes"] = patch.description
+    return data
+
+def _patched_fields(old_data: dict, patch: TransactionPatch, patch_fields: dict, nbu_rate: Optional[float] = None) -> dict:
+    """
+    Поля для UPDATE: передані користувачем + перераховані фінанси.
+    nbu_rate — курс для пари з _patch_rate_key (якщо вона була).
+    """
+    # 1. Формуємо об'єкт для оновлення: тільки ті поля, що передали
+    data_to_update = _plain_fields(patch)
+
+    # 2. Перевіряємо, чи треба перераховувати фінанси
+    if not any(f in patch_fields for f in FINANCIAL_PATCH_FIELDS):
+        return data_to_update
+
+    # 3. Визначаємо нові значення (або беремо старі, якщо нові не передані)
+    new_amount = patch.amount if patch.amount is not None else old_data['amount_original'] or old_data['transaction_amount']
+    new_date, new_currency = _patch_dates(old_data, patch)
+    # manual_rate сюди потрапить тільки якщо він був у patch_fields
+    provided_manual_rate = patch_fields.get('manual_rate')
+
+    if new_currency != "UAH":
+        # 1. Якщо користувач передав курс і він > 0 — використовуємо його
+        if provided_manual_rate and provided_manual_rate > 0:
+            final_rate = provided_manual_rate
+        
+        # 2. Якщо потрібен курс НБУ (порожній курс, нова валюта чи дата) — беремо отриманий
+        elif nbu_rate is not None:
+            final_rate = nbu_rate
+        
+        # 3. В іншому випадку (наприклад, змінили тільки суму без зміни курсу/дати) 
+        # — залишаємо старий курс
+        else:
+            final_rate = old_data['exchange_rate']
+        
+        final_amount_uah = new_amount * final_rate
+        final_amount_original = new_amount
+
+    else:
+        # Якщо стала гривня (або була гривня)
+        # Ця частина у вас ідеальна — ми зачищаємо валютні "хвости"
+        final_amount_uah = new_amount
+        final_rate = 1.0
+        final_amount_original = None
+
+    # 4. Пишемо нові цифри
+    data_to_update["transaction_amount"] = round(final_amount_uah, 2)
+    data_to_update["transaction_date"] = new_date.isoformat()
+    data_to_update["is_foreign_currency"] = new_currency != "UAH"
+    data_to_update["currency_code"] = new_currency
+    data_to_update["amount_original"] = final_amount_original
+    data_to_update["exchange_rate"] = final_rate
+    return data_to_update
+
+def _chunks(items: List[str], size: int = BULK_MUTATION_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+async def _resolve_selection(user_id: str, selection: TransactionSelection) -> List[str]:
+    """
+    ID транзакцій для масової операції. Фільтр спершу розгортається в список ID
+    (keyset по transaction_id), тож зміна застосовується до сталого набору,
+    навіть якщо вона змінює відфільтровані колонки (наприклад, категорію).
+    """
+    if (selection.ids is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Передайте або ids, або filter")
+
+    if selection.ids is not None:
+        ids = list(dict.fromkeys(selection.ids)) # Без дублікатів, порядок як у запиті
+        if not ids:
+            raise HTTPException(status_code=400, detail="Список ids порожній")
+    else:
+        f = selection.filter
+        if not any(v is not None for v in (f.start_date, f.end_date, f.category_id, f.type)):
+            raise HTTPException(status_code=400, detail="Фільтр має містити хоча б одну умову")
+        ids = []
+        after_id = None
+        while True:
+            page = await transactions_repo.list_matching(
+                user_id, after_id, BULK_MUTATION_CHUNK * 5,
+                f.start_date, f.end_date, f.type.value if f.type else None, f.category_id, columns="transaction_id"
+            )
+            ids.extend(row["transaction_id"] for row in page)
+            if len(ids) > MAX_BULK_MUTATION_ITEMS or len(page) < BULK_MUTATION_CHUNK * 5:
+                break
+            after_id = page[-1]["transaction_id"]
+
+    if len(ids) > MAX_BULK_MUTATION_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Забагато транзакцій в одному запиті (максимум {MAX_BULK_MUTATION_ITEMS})")
+    return ids
+
+@router.patch("/bulk")
+async def bulk_patch_transactions(user_id: str, body: TransactionBulkPatch):
+    """
+    Масове часткове оновлення: ті самі зміни для списку ID або всіх транзакцій за фільтром
+    (період, категорія, тип).
+    Категорія / опис — одним UPDATE на пачку без читання.
+    Зміна суми, дати, валюти чи типу — читання пачки, курси НБУ раз на (валюта, дата),
+    а рядки з однаковим результатом оновлюються одним UPDATE.
+    Повертає результат по кожній транзакції.
+    """
+    patch = body.patch
+    patch_fields = patch.dict(exclude_unset=True)
+    if not patch_fields:
+        raise HTTPException(status_code=400, detail="Немає даних для оновлення")
+
+    ids = await _resolve_selection(user_id, body)
+    results: Dict[str, dict] = {}
+    year_deltas: Dict[int, float] = {}
+
+    try:
+        if patch.type is None and not any(f in patch_fields for f in FINANCIAL_PATCH_FIELDS):
+            # Без впливу на суми й лічильники — одразу UPDATE ... RETURNING
+            data_to_update = _patched_fields({}, patch, patch_fields)
+            groups = {tuple(data_to_update.items()): list(ids)} if data_to_update else {}
+            old_rows: Dict[str, dict] = {}
+            if not data_to_update:
+                for chunk in _chunks(ids):
+                    for row in await transactions_repo.list_by_ids(user_id, chunk, "transaction_id"):
+                        results[row["transaction_id"]] = {"transaction_id": row["transaction_id"], "status": "updated", "changes": {}}
+        else:
+            # Для перерахунку і лічильників потрібні поточні версії рядків
+            old_rows = {}
+            for chunk in _chunks(ids):
+                for row in await transactions_repo.list_by_ids(user_id, chunk):
+                    old_rows[row["transaction_id"]] = row
+
+            rate_keys = {old_rows[i]["transaction_id"]: _patch_rate_key(old_rows[i], patch, patch_fields) for i in old_rows}
+            pairs = list({key for key in rate_keys.values() if key is not None})
+            rates = dict(zip(pairs, await asyncio.gather(*(get_nbu_rate(c, d) for c, d in pairs))))
+
+            groups = {}
+            for transaction_id, old_data in old_rows.items():
+                key = rate_keys[transaction_id]
+                if key is not None and rates.get(key, 0) == 0:
+                    results[transaction_id] = {"transaction_id": transaction_id, "status": "error", "error": "НБУ не відповідає. Введіть курс вручну."}
+                    continue
+                data_to_update = _patched_fields(old_data, patch, patch_fields, rates.get(key) if key else None)
+                groups.setdefault(tuple(data_to_update.items()), []).append(transaction_id)
+
+        for data_items, group_ids in groups.items():
+            data_to_update = dict(data_items)
+            for chunk in _chunks(group_ids):
+                try:
+                    updated = await transactions_repo.update_many(user_id, chunk, data_to_update) or []
+                except Exception as e:
+                    print(f"Bulk PATCH error: {e}")
+                    results.update({i: {"transaction_id": i, "status": "error", "error": f"Помилка запису в базу: {str(e)}"} for i in chunk})
+                    continue
+                if old_rows:
+                    removed = [old_rows[row["transaction_id"]] for row in updated if row["transaction_id"] in old_rows]
+                    _merge_year_deltas(year_deltas, await record_rows(user_id, removed=removed, inserted=updated))
+                for row in updated:
+                    results[row["transaction_id"]] = {"transaction_id": row["transaction_id"], "status": "updated", "changes": data_to_update}
+        if groups:
+            # Після запису (зміна категорії не проходить через record_rows)
+            invalidate_analytics(user_id)
+    except Exception as e:
+        print(f"Bulk PATCH error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    items = [results.get(i) or {"transaction_id": i, "status": "not_found"} for i in ids]
+    updated_count = sum(1 for item in items if item["status"] == "updated")
+    limit_alerts = await check_limits(user_id, year_deltas)
+
+    return {
+        "message": f"✅ Оновлено {updated_count} з {len(ids)} транзакцій",
+        "total": len(ids),
+        "updated": updated_count,
+        "not_found": sum(1 for item in items if item["status"] == "not_found"),
+        "failed": sum(1 for item in items if item["status"] == "error"),
+        "limit_alerts": limit_alerts,
+        "items": items
+    }
+
+@router.delete("/bulk")
+async def bulk_delete_transactions(user_id: str, selection: TransactionSelection):
+    """
+    Масове видалення за списком ID або фільтром (період, категорія, тип).
+    Один DELETE ... RETURNING на пачку; повертає результат по кожній транзакції.
+    """
+    ids = await _resolve_selection(user_id, selection)
+    results: Dict[str, dict] = {}
+    year_deltas: Dict[int, float] = {}
+
+    for chunk in _chunks(ids):
+        try:
+            deleted = await transactions_repo.delete_many(user_id, chunk) or []
+        except Exception as e:
+            print(f"Bulk DELETE error: {e}")
+            results.update({i: {"transaction_id": i, "status": "error", "error": str(e)} for i in chunk})
+            continue
+        _merge_year_deltas(year_deltas, await record_rows(user_id, removed=deleted))
+        for row in deleted:
+            results[row["transaction_id"]] = {"transaction_id": row["transaction_id"], "status": "deleted"}
+
+    items = [results.get(i) or {"transaction_id": i, "status": "not_found"} for i in ids]
+    deleted_count = sum(1 for item in items if item["status"] == "deleted")
+    limit_alerts = await check_limits(user_id, year_deltas)
+
+    return {
+        "message": f"✅ Видалено {deleted_count} з {len(ids)} транзакцій",
+        "total": len(ids),
+        "deleted": deleted_count,
+        "not_found": sum(1 for item in items if item["status"] == "not_found"),
+        "failed": sum(1 for item in items if item["status"] == "error"),
+        "limit_alerts": limit_alerts,
+        "items": items
+    }
+
 @router.delete("/{transaction_id}")
-def delete_transaction(transaction_id: str, user_id: str):
+async def delete_transaction(transaction_id: str, user_id: str):
     """
     Видаляє транзакцію за її ID.
     Перевіряє, чи належить вона цьому користувачу.
     """
     try:
-        # 1. Спочатку перевіряємо, чи існує такий запис у цього юзера
-        # (Хоча RLS це робить, але краще мати явну перевірку для API відповіді)
-        check = supabase.table("transactions")\
-            .select("transaction_id")\
-            .eq("transaction_id", transaction_id)\
-            .eq("user_id", user_id)\
-            .execute()
+        # DELETE ... RETURNING: видалений рядок одразу підтверджує, що запис був і належав користувачу
+        deleted = await transactions_repo.delete(transaction_id, user_id)
             
-        if not check.data:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Транзакцію не знайдено або у вас немає прав на її видалення")
 
-        # 2. Видаляємо
-        supabase.table("transactions")\
-            .delete()\
-            .eq("transaction_id", transaction_id)\
-            .eq("user_id", user_id)\
-            .execute()
+        limit_alerts = await check_limits(user_id, await record_rows(user_id, removed=deleted))
             
-        return {"message": "✅ Транзакцію видалено"}
+        return {"message": "✅ Транзакцію видалено", "limit_alerts": limit_alerts}
         
     except Exception as e:
         # Якщо це наша помилка 404 - прокидаємо її далі
@@ -185,102 +729,76 @@ def delete_transaction(transaction_id: str, user_id: str):
         raise HTTPException(status_code=500, detail=str(e))
     
 @router.patch("/{transaction_id}")
-def patch_transaction(transaction_id: str, user_id: str, patch: TransactionPatch):
+async def patch_transaction(transaction_id: str, user_id: str, patch: TransactionPatch):
     """
     Часткове оновлення транзакції.
     Змінює тільки передані поля.
     Якщо змінено суму, валюту або дату — автоматично перераховує курс і гривневий еквівалент.
     """
     try:
-        # 1. Отримуємо поточну версію транзакції з бази
-        existing_response = supabase.table("transactions")\
-            .select("*")\
-            .eq("transaction_id", transaction_id)\
-            .eq("user_id", user_id)\
-            .execute()
-            
-        if not existing_response.data:
-            raise HTTPException(status_code=404, detail="Транзакцію не знайдено")
-
-        old_data = existing_response.data[0]
-
-        # 2. Визначаємо нові значення (або беремо старі, якщо нові не передані)
         # Отримуємо тільки ті поля, які були реально в JSON запиті
         patch_fields = patch.dict(exclude_unset=True)
-        
-        new_amount = patch.amount if patch.amount is not None else old_data['amount_original'] or old_data['transaction_amount']
-        new_date = patch.date if patch.date is not None else date_type.fromisoformat(old_data['transaction_date'])
-        new_currency = patch.currency if patch.currency is not None else old_data['currency_code']
-        # manual_rate сюди потрапить тільки якщо він був у patch_fields
-        provided_manual_rate = patch_fields.get('manual_rate')
-
-        # 3. Перевіряємо, чи треба перераховувати фінанси
-        needs_recalc = any(f in patch_fields for f in ['amount', 'date', 'currency', 'manual_rate'])
-
-        final_amount_uah = old_data['transaction_amount']
-        final_rate = old_data['exchange_rate']
-        final_amount_original = old_data['amount_original']
-        
-        if needs_recalc:
-            if new_currency != "UAH":
-                # 1. Якщо користувач передав курс і він > 0 — використовуємо його
-                if provided_manual_rate and provided_manual_rate > 0:
-                    final_rate = provided_manual_rate
-                
-                # 2. Якщо користувач ЯВНО передав порожній курс (null або 0) — тягнемо НБУ
-                # або якщо змінилась валюта чи дата — також тягнемо НБУ
-                elif ('manual_rate' in patch_fields and not provided_manual_rate) or \
-                     new_currency != old_data['currency_code'] or \
-                     new_date.isoformat() != old_data['transaction_date']:
-                    
-                    nbu_rate = get_nbu_rate(new_currency, new_date)
-                    if nbu_rate == 0:
-                         raise HTTPException(status_code=400, detail="НБУ не відповідає. Введіть курс вручну.")
-                    final_rate = nbu_rate
-                
-                # 3. В іншому випадку (наприклад, змінили тільки опис або суму без зміни курсу/дати) 
-                # — залишаємо старий курс
-                else:
-                    final_rate = old_data['exchange_rate']
-                
-                final_amount_uah = new_amount * final_rate
-                final_amount_original = new_amount
 
+        # 0. Категорія чи опис не впливають ні на суми, ні на лічильники — один UPDATE ... RETURNING
+        if patch.type is None and not any(f in patch_fields for f in FINANCIAL_PATCH_FIELDS):
+            data_to_update = _patched_fields({}, patch, patch_fields)
+
+            if data_to_update:
+                updated = await transactions_repo.update(transaction_id, user_id, data_to_update)
             else:
-                # Якщо стала гривня (або була гривня)
-                # Ця частина у вас ідеальна — ми зачищаємо валютні "хвости"
-                final_amount_uah = new_amount
-                final_rate = 1.0
-                final_amount_original = None
-
-        # 4. Формуємо об'єкт для оновлення
-        data_to_update = {}
-        
-        # Оновлюємо тільки ті поля, що передали + перераховані фінанси
-        if patch.category_id is not None: data_to_update["category_id"] = patch.category_id
-        if patch.type is not None: data_to_update["transaction_type"] = patch.type
-        if patch.description is not None: data_to_update["notes"] = patch.description
-        
-        # Якщо був перерахунок, пишемо нові цифри
-        if needs_recalc:
-            data_to_update["transaction_amount"] = round(final_amount_uah, 2)
-            data_to_update["transaction_date"] = new_date.isoformat()
-            data_to_update["is_foreign_currency"] = new_currency != "UAH"
-            data_to_update["currency_code"] = new_currency
-            data_to_update["amount_original"] = final_amount_original
-            data_to_update["exchange_rate"] = final_rate
-
-        # 5. Зберігаємо в базу
-        response = supabase.table("transactions")\
-            .update(data_to_update)\
-            .eq("transaction_id", transaction_id)\
-            .eq("user_id", user_id)\
-            .execute()
-            
+                existing = await transactions_repo.get(transaction_id, user_id)
+                updated = [existing] if existing else []
+            if not updated:
+                raise HTTPException(status_code=404, detail="Транзакцію не знайдено")
+            if data_to_update:
+                # Суми не змінились, але категорія могла — ряди аналітики застаріли
+                invalidate_analytics(user_id)
+
+            return {
+                "message": "✅ Транзакцію оновлено (PATCH)",
+                "changes": data_to_update,
+                "full_data": updated,
+                "limit_alerts": []
+            }
+
+        financial = any(f in patch_fields for f in FINANCIAL_PATCH_FIELDS)
+
+        # 1. Курс НБУ — якщо PATCH його потребує (валюта чи дата змінюються або курс скинуто)
+        rate_key = await _patch_rate_pair(transaction_id, user_id, patch, patch_fields)
+        nbu_rate = await get_nbu_rate(*rate_key) if rate_key else 0
+
+        # 2. Один UPDATE: суму в гривні, курс і валютні поля база рахує з поточного рядка
+        updated = await transactions_repo.patch_financials(transaction_id, user_id, {
+            **_plain_fields(patch),
+            "amount": patch.amount,
+            "date": patch.date.isoformat() if patch.date else None,
+            "currency": patch.currency,
+            "manual_rate": patch_fields.get('manual_rate'),
+            "reset_rate": 'manual_rate' in patch_fields and not patch_fields.get('manual_rate'),
+            "nbu_rate": nbu_rate or None,
+            "rate_currency": rate_key[0] if rate_key else None,
+            "rate_date": rate_key[1].isoformat() if rate_key else None,
+        })
+
+        if not updated:
+            # Рядок не оновлено: його немає, або потрібен курс, якого НБУ не дав
+            if not await transactions_repo.get(transaction_id, user_id, "transaction_id"):
+                raise HTTPException(status_code=404, detail="Транзакцію не знайдено")
+            if rate_key and not nbu_rate:
+                raise HTTPException(status_code=400, detail="НБУ не відповідає. Введіть курс вручну.")
+            # Валюту чи дату змінили паралельно — курс отримано не для тієї пари
+            raise HTTPException(status_code=409, detail="Транзакцію змінено паралельно. Повторіть запит.")
+
+        row = {k: v for k, v in updated[0].items() if not k.startswith("old_")}
+        old_data = {"transaction_id": row["transaction_id"], **{c: updated[0][f"old_{c}"] for c in PREVIOUS_ROW_COLUMNS}}
+        # Зміна дати між роками чи типу income/expense переносить суму між лічильниками років
+        limit_alerts = await check_limits(user_id, await record_rows(user_id, removed=[old_data], inserted=[row]))
+
         return {
             "message": "✅ Транзакцію оновлено (PATCH)",
-            "changes": data_to_update,
-            "full_data": response.data
+            "changes": {**_plain_fields(patch), **({c: row[c] for c in FINANCIAL_COLUMNS} if financial else {})},
+            "full_data": [row],
+            "limit_alerts": limit_alerts
         }
 
     except Exception as e:
@@ -0,0 +1,125 @@
+import os
+import threading
+from datetime import date as date_type
+from typing import Dict, List, Optional, Tuple
+from core.cache import TTLCache, MISSING
+from core.metrics import timed
+from repositories import transactions as transactions_repo
+
+# Відповідь кешується до наступного запису користувача (див. invalidate_analytics);
+# TTL лише страхує від змін в обхід API (або з інших воркерів)
+ANALYTICS_CACHE_TTL = float(os.environ.get("ANALYTICS_CACHE_TTL", "3600"))
+ANALYTICS_CACHE_SIZE = int(os.environ.get("ANALYTICS_CACHE_SIZE", "2000"))
+
+GRANULARITIES = ("month", "quarter")
+
+analytics_cache = TTLCache(max_size=ANALYTICS_CACHE_SIZE, ttl=ANALYTICS_CACHE_TTL)
+
+# Номер "покоління" даних користувача: кожен запис збільшує його,
+# і всі закешовані варіанти (періоди, гранулярність, валюти) стають недосяжними
+_generations: Dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+def invalidate_analytics(user_id: str) -> None:
+    with _generations_lock:
+        _generations[user_id] = _generations.get(user_id, 0) + 1
+
+
+def _generation(user_id: str) -> int:
+    with _generations_lock:
+        return _generations.get(user_id, 0)
+
+
+def _period_label(month: str, granularity: str) -> str:
+    if granularity == "quarter":
+        return f"{month[:4]}-Q{(int(month[5:7]) - 1) // 3 + 1}"
+    return month
+
+
+def _period_range(first: str, last: str, granularity: str) -> List[str]:
+    """Усі періоди від first до last (місяці 'YYYY-MM'), щоб на графіку не було пропусків."""
+    year, month = int(first[:4]), int(first[5:7])
+    end = (int(last[:4]), int(last[5:7]))
+    labels: List[str] = []
+    while (year, month) <= end:
+        label = _period_label(f"{year}-{month:02d}", granularity)
+        if not labels or labels[-1] != label:
+            labels.append(label)
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return labels
+
+
+def build_series(groups: List[dict], granularity: str, by_currency: bool) -> Dict:
+    """
+    Згруповані суми -> ряди для графіків: спільна вісь periods і масиви значень,
+    вирівняні по ній (по одному ряду на тип + категорію [+ валюту]).
+    Прохід іде по групах (місяць x категорія), а не по транзакціях.
+    """
+    if not groups:
+        return {"granularity": granularity, "periods": [], "totals": {"income": [], "expense": []}, "series": []}
+
+    months = sorted({g["month"] for g in groups})
+    periods = _period_range(months[0], months[-1], granularity)
+    index = {label: i for i, label in enumerate(periods)}
+    size = len(periods)
+
+    totals = {"income": [0.0] * size, "expense": [0.0] * size}
+    series: Dict[Tuple, Dict] = {}
+    for g in groups:
+        i = index[_period_label(g["month"], granularity)]
+        tx_type = g["transaction_type"]
+        if tx_type in totals:
+            totals[tx_type][i] += g["amount"]
+
+        key = (tx_type, g["category_id"], g["currency_code"] if by_currency else None)
+        item = series.get(key)
+        if item is None:
+            item = {"type": tx_type, "category_id": g["category_id"], "amounts": [0.0] * size, "counts": [0] * size}
+            if by_currency:
+                item["currency"] = g["currency_code"]
+                item["amounts_original"] = [0.0] * size
+            series[key] = item
+        item["amounts"][i] += g["amount"]
+        item["counts"][i] += g["tx_count"]
+        if by_currency:
+            item["amounts_original"][i] += g["amount_original"]
+
+    result_series = []
+    for item in series.values():
+        item["amounts"] = [round(v, 2) for v in item["amounts"]]
+        if by_currency:
+            item["amounts_original"] = [round(v, 2) for v in item["amounts_original"]]
+        item["total"] = round(sum(item["amounts"]), 2)
+        result_series.append(item)
+    # Найбільші ряди першими — графіку зазвичай потрібні топ-N категорій
+    result_series.sort(key=lambda s: (s["type"], -s["total"]))
+
+    return {
+        "granularity": granularity,
+        "periods": periods,
+        "totals": {t: [round(v, 2) for v in values] for t, values in totals.items()},
+        "series": result_series
+    }
+
+
+async def get_analytics(
+    user_id: str,
+    granularity: str = "month",
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    by_currency: bool = False
+) -> Dict:
+    """Ряди доходів/витрат по періодах і категоріях (з кешу до наступного запису користувача)."""
+    key = (user_id, _generation(user_id), granularity, start_date, end_date, by_currency)
+    cached = analytics_cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    groups = await transactions_repo.aggregate_by_month(user_id, start_date, end_date, by_currency)
+    with timed("analytics"):
+        result = build_series(groups, granularity, by_currency)
+    analytics_cache.set(key, result)
+    return result
@@ -0,0 +1,48 @@
+import asyncio
+import os
+from typing import List, Optional, Tuple
+from core.cache import TTLCache, MISSING
+from repositories import categories as categories_repo
+from services.user_cache import get_profile
+
+# Системні категорії міняються тільки адміністратором напряму в базі
+SYSTEM_CATEGORIES_TTL = float(os.environ.get("SYSTEM_CATEGORIES_TTL", "600"))
+
+system_categories_cache = TTLCache(max_size=1, ttl=SYSTEM_CATEGORIES_TTL)
+
+async def get_system_categories() -> List[dict]:
+    """Знімок системних категорій у пам'яті процесу."""
+    cached = system_categories_cache.get("system")
+    if cached is not MISSING:
+        return cached
+
+    categories = await categories_repo.list_system()
+    system_categories_cache.set("system", categories)
+    return categories
+
+async def get_all_categories(user_id: Optional[str]) -> List[dict]:
+    """Системні + власні категорії користувача (без фільтра ФОП)."""
+    if not user_id:
+        return list(await get_system_categories())
+    system, own = await asyncio.gather(get_system_categories(), categories_repo.list_own(user_id))
+    return system + own
+
+async def get_visible_categories(user_id: Optional[str]) -> Tuple[List[dict], bool]:
+    """
+    Категорії, доступні користувачу, і його статус ФОП.
+    Профіль і власні категорії читаються паралельно; системні — зі знімка.
+    Якщо користувач НЕ ФОП -> показуємо тільки ті, де is_fop_only = FALSE.
+    """
+    if not user_id:
+        return filter_visible(await get_all_categories(None), None)
+
+    profile, categories = await asyncio.gather(get_profile(user_id), get_all_categories(user_id))
+    return filter_visible(categories, profile)
+
+def filter_visible(categories: List[dict], profile: Optional[dict]) -> Tuple[List[dict], bool]:
+    """Категорії для вже завантаженого профілю (None — профілю немає, вважаємо ФОП)."""
+    user_is_fop = profile['is_fop'] if profile else True
+    if not user_is_fop:
+        # Як eq.false у PostgREST: категорії з is_fop_only = NULL теж приховані
+        categories = [c for c in categories if c.get('is_fop_only') is False]
+    return categories, user_is_fop
@@ -0,0 +1,239 @@
+import json
+import os
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+# Джерело класифікатора — вихід scripts/update_kveds.py, що входить у backend:
+# каталог із manifest.json і файлами секцій (backend/data/kveds). KVED_SOURCE_PATH може вказувати
+# і на JSON-масив секцій або JS-модуль виду "export const KVED_SECTIONS = [...];"
+DEFAULT_SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "kveds")
+KVED_SOURCE_PATH = os.environ.get("KVED_SOURCE_PATH", DEFAULT_SOURCE_PATH)
+
+DEFAULT_SEARCH_LIMIT = 20
+# Нечіткий пошук (опечатки) — тільки для слів від цієї довжини і з цією схожістю триграм
+FUZZY_MIN_LENGTH = 4
+FUZZY_MIN_SIMILARITY = 0.45
+
+# Усі варіанти апострофа в українських назвах ("кар'єр", "кар’єр", "карʼєр") -> без апострофа
+_APOSTROPHES = str.maketrans("", "", "'’ʼ`´‘")
+# Латиниця, схожа на кирилицю, при наборі з неправильною розкладкою
+_LOOKALIKES = str.maketrans({"a": "а", "c": "с", "e": "е", "i": "і", "o": "о", "p": "р", "x": "х", "y": "у"})
+_WORD_RE = re.compile(r"[^\W_]+")
+_CODE_RE = re.compile(r"^\d{1,2}(?:[.,]?\d{0,2})$")
+
+
+def normalize(text: str) -> str:
+    """Нормалізована форма для пошуку: нижній регістр, без апострофів, ґ -> г."""
+    return text.lower().translate(_APOSTROPHES).replace("ґ", "г")
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD_RE.findall(normalize(text))
+
+
+def _code_key(code: str) -> str:
+    """'62.01' / '6201' / '62,01' -> '6201' (ключ префіксного пошуку за кодом)."""
+    return code.replace(".", "").replace(",", "").strip()
+
+
+def _trigrams(word: str) -> frozenset:
+    padded = f"^{word}$"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class KvedIndex:
+    """
+    Індекс класифікатора КВЕД у пам'яті:
+    - коди: відсортований список ключів '6201' (префіксний пошук бісекцією — "62", "62.0");
+    - назви: відсортований словник нормалізованих слів -> номери видів діяльності
+      (префікс слова бісекцією, як у префіксному дереві, але без вузлів-об'єктів);
+    - триграми слів словника для нечіткого пошуку, коли слово набране з помилкою.
+    """
+
+    def __init__(self, sections: List[dict]):
+        self.items: List[dict] = []
+        # Дерево секція -> розділи -> види діяльності для перегляду каталогу (GET /kveds/sections/{id})
+        self.sections: Dict[str, dict] = {section["id"]: section for section in sections}
+        self.section_list: List[dict] = [
+            {"id": section["id"], "title": section["title"],
+             "items": sum(len(group.get("items", [])) for group in section.get("groups", []))}
+            for section in sections
+        ]
+        self.by_code: Dict[str, int] = {}
+        word_postings: Dict[str, List[int]] = defaultdict(list)
+        first_words: List[str] = []
+
+        for section in sections:
+            for group in section.get("groups", []):
+                for kved in group.get("items", []):
+                    i = len(self.items)
+                    self.items.append({
+                        "code": kved["code"],
+                        "name": kved["name"],
+                        "allowedGroups": kved.get("allowedGroups", []),
+                        "section": {"id": section["id"], "title": section["title"]},
+                        "division": {"id": group["id"], "title": group["title"]},
+                    })
+                    self.by_code[_code_key(kved["code"])] = i
+                    words = tokenize(kved["name"])
+                    first_words.append(words[0] if words else "")
+                    for word in dict.fromkeys(words):
+                        word_postings[word].append(i)
+
+        self._first_words = first_words
+        self._name_lengths = [len(item["name"]) for item in self.items]
+        self._codes: List[Tuple[str, int]] = sorted(self.by_code.items())
+        self._code_keys = [key for key, _ in self._codes]
+
+        self._words: List[str] = sorted(word_postings)
+        self._postings: List[Tuple[int, ...]] = [tuple(word_postings[w]) for w in self._words]
+        self._word_trigrams: List[frozenset] = [_trigrams(w) for w in self._words]
+        trigram_postings: Dict[str, List[int]] = defaultdict(list)
+        for w, grams in enumerate(self._word_trigrams):
+            for gram in grams:
+                trigram_postings[gram].append(w)
+        self._trigram_postings = dict(trigram_postings)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def section(self, section_id: str) -> Optional[dict]:
+        return self.sections.get(section_id.strip().upper())
+
+    def get(self, code: str) -> Optional[dict]:
+        i = self.by_code.get(_code_key(code))
+        return self.items[i] if i is not None else None
+
+    def _code_prefix(self, prefix: str) -> List[int]:
+        start = bisect_left(self._code_keys, prefix)
+        found = []
+        for key, i in self._codes[start:]:
+            if not key.startswith(prefix):
+                break
+            found.append(i)
+        return found
+
+    def _word_prefix(self, prefix: str) -> List[int]:
+        """Номери слів словника, що починаються з prefix."""
+        start = bisect_left(self._words, prefix)
+        end = start
+        while end < len(self._words) and self._words[end].startswith(prefix):
+            end += 1
+        return list(range(start, end))
+
+    def _fuzzy_words(self, word: str) -> List[Tuple[int, float]]:
+        """Слова словника, схожі на word за триграмами (коефіцієнт Дайса)."""
+        grams = _trigrams(word)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for w in self._trigram_postings.get(gram, ()):
+                shared[w] += 1
+        found = []
+        for w, count in shared.items():
+            similarity = 2 * count / (len(grams) + len(self._word_trigrams[w]))
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                found.append((w, similarity))
+        return found
+
+    def _score_word(self, word: str) -> Dict[int, float]:
+        """Бали видів діяльності за одним словом запиту: точне слово > префікс > схоже слово."""
+        scores: Dict[int, float] = {}
+        matches = self._word_prefix(word)
+        if matches:
+            for w in matches:
+                weight = 1.0 if self._words[w] == word else 0.6 + 0.3 * len(word) / len(self._words[w])
+                for i in self._postings[w]:
+                    if weight > scores.get(i, 0.0):
+                        scores[i] = weight
+        elif len(word) >= FUZZY_MIN_LENGTH:
+            for w, similarity in self._fuzzy_words(word):
+                weight = 0.5 * similarity
+                for i in self._postings[w]:
+                    if weight > scores.get(i, 0.0):
+                        scores[i] = weight
+        return scores
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[dict]:
+        """
+        Ранжований пошук за кодом або назвою.
+        Код (або його початок) — лише коди; інакше кожне слово запиту має знайтися в назві
+        (точно, як префікс або з опечаткою), вище — точні збіги і збіг першого слова.
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if _CODE_RE.match(query):
+            key = _code_key(query)
+            hits = self._code_prefix(key)
+            exact = self.by_code.get(key)
+            # Точний код першим, далі — за порядком кодів
+            ranked = sorted(hits, key=lambda i: i != exact)
+            return [{**self.items[i], "score": 1.0 if i == exact else 0.9} for i in ranked[:limit]]
+
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return []
+        # Слова з помилковою розкладкою (латинські "i", "o" тощо) — як кирилиця
+        words = [w if self._word_prefix(w) else w.translate(_LOOKALIKES) for w in words]
+
+        totals: Optional[Dict[int, float]] = None
+        # Спершу найрідкісніше слово — перетин множин звужується якнайшвидше
+        for scores in sorted((self._score_word(w) for w in words), key=len):
+            if totals is None:
+                totals = scores
+            else:
+                totals = {i: totals[i] + s for i, s in scores.items() if i in totals}
+            if not totals:
+                return []
+
+        first = words[0]
+        ranked = []
+        for i, total in totals.items():
+            score = total / len(words)
+            if self._first_words[i].startswith(first):
+                score += 0.1
+            ranked.append((-score, self._name_lengths[i], self.items[i]["code"], i, score))
+        ranked.sort()
+        return [{**self.items[i], "score": round(min(score, 1.0), 3)} for *_, i, score in ranked[:limit]]
+
+
+def load_sections(path: str) -> List[dict]:
+    if os.path.isdir(path):
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        sections = []
+        for entry in manifest["sections"]:
+            with open(os.path.join(path, entry["file"]), encoding="utf-8") as f:
+                sections.append(json.load(f))
+        return sections
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if not path.endswith(".json"):
+        # JS-модуль: беремо масив між "=" і завершальною ";"
+        text = text[text.index("=") + 1:].strip().rstrip(";")
+    return json.loads(text)
+
+
+_index: Optional[KvedIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_kved_index() -> KvedIndex:
+    """
+    Індекс будується один раз на процес — під час старту застосунку (main.lifespan),
+    тож відсутній або порожній класифікатор зупиняє старт, а не перший запит.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = KvedIndex(load_sections(KVED_SOURCE_PATH))
+                if not len(index):
+                    raise ValueError(f"Класифікатор КВЕД порожній: {KVED_SOURCE_PATH}")
+                _index = index
+    return _index
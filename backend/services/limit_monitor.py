@@ -0,0 +1,104 @@
+import asyncio
+from datetime import date
+from typing import Dict, List, Optional
+
+from models.common import FopGroup
+from core.tax_rules import tax_rules
+from services.tax_service import TaxService
+from services.user_cache import get_fop_settings
+from services.rollup_service import rollup_store, get_year_income, invalidate_user, ledger_year_income
+
+# Пороги ліміту доходу групи: та сама логіка, що в TaxService.get_warnings / verify_group_restrictions
+APPROACHING = "LIMIT_APPROACHING"   # дохід >= 90% ліміту
+EXCEEDED = "LIMIT_EXCEEDED"         # дохід > ліміту
+APPROACHING_SHARE = 0.9
+
+
+def _levels_reached(income: float, limit: float) -> List[str]:
+    levels = []
+    if income >= limit * APPROACHING_SHARE:
+        levels.append(APPROACHING)
+    if income > limit:
+        levels.append(EXCEEDED)
+    return levels
+
+
+def _year_limit(fop_group: Optional[FopGroup], year: int) -> float:
+    # Ліміти фіксуються на 1 січня податкового року
+    return tax_rules.for_date(date(year, 1, 1)).limit_for(fop_group)
+
+
+async def check_limits(user_id: str, year_deltas: Dict[int, float]) -> List[Dict]:
+    """
+    Викликається після запису транзакцій з результатом record_rows (з нього беруться лише роки).
+    Рівні ліміту, досягнуті доходом року, порівнюються із зафіксованими позначками, а не
+    обчислюються з "доходу до запису": так перетин не губиться і не повторюється, якщо
+    лічильник розійшовся з журналом або два записи прийшли одночасно.
+    Коли рівні змінюються, дохід перераховується з журналу: новий перетин вгору повертається
+    (і зберігається один раз), повернення нижче порогу знімає позначку.
+    Помилка тут не має ламати запис — повертаємо порожній список.
+    """
+    if not year_deltas:
+        return []
+
+    try:
+        settings = await get_fop_settings(user_id)
+        if not settings or not settings.fop_group:
+            return []
+
+        crossed = []
+        for year in sorted(year_deltas):
+            limit = _year_limit(settings.fop_group, year)
+            if limit <= 0:
+                continue
+
+            # Лічильник — швидка перевірка: поки рівні не змінились, журнал не читаємо
+            counted = await get_year_income(user_id, year)
+            stored = {alert["level"] for alert in await asyncio.to_thread(rollup_store.alerts, user_id, year)}
+            if set(_levels_reached(counted, limit)) == stored:
+                continue
+
+            income = await ledger_year_income(user_id, year)
+            if abs(income - counted) >= 0.01:
+                print(f"Rollup income mismatch for {user_id}/{year}: counter {counted}, ledger {income}")
+                await invalidate_user(user_id)
+
+            reached = _levels_reached(income, limit)
+            for level in reached:
+                if level not in stored:
+                    alert = await asyncio.to_thread(rollup_store.set_alert, user_id, year, level, income, limit)
+                    if alert:
+                        crossed.append(alert)
+            for level in stored - set(reached):
+                await asyncio.to_thread(rollup_store.clear_alert, user_id, year, level)
+        return crossed
+    except Exception as e:
+        print(f"Limit check error: {e}")
+        return []
+
+
+async def get_limit_status(user_id: str, year: Optional[int] = None) -> Optional[Dict]:
+    """
+    Стан ліміту за податковий рік з лічильника доходу (без сканування журналу):
+    дохід, ліміт групи, використана частка, попередження, порушення і зафіксовані перетини.
+    None — якщо в користувача немає налаштувань ФОП.
+    """
+    year = year or date.today().year
+    settings = await get_fop_settings(user_id)
+    if not settings:
+        return None
+
+    income = await get_year_income(user_id, year)
+    # Правила на кінець минулого року, для поточного — на сьогодні
+    on_date = date(year, 12, 31) if year < date.today().year else max(date.today(), date(year, 1, 1))
+    limit = _year_limit(settings.fop_group, year)
+
+    return {
+        "year": year,
+        "income": income,
+        "limit": limit or None,
+        "used_share": round(income / limit, 4) if limit else None,
+        "warnings": TaxService.get_warnings(settings, income, on_date),
+        "errors": TaxService.verify_group_restrictions(settings, income, on_date),
+        "alerts": await asyncio.to_thread(rollup_store.alerts, user_id, year)
+    }
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from datetime import date as date_type
+from typing import Dict, Optional, Tuple
+
+import httpx
+from core.metrics import DependencyTransport
+
+NBU_EXCHANGE_URL = "https://bank.gov.ua/NBUStatService/v1/statdirectory/exchange"
+
+
+class CircuitOpenError(Exception):
+    """НБУ недоступний: запит відхилено без звернення до API."""
+
+
+class CircuitBreaker:
+    """
+    Простий запобіжник: після N помилок поспіль "розмикається" на reset_timeout секунд
+    і одразу відхиляє запити. Після паузи пропускає один пробний запит (half-open).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def acquire(self) -> Tuple[bool, bool]:
+        """
+        (дозволено, пробний). Пробний запит у half-open — лише один; той, хто його отримав,
+        і тільки він, завершує його через record_success / record_failure(probe=True) або release_probe.
+        """
+        state = self.state
+        if state == "closed":
+            return True, False
+        if state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True, True
+        return False, False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self, probe: bool = False) -> None:
+        self.failures += 1
+        if probe:
+            self._probe_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """
+        Знімає позначку пробного запиту, якщо він завершився без результату
+        (напр. скасований CancelledError) — інакше half-open заблокувався б назавжди.
+        Викликає лише власник проби (acquire повернув пробний = True).
+        """
+        self._probe_in_flight = False
+
+
+class NbuClient:
+    """
+    Асинхронний клієнт НБУ:
+    - один httpx.AsyncClient з пулом з'єднань (без нового TLS-рукостискання на кожен запит);
+    - одночасні запити на ту саму дату зливаються в один виклик НБУ;
+    - circuit breaker, щоб під час збою НБУ не тримати запити по 5 секунд.
+    """
+
+    def __init__(
+        self,
+        base_url: str = NBU_EXCHANGE_URL,
+        timeout: float = 5.0,
+        max_connections: int = 10,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.breaker = breaker or CircuitBreaker()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[date_type, asyncio.Task] = {}
+
+        self.requests_made = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=DependencyTransport(
+                    "nbu",
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                ),
+            )
+        return self._client
+
+    async def _request_day(self, date_val: date_type) -> Dict[str, float]:
+        allowed, probe = self.breaker.acquire()
+        if not allowed:
+            self.rejected += 1
+            raise CircuitOpenError("НБУ тимчасово недоступний")
+
+        self.requests_made += 1
+        try:
+            response = await self._get_client().get(
+                self.base_url, params={"date": date_val.strftime("%Y%m%d"), "json": ""}
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception:
+            self.breaker.record_failure(probe)
+            raise
+        finally:
+            # CancelledError — не Exception: пробний запит має звільнитись і тоді.
+            # Звичайний запит, початий ще в замкненому стані, чужу пробу не чіпає
+            if probe:
+                self.breaker.release_probe()
+
+        self.breaker.record_success()
+        return {item['cc']: float(item['rate']) for item in data if item.get('cc') and item.get('rate')}
+
+    async def fetch_day(self, date_val: date_type) -> Dict[str, float]:
+        """
+        Курси всіх валют на дату. Якщо запит на цю дату вже виконується —
+        чекаємо на його результат замість нового звернення до НБУ.
+        Запит іде окремою задачею: скасування одного з тих, хто чекає
+        (клієнт закрив з'єднання), не скасовує його для інших.
+        """
+        task = self._inflight.get(date_val)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.get_running_loop().create_task(self._request_day(date_val))
+            self._inflight[date_val] = task
+            task.add_done_callback(lambda t, d=date_val: self._request_done(d, t))
+        return await asyncio.shield(task)
+
+    def _request_done(self, date_val: date_type, task: asyncio.Task) -> None:
+        if self._inflight.get(date_val) is task:
+            del self._inflight[date_val]
+        # Позначаємо виняток як отриманий, якщо всі, хто чекав, уже пішли
+        if not task.cancelled():
+            task.exception()
+
+    async def aclose(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict:
+        return {
+            "circuit_state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "requests_made": self.requests_made,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "in_flight": len(self._inflight),
+        }
+
+
+# Один клієнт (і пул з'єднань) на процес
+nbu_client = NbuClient()
@@ -1,23 +1,129 @@
-import requests
-from datetime import date as date_type
+import argparse
+import asyncio
+from datetime import date as date_type, timedelta
+from typing import Dict
+from services.rate_cache import rate_cache
+from services.nbu_client import nbu_client
 
-def get_nbu_rate(currency_code: str, date_val: date_type) -> float:
+# Скільки дат одночасно тягнемо з НБУ під час прогріву
+PREFETCH_CONCURRENCY = 4
+
+async def fetch_all_rates(date_val: date_type) -> Dict[str, float]:
+    """
+    Тягне з НБУ курси ВСІХ валют на дату одним запитом (без valcode).
+    Повертає словник {"USD": 41.5, "EUR": 44.9, ...}; порожній — якщо курс ще не опубліковано.
+    """
+    return await nbu_client.fetch_day(date_val)
+
+async def prefetch_rates(date_val: date_type, force: bool = False) -> int:
+    """
+    Завантажує в кеш усі курси на дату. Повертає кількість збережених валют
+    (0 — якщо дата вже була в кеші або курс ще не опубліковано).
+    """
+    if not force and await asyncio.to_thread(rate_cache.is_day_loaded, date_val):
+        return 0
+
+    rates = await fetch_all_rates(date_val)
+    if rates:
+        await asyncio.to_thread(rate_cache.set_day, date_val, rates)
+    return len(rates)
+
+async def prefetch_range(start_date: date_type, end_date: date_type, force: bool = False) -> Dict:
+    """
+    Прогріває кеш за період: один запит до НБУ на кожну ще не завантажену дату.
+    """
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    pending = days if force else await asyncio.to_thread(
+        lambda: [d for d in days if not rate_cache.is_day_loaded(d)]
+    )
+    semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def load(day: date_type) -> int:
+        async with semaphore:
+            return await prefetch_rates(day, force=True)
+
+    results = await asyncio.gather(*(load(d) for d in pending), return_exceptions=True)
+
+    failed_days = []
+    stored = 0
+    for day, result in zip(pending, results):
+        if isinstance(result, Exception):
+            print(f"НБУ prefetch error ({day}): {result}")
+            failed_days.append(day.isoformat())
+        else:
+            stored += result
+
+    return {
+        "fetched_days": len(pending) - len(failed_days),
+        "skipped_days": len(days) - len(pending),
+        "failed_days": failed_days,
+        "stored_rates": stored
+    }
+
+async def warmup_recent_days(days: int) -> Dict:
+    """Прогріває кеш за останні N днів (включно з сьогоднішнім)."""
+    today = date_type.today()
+    return await prefetch_range(today - timedelta(days=max(days, 1) - 1), today)
+
+async def get_nbu_rate(currency_code: str, date_val: date_type) -> float:
     """
     Отримує офіційний курс НБУ на дату.
-    Повертає 0.0, якщо сталася помилка або курс не знайдено.
+    Спочатку шукає в кеші (пам'ять + диск), до НБУ йде тільки при промаху.
+    SQLite читається і пишеться в пулі потоків — event loop чекає лише на пам'ять.
+    При промаху завантажує одразу всі валюти на цю дату — наступні USD/EUR/PLN
+    за той самий день уже не потребують запитів.
+    Повертає 0.0, якщо сталася помилка, НБУ недоступний або курс не знайдено.
     """
     if currency_code == "UAH":
         return 1.0
-        
-    date_str = date_val.strftime("%Y%m%d") # Формат YYYYMMDD
-    api_url = f"https://bank.gov.ua/NBUStatService/v1/statdirectory/exchange?valcode={currency_code}&date={date_str}&json"
-    
+
+    cached = rate_cache.peek(currency_code, date_val)
+    if cached is not None:
+        return cached
+
+    def from_disk():
+        return rate_cache.get(currency_code, date_val), rate_cache.is_day_loaded(date_val)
+
+    cached, day_loaded = await asyncio.to_thread(from_disk)
+    if cached is not None:
+        return cached
+    if day_loaded:
+        # Довідник на дату вже повний — такої валюти НБУ не публікує
+        return 0.0
+
     try:
-        response = requests.get(api_url, timeout=5)
-        data = response.json()
-        if not data:
-            return 0.0
-        return float(data[0]['rate'])
+        rates = await fetch_all_rates(date_val)
+        # Кешуємо тільки успішні відповіді: порожня відповідь може означати, що курс ще не опубліковано
+        if rates:
+            await asyncio.to_thread(rate_cache.set_day, date_val, rates)
+        return rates.get(currency_code, 0.0)
     except Exception as e:
         print(f"НБУ Error: {e}")
-        return 0.0
\ No newline at end of file
+        return 0.0
+
+def get_rate_cache_stats() -> dict:
+    """Лічильники влучань/промахів кешу курсів."""
+    return rate_cache.stats()
+
+def get_nbu_client_stats() -> dict:
+    """Стан з'єднання з НБУ: circuit breaker, злиті та відхилені запити."""
+    return nbu_client.stats()
+
+async def _run_cli(args) -> Dict:
+    try:
+        if args.start:
+            return await prefetch_range(args.start, args.end or date_type.today(), force=args.force)
+        return await warmup_recent_days(args.days)
+    finally:
+        await nbu_client.aclose()
+
+if __name__ == "__main__":
+    # Запуск з папки backend:
+    #   python -m services.nbu_service --days 30
+    #   python -m services.nbu_service --start 2024-01-01 --end 2024-12-31
+    parser = argparse.ArgumentParser(description="Прогрів кешу курсів НБУ")
+    parser.add_argument("--days", type=int, default=30, help="Скільки останніх днів завантажити")
+    parser.add_argument("--start", type=date_type.fromisoformat, help="Початок періоду (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date_type.fromisoformat, help="Кінець періоду (YYYY-MM-DD)")
+    parser.add_argument("--force", action="store_true", help="Перезавантажити навіть уже збережені дати")
+    print(asyncio.run(_run_cli(parser.parse_args())))
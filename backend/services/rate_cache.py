@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import date as date_type
+from typing import Dict, Iterable, Optional, Tuple
+
+# Файл зі збереженими курсами лежить поруч з бекендом (backend/data/nbu_rates.sqlite3)
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "nbu_rates.sqlite3")
+DEFAULT_MEMORY_SIZE = 4096
+
+
+class RateCache:
+    """
+    Кеш курсів НБУ: LRU в пам'яті + SQLite на диску.
+    Офіційний курс на дату після публікації не змінюється,
+    тому записи ніколи не застарівають і не перезапитуються.
+    Методи синхронні: усе, крім peek(), може звертатися до диска,
+    тому nbu_service викликає їх у пулі потоків, а не в event loop.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, memory_size: int = DEFAULT_MEMORY_SIZE):
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Викликається тільки під self._lock
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS nbu_rates (
+                    currency_code TEXT NOT NULL,
+                    rate_date TEXT NOT NULL,
+                    rate REAL NOT NULL,
+                    PRIMARY KEY (currency_code, rate_date)
+                )
+                """
+            )
+            # Дати, для яких уже завантажено повний довідник (усі валюти)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS nbu_loaded_dates (
+                    rate_date TEXT PRIMARY KEY
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: Tuple[str, str], rate: float) -> None:
+        self._memory[key] = rate
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def peek(self, currency_code: str, date_val: date_type) -> Optional[float]:
+        """
+        Курс лише з пам'яті (без звернення до диска) — безпечно викликати з event loop.
+        None — курсу немає в LRU; тоді get() варто виконати в пулі потоків.
+        """
+        key = (currency_code, date_val.isoformat())
+        with self._lock:
+            rate = self._memory.get(key)
+            if rate is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            return rate
+
+    def get(self, currency_code: str, date_val: date_type) -> Optional[float]:
+        """
+        Повертає збережений курс або None, якщо його ще немає.
+        Може читати SQLite — з асинхронного коду викликати через asyncio.to_thread.
+        """
+        key = (currency_code, date_val.isoformat())
+        with self._lock:
+            rate = self._memory.get(key)
+            if rate is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return rate
+
+            row = self._connection().execute(
+                "SELECT rate FROM nbu_rates WHERE currency_code = ? AND rate_date = ?", key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.disk_hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, currency_code: str, date_val: date_type, rate: float) -> None:
+        self.set_many([(currency_code, date_val, rate)])
+
+    def set_many(self, items: Iterable[Tuple[str, date_type, float]]) -> None:
+        """Зберігає пачку курсів однією транзакцією SQLite."""
+        rows = [(code, d.isoformat(), float(rate)) for code, d, rate in items if rate and rate > 0]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO nbu_rates (currency_code, rate_date, rate) VALUES (?, ?, ?)", rows
+            )
+            conn.commit()
+            for code, d, rate in rows:
+                self._remember((code, d), rate)
+            self.writes += len(rows)
+
+    def set_day(self, date_val: date_type, rates: Dict[str, float]) -> None:
+        """Зберігає всі курси на дату і позначає дату як повністю завантажену."""
+        self.set_many((code, date_val, rate) for code, rate in rates.items())
+        with self._lock:
+            conn = self._connection()
+            conn.execute("INSERT OR IGNORE INTO nbu_loaded_dates (rate_date) VALUES (?)", (date_val.isoformat(),))
+            conn.commit()
+
+    def is_day_loaded(self, date_val: date_type) -> bool:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM nbu_loaded_dates WHERE rate_date = ?", (date_val.isoformat(),)
+            ).fetchone()
+            return row is not None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            conn = self._connection()
+            stored = conn.execute("SELECT COUNT(*) FROM nbu_rates").fetchone()[0]
+            loaded_days = conn.execute("SELECT COUNT(*) FROM nbu_loaded_dates").fetchone()[0]
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+                "writes": self.writes,
+                "memory_entries": len(self._memory),
+                "stored_entries": stored,
+                "loaded_days": loaded_days,
+            }
+
+
+# Один кеш на процес
+rate_cache = RateCache(
+    db_path=os.environ.get("NBU_RATE_CACHE_PATH", DEFAULT_DB_PATH),
+    memory_size=int(os.environ.get("NBU_RATE_CACHE_SIZE", DEFAULT_MEMORY_SIZE)),
+)
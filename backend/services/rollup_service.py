@@ -0,0 +1,622 @@
+import argparse
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from datetime import date as date_type, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.database import close_db
+from core.metrics import timed
+from repositories import transactions as transactions_repo, profiles as profiles_repo
+from services.analytics_service import invalidate_analytics
+
+# Локальне сховище агрегатів лежить поруч з кешем курсів (backend/data/rollups.sqlite3)
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "rollups.sqlite3")
+
+# Розмір сторінки при скануванні журналу (PostgREST за замовчуванням віддає не більше 1000 рядків)
+LEDGER_PAGE_SIZE = 1000
+
+# Через скільки секунд агрегати користувача перебудовуються з журналу при наступному читанні.
+# Сховище локальне для вузла: записи через інші екземпляри API або в обхід API
+# стають видимими не пізніше ніж через цей час (0 — ніколи, лише для одного екземпляра)
+ROLLUP_MAX_AGE = float(os.environ.get("ROLLUP_MAX_AGE", "3600"))
+
+# (дата 'YYYY-MM-DD', тип, сума в гривні, зміна кількості: +1 / -1)
+RollupDelta = Tuple[str, str, float, int]
+# Стан рядка журналу, з якого складаються агрегати: (дата 'YYYY-MM-DD', тип, сума в гривні)
+RowState = Tuple[str, str, float]
+# Зміна рядка журналу: (transaction_id, новий стан або None, якщо рядок видалено)
+RowChange = Tuple[str, Optional[RowState]]
+
+LEDGER_COLUMNS = "transaction_id, transaction_amount, transaction_type, transaction_date"
+
+
+def row_state(row: dict) -> Optional[RowState]:
+    if not row or not row.get("transaction_date") or row.get("transaction_amount") is None:
+        return None
+    return (str(row["transaction_date"])[:10], row["transaction_type"], float(row["transaction_amount"]))
+
+
+def deltas_for_rows(rows: Iterable[dict], sign: int = 1) -> List[RollupDelta]:
+    """
+    Перетворює рядки таблиці transactions на зміни агрегатів.
+    sign=1 — рядки додано, sign=-1 — рядки видалено.
+    """
+    deltas = []
+    for row in rows:
+        state = row_state(row)
+        if state:
+            deltas.append((state[0], state[1], sign * state[2], sign))
+    return deltas
+
+
+def changes_for_rows(removed: Iterable[dict] = (), inserted: Iterable[dict] = ()) -> Optional[List[RowChange]]:
+    """
+    Зміни рядків журналу за transaction_id: спершу видалені (старі версії), потім нові.
+    None — якщо в рядках бракує колонок для агрегатів (тоді агрегати треба перебудувати).
+    """
+    changes: List[RowChange] = []
+    for row in removed:
+        if not row or not row.get("transaction_id"):
+            return None
+        changes.append((row["transaction_id"], None))
+    for row in inserted:
+        state = row_state(row)
+        if not row or not row.get("transaction_id") or state is None:
+            return None
+        changes.append((row["transaction_id"], state))
+    return changes
+
+
+def income_by_year(deltas: Iterable[RollupDelta]) -> Dict[int, float]:
+    """Зміна доходу (тільки income) по податкових роках."""
+    years: Dict[int, float] = {}
+    for date_str, tx_type, amount, _ in deltas:
+        if tx_type == "income":
+            year = int(date_str[:4])
+            years[year] = years.get(year, 0.0) + amount
+    return years
+
+
+class RollupStore:
+    """
+    Помісячні агрегати доходів/витрат по кожному користувачу (SQLite).
+    Всередині місяця зберігаються денні кошики, щоб відповідати на запит
+    з end_date посеред місяця без сканування журналу.
+    Оновлюється інкрементально при створенні/зміні/видаленні транзакцій.
+    Окремо ведеться лічильник доходу за податковий рік (income_by_year) —
+    в тій самій SQLite-транзакції, що й кошики, — щоб перевірка лімітів групи
+    була одним читанням за первинним ключем.
+
+    Поруч зберігається вузька копія журналу (rollup_ledger: id, дата, тип, сума),
+    тож зміни застосовуються за transaction_id ідемпотентно: повторений запис
+    або запис, який уже побачила побудова, не рахується двічі.
+    Сховище — файл SQLite на вузлі; розбіжність з журналом (інші екземпляри API,
+    записи в обхід API) обмежена ROLLUP_MAX_AGE.
+    Методи синхронні й читають диск — з асинхронного коду їх викликають через asyncio.to_thread.
+    """
+
+    # Версія схеми: агрегати, побудовані без копії журналу, перебудовуються
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # user_id -> час побудови (epoch); знімок rollup_users, щоб не читати диск на кожен запит
+        self._built_at: Dict[str, float] = {}
+
+        self.hits = 0
+        self.builds = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Викликається тільки під self._lock
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS transaction_rollups (
+                    user_id TEXT NOT NULL,
+                    month TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    income REAL NOT NULL DEFAULT 0,
+                    expense REAL NOT NULL DEFAULT 0,
+                    tx_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, month, day)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS income_by_year (
+                    user_id TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    income REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, year)
+                )
+                """
+            )
+            # Перетини порогів ліміту групи (90% і 100%), зафіксовані в момент запису
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS limit_alerts (
+                    user_id TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    level TEXT NOT NULL,
+                    income REAL NOT NULL,
+                    limit_value REAL NOT NULL,
+                    crossed_at TEXT NOT NULL,
+                    PRIMARY KEY (user_id, year, level)
+                )
+                """
+            )
+            # Користувачі, для яких агрегати вже побудовано з журналу
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rollup_users (
+                    user_id TEXT PRIMARY KEY,
+                    built_at TEXT NOT NULL
+                )
+                """
+            )
+            # Рядки журналу, враховані в агрегатах
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rollup_ledger (
+                    user_id TEXT NOT NULL,
+                    transaction_id TEXT NOT NULL,
+                    transaction_date TEXT NOT NULL,
+                    transaction_type TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    PRIMARY KEY (user_id, transaction_id)
+                )
+                """
+            )
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.SCHEMA_VERSION:
+                self._conn.execute("DELETE FROM rollup_users")
+                self._conn.execute("DELETE FROM transaction_rollups")
+                self._conn.execute("DELETE FROM income_by_year")
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _bucket_rows(user_id: str, deltas: Iterable[RollupDelta]) -> List[tuple]:
+        buckets: Dict[Tuple[str, int], List[float]] = {}
+        for date_str, tx_type, amount, count in deltas:
+            key = (date_str[:7], int(date_str[8:10]))
+            bucket = buckets.setdefault(key, [0.0, 0.0, 0])
+            if tx_type == "income":
+                bucket[0] += amount
+            else:
+                bucket[1] += amount
+            bucket[2] += count
+        return [(user_id, month, day, inc, exp, cnt) for (month, day), (inc, exp, cnt) in buckets.items()]
+
+    def cached_built_at(self, user_id: str) -> Optional[float]:
+        """Час побудови з пам'яті (без диска); None — невідомо, треба built_at()."""
+        return self._built_at.get(user_id)
+
+    def built_at(self, user_id: str) -> Optional[float]:
+        """Коли агрегати користувача побудовано з журналу (epoch) або None."""
+        with self._lock:
+            return self._read_built_at(self._connection(), user_id)
+
+    def _read_built_at(self, conn: sqlite3.Connection, user_id: str) -> Optional[float]:
+        # Викликається тільки під self._lock
+        if user_id in self._built_at:
+            return self._built_at[user_id]
+        row = conn.execute("SELECT built_at FROM rollup_users WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            return None
+        self._built_at[user_id] = datetime.fromisoformat(row[0]).timestamp()
+        return self._built_at[user_id]
+
+    @staticmethod
+    def _year_rows(user_id: str, deltas: Iterable[RollupDelta]) -> List[tuple]:
+        return [(user_id, year, income) for year, income in income_by_year(deltas).items()]
+
+    def _add(self, conn: sqlite3.Connection, user_id: str, deltas: List[RollupDelta]) -> None:
+        # Викликається тільки під self._lock, у транзакції виклику
+        conn.executemany(
+            """
+            INSERT INTO transaction_rollups (user_id, month, day, income, expense, tx_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, month, day) DO UPDATE SET
+                income = income + excluded.income,
+                expense = expense + excluded.expense,
+                tx_count = tx_count + excluded.tx_count
+            """,
+            self._bucket_rows(user_id, deltas),
+        )
+        conn.execute("DELETE FROM transaction_rollups WHERE user_id = ? AND tx_count <= 0", (user_id,))
+        conn.executemany(
+            """
+            INSERT INTO income_by_year (user_id, year, income) VALUES (?, ?, ?)
+            ON CONFLICT (user_id, year) DO UPDATE SET income = income + excluded.income
+            """,
+            self._year_rows(user_id, deltas),
+        )
+
+    def apply(self, user_id: str, changes: Iterable[RowChange]) -> Optional[List[RollupDelta]]:
+        """
+        Застосовує зміни рядків журналу (за transaction_id) до копії журналу й агрегатів
+        однією SQLite-транзакцією. Рядок, чий стан уже врахований, нічого не змінює.
+        Повертає фактичні зміни агрегатів або None, якщо агрегати користувача ще не побудовано
+        (перша побудова прочитає актуальний журнал).
+        """
+        changes = list(changes)
+        with self._lock:
+            conn = self._connection()
+            if self._read_built_at(conn, user_id) is None:
+                return None
+            deltas: List[RollupDelta] = []
+            for transaction_id, state in changes:
+                old = conn.execute(
+                    "SELECT transaction_date, transaction_type, amount FROM rollup_ledger WHERE user_id = ? AND transaction_id = ?",
+                    (user_id, transaction_id),
+                ).fetchone()
+                if old == state:
+                    continue
+                if old is not None:
+                    deltas.append((old[0], old[1], -old[2], -1))
+                if state is None:
+                    conn.execute(
+                        "DELETE FROM rollup_ledger WHERE user_id = ? AND transaction_id = ?", (user_id, transaction_id)
+                    )
+                else:
+                    deltas.append((state[0], state[1], state[2], 1))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO rollup_ledger (user_id, transaction_id, transaction_date, transaction_type, amount) VALUES (?, ?, ?, ?, ?)",
+                        (user_id, transaction_id) + state,
+                    )
+            if deltas:
+                self._add(conn, user_id, deltas)
+            conn.commit()
+        return deltas
+
+    def replace(self, user_id: str, rows: Dict[str, RowState]) -> None:
+        """Повністю перезаписує агрегати користувача знімком журналу (побудова / rebuild)."""
+        deltas = [(state[0], state[1], state[2], 1) for state in rows.values()]
+        built_at = datetime.now(timezone.utc)
+        with self._lock:
+            conn = self._connection()
+            for table in ("transaction_rollups", "income_by_year", "rollup_ledger"):
+                conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+            conn.executemany(
+                "INSERT INTO rollup_ledger (user_id, transaction_id, transaction_date, transaction_type, amount) VALUES (?, ?, ?, ?, ?)",
+                [(user_id, transaction_id) + state for transaction_id, state in rows.items()],
+            )
+            conn.executemany(
+                "INSERT INTO transaction_rollups (user_id, month, day, income, expense, tx_count) VALUES (?, ?, ?, ?, ?, ?)",
+                self._bucket_rows(user_id, deltas),
+            )
+            conn.executemany(
+                "INSERT INTO income_by_year (user_id, year, income) VALUES (?, ?, ?)",
+                self._year_rows(user_id, deltas),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO rollup_users (user_id, built_at) VALUES (?, ?)",
+                (user_id, built_at.isoformat()),
+            )
+            conn.commit()
+            self._built_at[user_id] = built_at.timestamp()
+            self.builds += 1
+
+    def invalidate(self, user_id: str) -> None:
+        """Скидає агрегати користувача: наступне читання перебудує їх з журналу."""
+        with self._lock:
+            conn = self._connection()
+            for table in ("rollup_users", "transaction_rollups", "income_by_year", "rollup_ledger"):
+                conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+            conn.commit()
+            self._built_at.pop(user_id, None)
+
+    def summary(self, user_id: str, end_date: Optional[date_type] = None) -> Dict:
+        """
+        Сума доходів/витрат і кількість місяців з транзакціями (від початку часів до end_date).
+        Читає лише агрегати: O(кількість місяців), а не O(кількість транзакцій).
+        """
+        query = """
+            SELECT COALESCE(SUM(income), 0), COALESCE(SUM(expense), 0), COUNT(DISTINCT month)
+            FROM transaction_rollups
+            WHERE user_id = ? AND tx_count > 0
+        """
+        params: list = [user_id]
+        if end_date:
+            end_month = end_date.isoformat()[:7]
+            query += " AND (month < ? OR (month = ? AND day <= ?))"
+            params += [end_month, end_month, end_date.day]
+
+        with self._lock:
+            income, expense, months = self._connection().execute(query, params).fetchone()
+            self.hits += 1
+
+        return {
+            "totalIncome": round(income, 2),
+            "totalExpense": round(expense, 2),
+            "balance": round(income - expense, 2),
+            "monthsCount": months
+        }
+
+    def income_totals(self, user_id: str, as_of: date_type) -> Dict:
+        """
+        Дохід (тільки income) за поточний місяць, квартал і рік до дати as_of включно —
+        один агрегуючий запит по денних кошиках поточного року.
+        """
+        year_start = f"{as_of.year}-01"
+        quarter_start = f"{as_of.year}-{(as_of.month - 1) // 3 * 3 + 1:02d}"
+        current_month = as_of.isoformat()[:7]
+
+        with self._lock:
+            ytd, quarter, month = self._connection().execute(
+                """
+                SELECT
+                    COALESCE(SUM(income), 0),
+                    COALESCE(SUM(CASE WHEN month >= ? THEN income ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN month = ? THEN income ELSE 0 END), 0)
+                FROM transaction_rollups
+                WHERE user_id = ? AND tx_count > 0
+                  AND month >= ? AND (month < ? OR (month = ? AND day <= ?))
+                """,
+                (quarter_start, current_month, user_id, year_start, current_month, current_month, as_of.day),
+            ).fetchone()
+            self.hits += 1
+
+        return {
+            "as_of": as_of.isoformat(),
+            "month": round(month, 2),
+            "quarter": round(quarter, 2),
+            "year_to_date": round(ytd, 2)
+        }
+
+    def year_income(self, user_id: str, year: int) -> float:
+        """Дохід за податковий рік — одне читання за первинним ключем."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT income FROM income_by_year WHERE user_id = ? AND year = ?", (user_id, year)
+            ).fetchone()
+            self.hits += 1
+        return round(row[0], 2) if row else 0.0
+
+    def set_alert(self, user_id: str, year: int, level: str, income: float, limit_value: float) -> Optional[Dict]:
+        """
+        Фіксує перетин порогу. Повертає позначку, лише якщо її ще не було:
+        з двох одночасних записів про той самий перетин повідомить тільки один.
+        """
+        crossed_at = datetime.utcnow().isoformat()
+        with self._lock:
+            conn = self._connection()
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO limit_alerts (user_id, year, level, income, limit_value, crossed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (user_id, year, level, income, limit_value, crossed_at),
+            ).rowcount
+            conn.commit()
+        if not inserted:
+            return None
+        return {"year": year, "level": level, "income": income, "limit": limit_value, "crossed_at": crossed_at}
+
+    def clear_alert(self, user_id: str, year: int, level: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM limit_alerts WHERE user_id = ? AND year = ? AND level = ?", (user_id, year, level))
+            conn.commit()
+
+    def alerts(self, user_id: str, year: int) -> List[Dict]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT level, income, limit_value, crossed_at FROM limit_alerts WHERE user_id = ? AND year = ? ORDER BY crossed_at",
+                (user_id, year),
+            ).fetchall()
+        return [
+            {"year": year, "level": level, "income": income, "limit": limit_value, "crossed_at": crossed_at}
+            for level, income, limit_value, crossed_at in rows
+        ]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            conn = self._connection()
+            users = conn.execute("SELECT COUNT(*) FROM rollup_users").fetchone()[0]
+            buckets = conn.execute("SELECT COUNT(*) FROM transaction_rollups").fetchone()[0]
+            return {"summary_reads": self.hits, "builds": self.builds, "users": users, "buckets": buckets}
+
+
+# Одне сховище на процес
+rollup_store = RollupStore(db_path=os.environ.get("ROLLUP_STORE_PATH", DEFAULT_DB_PATH))
+
+
+# Побудови агрегатів: один замок на користувача, щоб паралельні ensure_built / rebuild
+# не сканували журнал одночасно і не перезаписували одна одну
+_build_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+# Зміни, записані поки йде побудова: після сканування вони накладаються на знімок,
+# інакше запис, який сканування вже пропустило, загубився б у replace()
+_pending: Dict[str, List[RowChange]] = {}
+# Номер побудови користувача: зростає з кожною побудовою та скиданням агрегатів
+_generation: Dict[str, int] = {}
+
+
+def _build_lock(user_id: str) -> asyncio.Lock:
+    lock = _build_locks.get(user_id)
+    if lock is None:
+        lock = _build_locks[user_id] = asyncio.Lock()
+    return lock
+
+
+def generation(user_id: str) -> int:
+    return _generation.get(user_id, 0)
+
+
+async def scan_ledger(user_id: str) -> Dict[str, RowState]:
+    """
+    Читає весь журнал користувача посторінково (тільки для побудови агрегатів).
+    Сторінки — за transaction_id після останнього прочитаного (keyset): вставка чи видалення
+    під час сканування не зсуває решту сторінок, як зсунуло б OFFSET.
+    """
+    rows: Dict[str, RowState] = {}
+    after_id = None
+    while True:
+        page = await transactions_repo.list_matching(user_id, after_id, LEDGER_PAGE_SIZE, columns=LEDGER_COLUMNS)
+        for row in page:
+            state = row_state(row)
+            if state:
+                rows[row["transaction_id"]] = state
+        if len(page) < LEDGER_PAGE_SIZE:
+            return rows
+        after_id = page[-1]["transaction_id"]
+
+
+def _replay(rows: Dict[str, RowState], changes: Iterable[RowChange]) -> None:
+    for transaction_id, state in changes:
+        if state is None:
+            rows.pop(transaction_id, None)
+        else:
+            rows[transaction_id] = state
+
+
+async def _build(user_id: str) -> None:
+    # Викликається тільки під _build_lock(user_id)
+    _generation[user_id] = generation(user_id) + 1
+    _pending[user_id] = []
+    try:
+        rows = await scan_ledger(user_id)
+        # Записи, що прийшли під час сканування: сканування могло їх і побачити, і ні —
+        # стан за transaction_id однаковий в обох випадках
+        _replay(rows, _pending[user_id])
+        _pending[user_id] = []
+        with timed("rollup_build"):
+            await asyncio.to_thread(rollup_store.replace, user_id, rows)
+        late = _pending[user_id]
+    finally:
+        _pending.pop(user_id, None)
+    if late:
+        # Записи під час replace(): apply ідемпотентний, тож повтор уже врахованого нічого не змінить
+        await asyncio.to_thread(rollup_store.apply, user_id, late)
+
+
+async def rebuild_user(user_id: str) -> None:
+    invalidate_analytics(user_id)
+    async with _build_lock(user_id):
+        await _build(user_id)
+
+
+def _is_fresh(built_at: Optional[float]) -> bool:
+    return built_at is not None and (ROLLUP_MAX_AGE <= 0 or time.time() - built_at < ROLLUP_MAX_AGE)
+
+
+async def ensure_built(user_id: str) -> None:
+    """
+    При першому зверненні будуємо агрегати користувача одним проходом по журналу;
+    побудовані давніше за ROLLUP_MAX_AGE — перебудовуємо (сховище локальне для вузла).
+    """
+    built_at = rollup_store.cached_built_at(user_id)
+    if built_at is None:
+        built_at = await asyncio.to_thread(rollup_store.built_at, user_id)
+    if _is_fresh(built_at):
+        return
+    async with _build_lock(user_id):
+        # Поки чекали на замок, агрегати міг побудувати інший запит
+        if not _is_fresh(rollup_store.cached_built_at(user_id)):
+            invalidate_analytics(user_id)
+            await _build(user_id)
+
+
+async def get_summary(user_id: str, end_date: Optional[date_type] = None) -> Dict:
+    await ensure_built(user_id)
+    with timed("rollup"):
+        return await asyncio.to_thread(rollup_store.summary, user_id, end_date)
+
+
+async def get_income_totals(user_id: str, as_of: date_type) -> Dict:
+    await ensure_built(user_id)
+    with timed("rollup"):
+        return await asyncio.to_thread(rollup_store.income_totals, user_id, as_of)
+
+
+async def get_year_income(user_id: str, year: int) -> float:
+    await ensure_built(user_id)
+    return await asyncio.to_thread(rollup_store.year_income, user_id, year)
+
+
+async def ledger_year_income(user_id: str, year: int) -> float:
+    """Дохід за податковий рік прямо з журналу, повз лічильник (звірка при перетині порогів ліміту)."""
+    rows = await transactions_repo.aggregate_by_month(user_id, date_type(year, 1, 1), date_type(year, 12, 31))
+    return round(sum(row["amount"] for row in rows if row["transaction_type"] == "income"), 2)
+
+
+async def invalidate_user(user_id: str) -> None:
+    _generation[user_id] = generation(user_id) + 1
+    await asyncio.to_thread(rollup_store.invalidate, user_id)
+
+
+async def record_rows(user_id: str, inserted: Iterable[dict] = (), removed: Iterable[dict] = ()) -> Dict[int, float]:
+    """
+    Оновлює агрегати після запису: inserted — нові рядки, removed — видалені (або старі версії).
+    Рядки мають містити transaction_id, дату, тип і суму.
+    Запис у журнал уже відбувся, тому помилка тут не має ламати запит —
+    просто скидаємо агрегати, і вони перебудуються при наступному читанні.
+    Якщо саме йде побудова агрегатів, зміни відкладаються і накладаються на її знімок.
+    Повертає зміну доходу по податкових роках (для перевірки лімітів у limit_monitor).
+    Зміна дати з одного року на інший дає два записи: -сума у старому і +сума у новому.
+    Тут же скидається кеш аналітики користувача.
+    """
+    invalidate_analytics(user_id)
+    inserted, removed = list(inserted), list(removed)
+    requested = deltas_for_rows(removed, sign=-1) + deltas_for_rows(inserted)
+    changes = changes_for_rows(removed, inserted)
+    try:
+        if changes is None:
+            await invalidate_user(user_id)
+        elif user_id in _pending:
+            _pending[user_id].extend(changes)
+        else:
+            applied = await asyncio.to_thread(rollup_store.apply, user_id, changes)
+            if applied is not None:
+                requested = applied
+    except Exception as e:
+        print(f"Rollup update error: {e}")
+        await invalidate_user(user_id)
+    return {year: delta for year, delta in income_by_year(requested).items() if round(delta, 2) != 0}
+
+
+async def rebuild_all() -> int:
+    """Перебудовує агрегати для всіх користувачів з таблиці profiles."""
+    rebuilt = 0
+    while True:
+        user_ids = await profiles_repo.list_ids(rebuilt, LEDGER_PAGE_SIZE)
+        for user_id in user_ids:
+            await rebuild_user(user_id)
+        rebuilt += len(user_ids)
+        if len(user_ids) < LEDGER_PAGE_SIZE:
+            return rebuilt
+
+
+async def _run_cli(args) -> None:
+    try:
+        if args.user:
+            await rebuild_user(args.user)
+            print(f"Rebuilt rollups for {args.user}: {await get_summary(args.user)}")
+        else:
+            print(f"Rebuilt rollups for {await rebuild_all()} users")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    # Запуск з папки backend (напр. після імпорту історії в обхід API):
+    #   python -m services.rollup_service --user <user_id>
+    #   python -m services.rollup_service --all
+    parser = argparse.ArgumentParser(description="Перебудова помісячних агрегатів транзакцій")
+    parser.add_argument("--user", help="ID користувача")
+    parser.add_argument("--all", action="store_true", help="Перебудувати для всіх користувачів")
+    args = parser.parse_args()
+
+    if args.user or args.all:
+        asyncio.run(_run_cli(args))
+    else:
+        parser.print_help()
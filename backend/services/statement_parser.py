@@ -0,0 +1,194 @@
+import codecs
+import csv
+import json
+from datetime import date as date_type, datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# Формати банківських виписок, які вміємо розбирати
+GENERIC = "generic"
+MONOBANK = "monobank"
+PRIVATBANK = "privatbank"
+STATEMENT_FORMATS = (GENERIC, MONOBANK, PRIVATBANK)
+
+# Ключові слова в заголовках колонок (порівнюємо в нижньому регістрі, за входженням)
+BANK_COLUMNS = {
+    MONOBANK: {
+        "date": ("дата i час операції", "дата і час операції", "date and time"),
+        "description": ("деталі операції", "description"),
+        "amount": ("сума в валюті операції", "operation amount"),
+        "currency": ("валюта", "operation currency"),
+    },
+    PRIVATBANK: {
+        "date": ("дата",),
+        "description": ("опис операції",),
+        "amount": ("сума в валюті транзакції",),
+        "currency": ("валюта транзакції",),
+    },
+}
+
+GENERIC_FIELDS = ("date", "type", "amount", "currency", "description", "category_id", "manual_rate")
+
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M", "%d.%m.%Y")
+
+
+class StatementRowError(ValueError):
+    """Рядок виписки не вдалося розібрати."""
+
+
+async def iter_records(chunks: AsyncIterator[bytes], csv_quoting: bool = True) -> AsyncIterator[str]:
+    """
+    Розбиває потік байтів на записи по рядках, не тримаючи весь файл у пам'яті.
+    Для CSV рядок з незакритими лапками (перенос всередині поля) склеюється з наступним.
+    NDJSON (csv_quoting=False) ділиться тільки по переносах: у JSON лапки екрануються (\\"),
+    і їх кількість у рядку може бути непарною.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    record = ""
+
+    def flush(line: str) -> Optional[str]:
+        nonlocal record
+        record = f"{record}\n{line}" if record else line
+        if not csv_quoting or record.count('"') % 2 == 0:
+            complete, record = record, ""
+            return complete
+        return None
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            complete = flush(line.rstrip("\r"))
+            if complete is not None and complete.strip():
+                yield complete
+
+    buffer += decoder.decode(b"", final=True)
+    for line in buffer.split("\n"):
+        complete = flush(line.rstrip("\r"))
+        if complete is not None and complete.strip():
+            yield complete
+    if record.strip():
+        yield record
+
+
+def parse_amount(value: str) -> float:
+    """'1 234,56' / '-1234.56' -> float (пробіли, в т.ч. нерозривні, ігноруються)"""
+    cleaned = (value or "").replace(" ", "").replace("\u00a0", "").replace(",", ".")
+    if not cleaned:
+        raise StatementRowError("Порожня сума")
+    try:
+        return float(cleaned)
+    except ValueError:
+        raise StatementRowError(f"Некоректна сума: {value}")
+
+
+def parse_date(value: str) -> date_type:
+    value = (value or "").strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise StatementRowError(f"Некоректна дата: {value}")
+
+
+def detect_format(header: List[str]) -> str:
+    lowered = [h.strip().lower() for h in header]
+    if "date" in lowered and "amount" in lowered:
+        return GENERIC
+    if any("деталі операції" in h or "mcc" == h for h in lowered):
+        return MONOBANK
+    if any("опис операції" in h for h in lowered):
+        return PRIVATBANK
+    raise StatementRowError("Не вдалося визначити формат виписки за заголовком")
+
+
+def _find_column(header: List[str], keywords: Tuple[str, ...]) -> Optional[int]:
+    lowered = [h.strip().lower() for h in header]
+    # Спочатку точний збіг, потім за входженням ("валюта" не має зачепити "сума в валюті...")
+    for i, h in enumerate(lowered):
+        if h in keywords:
+            return i
+    for i, h in enumerate(lowered):
+        if any(h.startswith(k) for k in keywords):
+            return i
+    return None
+
+
+class StatementParser:
+    """
+    Перетворює записи виписки (CSV або NDJSON) на словники у форматі TransactionCreate
+    (без user_id). Для банківських форматів знак суми визначає тип: "-" — витрата.
+    """
+
+    def __init__(self, statement_format: Optional[str] = None):
+        self.statement_format = statement_format
+        self.delimiter = ","
+        self.columns: Dict[str, Optional[int]] = {}
+        self.header: Optional[List[str]] = None
+
+    def _read_header(self, record: str) -> None:
+        # PrivatBank вивантажує через ";", Monobank — через ","
+        self.delimiter = ";" if record.count(";") > record.count(",") else ","
+        self.header = next(csv.reader([record], delimiter=self.delimiter))
+        if not self.statement_format:
+            self.statement_format = detect_format(self.header)
+
+        if self.statement_format == GENERIC:
+            lowered = [h.strip().lower() for h in self.header]
+            self.columns = {f: (lowered.index(f) if f in lowered else None) for f in GENERIC_FIELDS}
+        else:
+            self.columns = {
+                field: _find_column(self.header, keywords)
+                for field, keywords in BANK_COLUMNS[self.statement_format].items()
+            }
+
+        missing = [f for f in ("date", "amount") if self.columns.get(f) is None]
+        if missing:
+            raise StatementRowError(f"У виписці немає обов'язкових колонок: {', '.join(missing)}")
+
+    def _cell(self, values: List[str], field: str) -> Optional[str]:
+        index = self.columns.get(field)
+        if index is None or index >= len(values):
+            return None
+        value = values[index].strip()
+        return value or None
+
+    def parse_csv_record(self, record: str) -> Optional[Dict]:
+        """Повертає None для заголовка, інакше — дані транзакції."""
+        if self.header is None:
+            self._read_header(record)
+            return None
+
+        values = next(csv.reader([record], delimiter=self.delimiter))
+        amount = parse_amount(self._cell(values, "amount"))
+        if amount == 0:
+            raise StatementRowError("Нульова сума")
+
+        data = {
+            "date": parse_date(self._cell(values, "date")).isoformat(),
+            "currency": (self._cell(values, "currency") or "UAH").upper(),
+            "description": self._cell(values, "description"),
+        }
+
+        if self.statement_format == GENERIC:
+            data["type"] = self._cell(values, "type")
+            data["amount"] = amount
+            data["category_id"] = self._cell(values, "category_id")
+            manual_rate = self._cell(values, "manual_rate")
+            data["manual_rate"] = parse_amount(manual_rate) if manual_rate else None
+        else:
+            data["type"] = "expense" if amount < 0 else "income"
+            data["amount"] = abs(amount)
+
+        return data
+
+    @staticmethod
+    def parse_json_record(record: str) -> Dict:
+        try:
+            data = json.loads(record)
+        except json.JSONDecodeError as e:
+            raise StatementRowError(f"Некоректний JSON: {e.msg}")
+        if not isinstance(data, dict):
+            raise StatementRowError("Очікується JSON-об'єкт на кожному рядку")
+        return data
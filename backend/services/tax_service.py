@@ -1,41 +1,212 @@
-from typing import List, Optional, Dict
+from typing import List, NamedTuple, Optional, Dict, Sequence, Tuple
 from datetime import date
 from models.common import FopGroup, TaxSystem, ActivityType, ReportingPeriod
 from models.setting import FopSettingsBase
 
-from core.constants import (
-    MIN_ESV, 
-    SINGLE_TAX_G1, 
-    SINGLE_TAX_G2, 
-    FIXED_MILITARY_TAX,
-    LIMIT_G1,
-    LIMIT_G2,
-    LIMIT_G3
-)
+from core.tax_rules import tax_rules, TaxRuleSet
+
+def _row_dates(n: int, on_dates: Optional[Sequence[Optional[date]]]) -> List[Optional[date]]:
+    """Дата правил для кожного рядка пачки (без дат — правила на сьогодні)."""
+    if on_dates is None:
+        return [None] * n
+    on_dates = list(on_dates)
+    if len(on_dates) != n:
+        raise ValueError("on_dates має бути тієї ж довжини, що й пачка")
+    return on_dates
+
+# Кількість місяців у звітному періоді
+PERIOD_MONTHS = {
+    ReportingPeriod.MONTH: 1,
+    ReportingPeriod.QUARTER: 3,
+    ReportingPeriod.YEAR: 12,
+}
+
+class _BatchProfile(NamedTuple):
+    """Коефіцієнти однієї пари (налаштування, набір правил) для пакетних розрахунків."""
+    single_fixed: float                     # Єдиний податок на місяць: single_fixed + дохід × single_rate
+    single_rate: float
+    military_fixed: float                   # Військовий збір на місяць: military_fixed + дохід × military_rate
+    military_rate: float
+    esv: float
+    limit: float
+    limit_error: Optional[str]              # Помилка, якщо річний дохід > limit (None — ліміт не перевіряється)
+    static_errors: Tuple[str, ...]          # Порушення, що не залежать від доходу
+    approaching_threshold: Optional[float]  # LIMIT_APPROACHING від цього доходу (None — ліміту немає)
+    vat_threshold: Optional[float]          # VAT_REGISTRATION_REQUIRED понад цей дохід (None — вже платник ПДВ)
+
+def _batch_profile(settings: FopSettingsBase, rules: TaxRuleSet) -> _BatchProfile:
+    single_fixed = single_rate = military_fixed = military_rate = 0.0
+    limit_error = None
+    static_errors: List[str] = []
+
+    if settings.fop_group == FopGroup.GROUP_1:
+        single_fixed = rules.single_tax_g1
+        military_fixed = rules.fixed_military_tax
+        limit_error = f"GROUP_1_VIOLATION: Income exceeds UAH {rules.limit_g1:,.0f}"
+        if settings.has_employees:
+            static_errors.append("GROUP_1_VIOLATION: Employees are prohibited")
+
+    elif settings.fop_group == FopGroup.GROUP_2:
+        single_fixed = rules.single_tax_g2
+        military_fixed = rules.fixed_military_tax
+        limit_error = f"GROUP_2_LIMIT_EXCEEDED: Income exceeds UAH {rules.limit_g2:,.0f}"
+        if settings.employees_count > 10:
+            static_errors.append("GROUP_2_LIMIT_EXCEEDED: Number of employees exceeds 10")
+
+    elif settings.fop_group == FopGroup.GROUP_3:
+        single_rate = (settings.income_tax_percent / 100.0) if settings.income_tax_percent is not None else (0.03 if settings.is_vat_payer else 0.05)
+        military_rate = (settings.military_tax_percent / 100.0) if settings.military_tax_percent is not None else rules.military_rate_g3
+        limit_error = f"AUTO_TRANSITION_GENERAL: Income exceeds UAH {rules.limit_g3:,.0f}. Transition to general system required."
+
+    elif settings.fop_group == FopGroup.GROUP_4:
+        rate = (settings.income_tax_percent / 100.0) if settings.income_tax_percent is not None else 0.0095
+        single_fixed = ((settings.normative_land_value or 0.0) * (settings.land_area_ha or 0.0) * rate) / 12
+        military_fixed = rules.fixed_military_tax
+        if settings.activity_type != ActivityType.AGRICULTURE:
+            static_errors.append("GROUP_4_INVALID_ACTIVITY: Exclusively agricultural activity required")
+        if settings.has_employees:
+            static_errors.append("GROUP_4_VIOLATION: Employees are prohibited")
+        if (settings.land_area_ha or 0) <= 0:
+            static_errors.append("GROUP_4_INVALID_LAND: Land area must be greater than 0")
+
+    limit = rules.limit_for(settings.fop_group)
+    return _BatchProfile(
+        single_fixed=single_fixed, single_rate=single_rate,
+        military_fixed=military_fixed, military_rate=military_rate,
+        esv=rules.min_esv,
+        limit=limit, limit_error=limit_error, static_errors=tuple(static_errors),
+        approaching_threshold=(limit * 0.9) if limit > 0 else None,
+        vat_threshold=None if settings.is_vat_payer else rules.vat_registration_threshold,
+    )
+
+def _profile_groups(
+    settings_list: Sequence[FopSettingsBase],
+    on_dates: Optional[Sequence[Optional[date]]]
+) -> List[Tuple[_BatchProfile, List[int]]]:
+    """
+    Індекси пачки, згруповані за (об'єкт налаштувань, набір правил), з коефіцієнтами групи.
+    Налаштування порівнюються за об'єктом: пачки будуються повторенням тих самих моделей.
+    """
+    dates = _row_dates(len(settings_list), on_dates)
+    rules_by_date: Dict[Optional[date], TaxRuleSet] = {}
+    groups: Dict[Tuple[int, int], Tuple[FopSettingsBase, TaxRuleSet, List[int]]] = {}
+    for i, (st, on_date) in enumerate(zip(settings_list, dates)):
+        rules = rules_by_date.get(on_date)
+        if rules is None:
+            rules = rules_by_date[on_date] = tax_rules.for_date(on_date)
+        group = groups.get((id(st), id(rules)))
+        if group is None:
+            group = groups[(id(st), id(rules))] = (st, rules, [])
+        group[2].append(i)
+    return [(_batch_profile(st, rules), idx) for st, rules, idx in groups.values()]
+
+def _taxes_by_profile(groups: List[Tuple[_BatchProfile, List[int]]], incomes: Sequence[float], period: ReportingPeriod, n: int) -> List[Dict]:
+    months = PERIOD_MONTHS.get(period, 1)
+    results: List[Optional[Dict]] = [None] * n
+    for profile, idx in groups:
+        single_fixed, single_rate = profile.single_fixed, profile.single_rate
+        military_fixed, military_rate = profile.military_fixed, profile.military_rate
+        esv = profile.esv
+        esv_for_period = round(esv * months, 2)
+
+        if single_rate == 0 and military_rate == 0:
+            # Фіксовані суми (1, 2, 4 групи) не залежать від доходу — рядок рахується один раз
+            total = single_fixed + esv + military_fixed
+            row = {
+                "single_tax": round(single_fixed * months, 2),
+                "esv": esv_for_period,
+                "military_tax": round(military_fixed * months, 2),
+                "vat": None,
+                "total_monthly_tax": round(total, 2),
+                "total_quarterly_tax": round(total * 3, 2),
+                "total_annual_tax": round(total * 12, 2)
+            }
+            for i in idx:
+                results[i] = dict(row)
+            continue
+
+        for i in idx:
+            income = incomes[i]
+            single_tax = single_fixed + income * single_rate
+            military_tax = military_fixed + income * military_rate
+            total = single_tax + esv + military_tax
+            results[i] = {
+                "single_tax": round(single_tax * months, 2),
+                "esv": esv_for_period,
+                "military_tax": round(military_tax * months, 2),
+                "vat": None,
+                "total_monthly_tax": round(total, 2),
+                "total_quarterly_tax": round(total * 3, 2),
+                "total_annual_tax": round(total * 12, 2)
+            }
+    return results
+
+def _errors_by_profile(groups: List[Tuple[_BatchProfile, List[int]]], annual_incomes: Sequence[float], n: int) -> List[List[str]]:
+    errors: List[Optional[List[str]]] = [None] * n
+    for profile, idx in groups:
+        limit, limit_error, static_errors = profile.limit, profile.limit_error, list(profile.static_errors)
+        for i in idx:
+            # Порушення ліміту завжди йде першим, як у скалярному методі
+            if limit_error is not None and annual_incomes[i] > limit:
+                errors[i] = [limit_error, *static_errors]
+            else:
+                errors[i] = list(static_errors)
+    return errors
+
+def _warnings_by_profile(groups: List[Tuple[_BatchProfile, List[int]]], annual_incomes: Sequence[float], n: int) -> List[List[str]]:
+    warnings: List[Optional[List[str]]] = [None] * n
+    for profile, idx in groups:
+        approaching, vat_threshold = profile.approaching_threshold, profile.vat_threshold
+        for i in idx:
+            income = annual_incomes[i]
+            row = []
+            if approaching is not None and income >= approaching:
+                row.append("LIMIT_APPROACHING")
+            if vat_threshold is not None and income > vat_threshold:
+                row.append("VAT_REGISTRATION_REQUIRED")
+            warnings[i] = row
+    return warnings
+
+def ledger_tax_income(income: Dict, period: ReportingPeriod) -> Tuple[float, float]:
+    """
+    Дохід з журналу (get_income_totals: month / quarter / year_to_date) -> вхід розрахунку податків:
+    (річний дохід для лімітів, середній місячний дохід звітного періоду для calculate_taxes).
+    Дохід періоду береться як є, у тому числі 0 — без підстановки річного / 12.
+    """
+    annual_income = income["year_to_date"]
+    # calculate_taxes множить місячний дохід на кількість місяців періоду
+    if period == ReportingPeriod.YEAR:
+        monthly_income = annual_income / 12
+    elif period == ReportingPeriod.QUARTER:
+        monthly_income = income["quarter"] / 3
+    else:
+        monthly_income = income["month"]
+    return annual_income, monthly_income
 
 class TaxService:
     @staticmethod
-    def verify_group_restrictions(settings: FopSettingsBase, annual_income: float) -> List[str]:
+    def verify_group_restrictions(settings: FopSettingsBase, annual_income: float, on_date: Optional[date] = None) -> List[str]:
+        rules = tax_rules.for_date(on_date)
         errors = []
         
         # Group 1
         if settings.fop_group == FopGroup.GROUP_1:
-            if annual_income > LIMIT_G1:
-                errors.append(f"GROUP_1_VIOLATION: Income exceeds UAH {LIMIT_G1:,.0f}")
+            if annual_income > rules.limit_g1:
+                errors.append(f"GROUP_1_VIOLATION: Income exceeds UAH {rules.limit_g1:,.0f}")
             if settings.has_employees:
                 errors.append("GROUP_1_VIOLATION: Employees are prohibited")
                 
         # Group 2
         elif settings.fop_group == FopGroup.GROUP_2:
-            if annual_income > LIMIT_G2:
-                errors.append(f"GROUP_2_LIMIT_EXCEEDED: Income exceeds UAH {LIMIT_G2:,.0f}")
+            if annual_income > rules.limit_g2:
+                errors.append(f"GROUP_2_LIMIT_EXCEEDED: Income exceeds UAH {rules.limit_g2:,.0f}")
             if settings.employees_count > 10:
                 errors.append("GROUP_2_LIMIT_EXCEEDED: Number of employees exceeds 10")
                 
         # Group 3
         elif settings.fop_group == FopGroup.GROUP_3:
-            if annual_income > LIMIT_G3:
-                errors.append(f"AUTO_TRANSITION_GENERAL: Income exceeds UAH {LIMIT_G3:,.0f}. Transition to general system required.")
+            if annual_income > rules.limit_g3:
+                errors.append(f"AUTO_TRANSITION_GENERAL: Income exceeds UAH {rules.limit_g3:,.0f}. Transition to general system required.")
                 
         # Group 4
         elif settings.fop_group == FopGroup.GROUP_4:
@@ -49,47 +220,48 @@ class TaxService:
         return errors
 
     @staticmethod
-    def get_warnings(settings: FopSettingsBase, annual_income: float) -> List[str]:
+    def get_warnings(settings: FopSettingsBase, annual_income: float, on_date: Optional[date] = None) -> List[str]:
+        rules = tax_rules.for_date(on_date)
         warnings = []
         
         # Limit Approach Warning (90%)
-        limit = 0
-        if settings.fop_group == FopGroup.GROUP_1: limit = LIMIT_G1
-        elif settings.fop_group == FopGroup.GROUP_2: limit = LIMIT_G2
-        elif settings.fop_group == FopGroup.GROUP_3: limit = LIMIT_G3
+        limit = rules.limit_for(settings.fop_group)
         
         if limit > 0 and annual_income >= (limit * 0.9):
             warnings.append("LIMIT_APPROACHING")
             
         # VAT Registration Warning
-        if not settings.is_vat_payer and annual_income > 1000000.0:
+        if not settings.is_vat_payer and annual_income > rules.vat_registration_threshold:
             warnings.append("VAT_REGISTRATION_REQUIRED")
             
         return warnings
 
     @staticmethod
-    def calculate_taxes(settings: FopSettingsBase, income: float, period: ReportingPeriod = ReportingPeriod.MONTH) -> Dict:
+    def calculate_taxes(settings: FopSettingsBase, income: float, period: ReportingPeriod = ReportingPeriod.MONTH, on_date: Optional[date] = None) -> Dict:
+        # Ставки, чинні на дату (за замовчуванням — сьогодні)
+        rules = tax_rules.for_date(on_date)
+
         # Base ESV is always charged even if income is zero
-        esv = MIN_ESV
+        esv = rules.min_esv
         
         single_tax = 0.0
         military_tax = 0.0
         vat = None
         
         if settings.fop_group == FopGroup.GROUP_1:
-            single_tax = SINGLE_TAX_G1
-            military_tax = FIXED_MILITARY_TAX
+            single_tax = rules.single_tax_g1
+            military_tax = rules.fixed_military_tax
             
         elif settings.fop_group == FopGroup.GROUP_2:
-            single_tax = SINGLE_TAX_G2
-            military_tax = FIXED_MILITARY_TAX
+            single_tax = rules.single_tax_g2
+            military_tax = rules.fixed_military_tax
             
         elif settings.fop_group == FopGroup.GROUP_3:
             # Single Tax: use percent from settings or fallback to 3%/5%
             rate = (settings.income_tax_percent / 100.0) if settings.income_tax_percent is not None else (0.03 if settings.is_vat_payer else 0.05)
             single_tax = income * rate
-            # Military tax: use percent from settings or fallback to 1% for G3
-            mil_rate = (settings.military_tax_percent / 100.0) if settings.military_tax_percent is not None else 0.01
+            # Military tax: use percent from settings or fallback to the G3 default (1% since 2025)
+            mil_rate = (settings.military_tax_percent / 100.0) if settings.military_tax_percent is not None else rules.military_rate_g3
             military_tax = income * mil_rate
             
         elif settings.fop_group == FopGroup.GROUP_4:
@@ -99,7 +271,7 @@ class TaxService:
             area = settings.land_area_ha or 0.0
             rate = (settings.income_tax_percent / 100.0) if settings.income_tax_percent is not None else 0.0095
             single_tax = (land_value * area * rate) / 12 # Monthly share of annual tax
-            military_tax = FIXED_MILITARY_TAX
+            military_tax = rules.fixed_military_tax
 
         # Adjust for period
         months = 1
@@ -117,16 +289,141 @@ class TaxService:
         }
 
     @staticmethod
-    def get_payment_calendar() -> List[Dict]:
+    def get_payment_calendar(on_date: Optional[date] = None) -> List[Dict]:
         """
-        Генерує календар платежів на 2025 рік.
+        Генерує календар платежів за правилами, чинними на дату (за замовчуванням — сьогодні).
         Дедлайни: до 20-го числа наступного періоду.
+        Для фіксованих платежів додається сума (amount), військовий збір — лише з 2025 року.
         """
-        return [
-            {"event": "ЄСВ (Єдиний соціальний внесок)", "deadline": "Щомісяця, до 20-го числа", "group": "Усі (1, 2, 3, 4)"},
-            {"event": "Єдиний податок", "deadline": "Щомісяця, до 20-го числа", "group": "1, 2"},
+        rules = tax_rules.for_date(on_date)
+        calendar = [
+            {"event": "ЄСВ (Єдиний соціальний внесок)", "deadline": "Щомісяця, до 20-го числа", "group": "Усі (1, 2, 3, 4)", "amount": rules.min_esv},
+            {"event": "Єдиний податок", "deadline": "Щомісяця, до 20-го числа", "group": "1", "amount": rules.single_tax_g1},
+            {"event": "Єдиний податок", "deadline": "Щомісяця, до 20-го числа", "group": "2", "amount": rules.single_tax_g2},
             {"event": "Єдиний податок", "deadline": "Щокварталу, до 20-го числа", "group": "3"},
             {"event": "Єдиний податок (нарахована частка)", "deadline": "Раз на рік", "group": "4"},
-            {"event": "Військовий збір (фіксований)", "deadline": "Щомісяця, до 20-го числа", "group": "1, 2, 4"},
-            {"event": "Військовий збір (1% від доходу)", "deadline": "Щокварталу, до 20-го числа", "group": "3"},
         ]
+        if rules.fixed_military_tax > 0:
+            calendar.append({"event": "Військовий збір (фіксований)", "deadline": "Щомісяця, до 20-го числа", "group": "1, 2, 4", "amount": rules.fixed_military_tax})
+        if rules.military_rate_g3 > 0:
+            calendar.append({"event": f"Військовий збір ({rules.military_rate_g3 * 100:g}% від доходу)", "deadline": "Щокварталу, до 20-го числа", "group": "3"})
+        return calendar
+
+    # ---------- Пакетні розрахунки (багато користувачів / місяців за один виклик) ----------
+    # Рядки розкладаються за парою (налаштування, набір правил). Для кожної пари один раз
+    # рахуються коефіцієнти (_BatchProfile): фіксовані суми, ставки від доходу, пороги
+    # і помилки, що не залежать від доходу. Далі кожен рядок — це лише множення й порівняння.
+    # simulate (8 сценаріїв × сітка доходів) чи історія користувача за роки дає кілька профілів
+    # на тисячі рядків. Формули ті самі, що в скалярних методах вище;
+    # tests/test_tax_batch.py звіряє обидва шляхи з фіксованими очікуваними сумами.
+
+    @staticmethod
+    def calculate_taxes_batch(
+        settings_list: Sequence[FopSettingsBase],
+        incomes: Sequence[float],
+        period: ReportingPeriod = ReportingPeriod.MONTH,
+        on_dates: Optional[Sequence[Optional[date]]] = None
+    ) -> List[Dict]:
+        if len(settings_list) != len(incomes):
+            raise ValueError("settings_list та incomes мають бути однакової довжини")
+        return _taxes_by_profile(_profile_groups(settings_list, on_dates), incomes, period, len(incomes))
+
+    @staticmethod
+    def verify_group_restrictions_batch(
+        settings_list: Sequence[FopSettingsBase],
+        annual_incomes: Sequence[float],
+        on_dates: Optional[Sequence[Optional[date]]] = None
+    ) -> List[List[str]]:
+        if len(settings_list) != len(annual_incomes):
+            raise ValueError("settings_list та annual_incomes мають бути однакової довжини")
+        return _errors_by_profile(_profile_groups(settings_list, on_dates), annual_incomes, len(annual_incomes))
+
+    @staticmethod
+    def get_warnings_batch(
+        settings_list: Sequence[FopSettingsBase],
+        annual_incomes: Sequence[float],
+        on_dates: Optional[Sequence[Optional[date]]] = None
+    ) -> List[List[str]]:
+        if len(settings_list) != len(annual_incomes):
+            raise ValueError("settings_list та annual_incomes мають бути однакової довжини")
+        return _warnings_by_profile(_profile_groups(settings_list, on_dates), annual_incomes, len(annual_incomes))
+
+    @staticmethod
+    def evaluate_batch(
+        settings_list: Sequence[FopSettingsBase],
+        annual_incomes: Sequence[float],
+        monthly_incomes: Sequence[float],
+        period: ReportingPeriod = ReportingPeriod.MONTH,
+        on_dates: Optional[Sequence[Optional[date]]] = None
+    ) -> List[Dict]:
+        """
+        Повний розрахунок для пачки (напр. нічна перевірка лімітів усіх користувачів
+        або перерахунок історії користувача за кілька років — по рядку на місяць з on_dates):
+        податки, порушення обмежень групи і попередження — як у /tax/calculate.
+        Річний дохід — для лімітів, місячний — для податків; обидва беруться як є
+        (місяць без доходу дає 0), підстановку на кшталт річний / 12 робить викликач.
+        """
+        n = len(settings_list)
+        if len(annual_incomes) != n or len(monthly_incomes) != n:
+            raise ValueError("settings_list, annual_incomes та monthly_incomes мають бути однакової довжини")
+        groups = _profile_groups(settings_list, on_dates)
+        taxes = _taxes_by_profile(groups, monthly_incomes, period, n)
+        errors = _errors_by_profile(groups, annual_incomes, n)
+        warnings = _warnings_by_profile(groups, annual_incomes, n)
+        return [
+            {"taxes": t, "errors": e, "warnings": w}
+            for t, e, w in zip(taxes, errors, warnings)
+        ]
+
+    @staticmethod
+    def simulate(settings: FopSettingsBase, annual_incomes: Sequence[float], period: ReportingPeriod = ReportingPeriod.MONTH, on_date: Optional[date] = None) -> Dict:
+        """
+        "Що якщо": податки для кожної групи (1–4) і статусу ПДВ на сітці річних доходів.
+        Для поточної комбінації користувача беруться його ставки з налаштувань,
+        для інших — стандартні (ставка 3-ї групи залежить від ПДВ, а 4-ї — від землі).
+        Усі сценарії рахуються одним пакетом через evaluate_batch.
+        """
+        scenarios = []
+        for group in FopGroup:
+            for is_vat_payer in (False, True):
+                update = {"fop_group": group, "is_vat_payer": is_vat_payer}
+                if (group, is_vat_payer) != (settings.fop_group, settings.is_vat_payer):
+                    update.update({"income_tax_percent": None, "military_tax_percent": None})
+                scenarios.append(settings.model_copy(update=update))
+
+        incomes = list(annual_incomes)
+        batch_settings = [sc for sc in scenarios for _ in incomes]
+        batch_incomes = incomes * len(scenarios)
+        # Сітка задає лише річний дохід, тож податки рахуються з рівномірного місячного (річний / 12)
+        batch_monthly = [income / 12 for income in batch_incomes]
+        batch_dates = [on_date] * len(batch_incomes) if on_date else None
+        results = TaxService.evaluate_batch(batch_settings, batch_incomes, batch_monthly, period=period, on_dates=batch_dates)
+
+        matrix = []
+        cheapest: List[Optional[Dict]] = [None] * len(incomes)
+        for k, sc in enumerate(scenarios):
+            rows = results[k * len(incomes):(k + 1) * len(incomes)]
+            totals = [round(r["taxes"]["single_tax"] + r["taxes"]["esv"] + r["taxes"]["military_tax"], 2) for r in rows]
+            allowed = [not r["errors"] for r in rows]
+            matrix.append({
+                "fop_group": int(sc.fop_group),
+                "is_vat_payer": sc.is_vat_payer,
+                "is_current": (sc.fop_group, sc.is_vat_payer) == (settings.fop_group, settings.is_vat_payer),
+                "single_tax": [r["taxes"]["single_tax"] for r in rows],
+                "esv": [r["taxes"]["esv"] for r in rows],
+                "military_tax": [r["taxes"]["military_tax"] for r in rows],
+                "total": totals,
+                "allowed": allowed,
+                "errors": [r["errors"] for r in rows],
+                "warnings": [r["warnings"] for r in rows],
+            })
+            for i, (total, ok) in enumerate(zip(totals, allowed)):
+                if ok and (cheapest[i] is None or total < cheapest[i]["total"]):
+                    cheapest[i] = {"fop_group": int(sc.fop_group), "is_vat_payer": sc.is_vat_payer, "total": total}
+
+        return {
+            "period": period.value,
+            "annual_incomes": incomes,
+            "scenarios": matrix,
+            "cheapest": cheapest
+        }
@@ -0,0 +1,46 @@
+import os
+from typing import Dict, Optional
+from core.cache import TTLCache, MISSING
+from models.setting import FopSettingsBase
+from repositories import settings as settings_repo, profiles as profiles_repo
+
+# Налаштування і профіль змінюються рідко і тільки через PATCH /settings та /profile,
+# тому TTL лише страхує від змін в обхід API (або з інших воркерів)
+USER_CACHE_TTL = float(os.environ.get("USER_CACHE_TTL", "300"))
+USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", "10000"))
+
+settings_cache = TTLCache(max_size=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+profile_cache = TTLCache(max_size=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+async def get_fop_settings(user_id: str) -> Optional[FopSettingsBase]:
+    """Провалідовані налаштування ФОП (None — якщо їх ще немає)."""
+    cached = settings_cache.get(user_id)
+    if cached is not MISSING:
+        return cached
+
+    row = await settings_repo.get(user_id)
+    settings = FopSettingsBase(**row) if row else None
+    settings_cache.set(user_id, settings)
+    return settings
+
+async def get_profile(user_id: str) -> Optional[dict]:
+    """Рядок профілю (None — якщо профілю немає)."""
+    cached = profile_cache.get(user_id)
+    if cached is not MISSING:
+        return cached
+
+    profile = await profiles_repo.get(user_id)
+    profile_cache.set(user_id, profile)
+    return profile
+
+def invalidate_settings(user_id: str) -> None:
+    settings_cache.invalidate(user_id)
+
+def invalidate_profile(user_id: str) -> None:
+    profile_cache.invalidate(user_id)
+
+def get_cache_stats() -> Dict:
+    return {
+        "settings": settings_cache.stats(),
+        "profiles": profile_cache.stats()
+    }
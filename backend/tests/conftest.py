@@ -0,0 +1,74 @@
+import asyncio
+import os
+import sys
+import uuid
+
+# Тести не ходять ні в Supabase, ні в НБУ: до імпорту застосунку підставляємо
+# фіктивні ключі, сховища в пам'яті і вимикаємо прогрів під час старту
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("SUPABASE_URL", "http://tests.supabase.local")
+os.environ.setdefault("SUPABASE_KEY", "tests-key")
+os.environ["STORAGE_BACKEND"] = "supabase"
+os.environ["ROLLUP_STORE_PATH"] = ":memory:"
+os.environ["NBU_RATE_CACHE_PATH"] = ":memory:"
+os.environ["STARTUP_WARMUP"] = "0"
+os.environ["NBU_WARMUP_DAYS"] = "0"
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from supabase import acreate_client, AsyncClientOptions
+
+import core.database as database
+from benchmarks.fake_postgrest import FakePostgrest
+from services.category_service import system_categories_cache
+from main import app
+
+
+@pytest.fixture
+def fake():
+    """Порожній PostgREST у пам'яті, підставлений замість клієнта Supabase."""
+    fake = FakePostgrest()
+    database._client = asyncio.run(acreate_client(
+        database.url, database.key,
+        options=AsyncClientOptions(httpx_client=httpx.AsyncClient(transport=fake.transport()))
+    ))
+    system_categories_cache.clear()
+    yield fake
+    database._client = None
+
+
+@pytest.fixture
+def client(fake):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def user_id():
+    # Кожен тест — окремий користувач: кеші і агрегати процесу між тестами не перетинаються
+    return str(uuid.uuid4())
+
+
+def seed_user(fake: FakePostgrest, user_id: str, fop_group: int = 3, is_fop: bool = True) -> None:
+    fake.seed("profiles", [{"id": user_id, "full_name": "Тест", "is_fop": is_fop}])
+    if fop_group:
+        fake.seed("fop_settings", [{
+            "user_id": user_id, "fop_group": fop_group, "income_tax_percent": 5.0 if fop_group == 3 else None,
+            "military_tax_percent": 1, "esv_value": 1760.0, "is_zed": False, "tax_system": "simplified",
+            "activity_type": "services", "reporting_period": "quarter", "has_employees": False,
+            "employees_count": 0, "is_vat_payer": False
+        }])
+
+
+def seed_transactions(fake: FakePostgrest, user_id: str, rows: list) -> list:
+    """rows: (дата 'YYYY-MM-DD', тип, сума в гривні) або повні словники."""
+    return fake.seed("transactions", [
+        row if isinstance(row, dict) else {
+            "user_id": user_id, "category_id": None, "transaction_type": row[1], "transaction_amount": row[2],
+            "transaction_date": row[0], "notes": None, "is_foreign_currency": False, "currency_code": "UAH",
+            "amount_original": None, "exchange_rate": 1.0,
+        }
+        for row in rows
+    ])
@@ -0,0 +1,116 @@
+import asyncio
+
+from services.analytics_service import invalidate_analytics
+from services.rollup_service import ledger_year_income
+from tests.conftest import seed_transactions, seed_user
+
+
+def _row(user_id, day, tx_type, amount, category_id=None, currency="UAH", original=None, rate=1.0):
+    return {
+        "user_id": user_id, "category_id": category_id, "transaction_type": tx_type, "transaction_amount": amount,
+        "transaction_date": day, "notes": None, "is_foreign_currency": currency != "UAH", "currency_code": currency,
+        "amount_original": original, "exchange_rate": rate,
+    }
+
+
+def _analytics(client, user_id, **params):
+    response = client.get("/transactions/analytics", params={"user_id": user_id, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _seed(fake, user_id):
+    seed_user(fake, user_id)
+    rent, = fake.seed("categories", [{"user_id": user_id, "name": "Оренда", "type": "expense"}])
+    rows = seed_transactions(fake, user_id, [
+        _row(user_id, "2025-01-10", "income", 1000.0),
+        _row(user_id, "2025-01-20", "expense", 300.0, rent["id"]),
+        _row(user_id, "2025-01-25", "income", 4100.0, currency="USD", original=100.0, rate=41.0),
+        _row(user_id, "2025-04-02", "income", 500.0),
+        _row(user_id, "2025-04-03", "expense", 50.0),
+    ])
+    return rent, rows
+
+
+def test_monthly_series_fill_gaps_and_split_by_category(client, fake, user_id):
+    rent, _ = _seed(fake, user_id)
+
+    body = _analytics(client, user_id)
+
+    assert body["periods"] == ["2025-01", "2025-02", "2025-03", "2025-04"]
+    assert body["totals"] == {"income": [5100.0, 0.0, 0.0, 500.0], "expense": [300.0, 0.0, 0.0, 50.0]}
+    by_key = {(s["type"], s["category_id"]): s for s in body["series"]}
+    assert by_key[("expense", rent["id"])]["amounts"] == [300.0, 0.0, 0.0, 0.0]
+    assert by_key[("expense", None)]["counts"] == [0, 0, 0, 1]
+    assert by_key[("income", None)]["total"] == 5600.0
+
+
+def test_quarterly_series_with_date_range(client, fake, user_id):
+    _seed(fake, user_id)
+
+    body = _analytics(client, user_id, granularity="quarter", start_date="2025-01-15", end_date="2025-12-31")
+
+    assert body["periods"] == ["2025-Q1", "2025-Q2"]
+    assert body["totals"] == {"income": [4100.0, 500.0], "expense": [300.0, 50.0]}
+
+
+def test_series_by_currency_keep_original_amounts(client, fake, user_id):
+    _seed(fake, user_id)
+
+    body = _analytics(client, user_id, by_currency="true", end_date="2025-01-31")
+
+    income = {s["currency"]: s for s in body["series"] if s["type"] == "income"}
+    assert income["USD"]["amounts"] == [4100.0]
+    assert income["USD"]["amounts_original"] == [100.0]
+    assert income["UAH"]["amounts"] == [1000.0]
+
+
+def test_cached_series_are_dropped_after_a_write(client, fake, user_id):
+    _, rows = _seed(fake, user_id)
+    assert _analytics(client, user_id)["totals"]["income"][-1] == 500.0
+
+    # Зміна в обхід API не видна — відповідь з кешу
+    fake.tables["transactions"][3]["transaction_amount"] = 700.0
+    assert _analytics(client, user_id)["totals"]["income"][-1] == 500.0
+
+    assert client.delete(f"/transactions/{rows[4]['transaction_id']}", params={"user_id": user_id}).status_code == 200
+    body = _analytics(client, user_id)
+    assert body["totals"]["income"][-1] == 700.0
+    assert body["totals"]["expense"][-1] == 0.0
+
+
+def test_analytics_rejects_bad_parameters(client, fake, user_id):
+    params = {"user_id": user_id}
+    assert client.get("/transactions/analytics", params={**params, "granularity": "week"}).status_code == 400
+    assert client.get("/transactions/analytics", params={**params, "start_date": "2025-02-01", "end_date": "2025-01-01"}).status_code == 400
+
+
+def test_grouping_runs_in_one_database_call(client, fake, user_id):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-%02d-10" % (i % 12 + 1), "income", 10.0) for i in range(2500)])
+
+    before = fake.requests
+    body = _analytics(client, user_id)
+
+    assert fake.requests - before == 1
+    assert body["totals"]["income"] == [2090.0] * 4 + [2080.0] * 8
+
+
+def test_missing_database_function_falls_back_to_paged_scan(client, fake, user_id):
+    _seed(fake, user_id)
+    expected = _analytics(client, user_id, by_currency="true")
+    fake.functions.clear()
+    invalidate_analytics(user_id)
+
+    assert _analytics(client, user_id, by_currency="true") == expected
+
+
+def test_ledger_year_income_sums_only_that_year(fake, user_id):
+    seed_transactions(fake, user_id, [
+        ("2024-12-31", "income", 1.0), ("2025-01-01", "income", 100.25), ("2025-12-31", "income", 200.5),
+        ("2025-06-01", "expense", 50.0), ("2026-01-01", "income", 7.0),
+    ])
+
+    before = fake.requests
+    assert asyncio.run(ledger_year_income(user_id, 2025)) == 300.75
+    assert fake.requests - before == 1
@@ -0,0 +1,80 @@
+import pytest
+
+from tests.conftest import seed_user
+
+
+def test_unchanged_categories_return_304(client, fake, user_id):
+    seed_user(fake, user_id)
+    fake.seed("categories", [{"user_id": None, "name": "Дохід від ФОП", "type": "income"}])
+
+    first = client.get("/categories/", params={"user_id": user_id})
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    etag = first.headers["etag"]
+    assert [c["name"] for c in first.json()["income"]] == ["Дохід від ФОП"]
+
+    second = client.get("/categories/", params={"user_id": user_id}, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+
+
+def test_new_own_category_changes_etag(client, fake, user_id):
+    seed_user(fake, user_id)
+    fake.seed("categories", [{"user_id": None, "name": "Дохід від ФОП", "type": "income"}])
+    etag = client.get("/categories/", params={"user_id": user_id}).headers["etag"]
+
+    created = client.post("/categories/", json={"name": "Оренда", "type": "expense", "user_id": user_id})
+    assert created.status_code == 200, created.text
+
+    response = client.get("/categories/", params={"user_id": user_id}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [c["name"] for c in response.json()["expense"]] == ["Оренда"]
+
+
+def test_system_categories_are_served_from_snapshot(client, fake, user_id):
+    seed_user(fake, user_id, is_fop=False)
+    fake.seed("categories", [
+        {"user_id": None, "name": "Дохід від ФОП", "type": "income", "is_fop_only": True},
+        {"user_id": None, "name": "Зарплата", "type": "income"},
+    ])
+    assert [c["name"] for c in client.get("/categories/", params={"user_id": user_id}).json()["all"]] == ["Зарплата"]
+
+    # Нова системна категорія в базі не видна, поки знімок не застаріє
+    fake.seed("categories", [{"user_id": None, "name": "Подарунки", "type": "income"}])
+    body = client.get("/categories/", params={"user_id": user_id}).json()
+    assert [c["name"] for c in body["all"]] == ["Зарплата"]
+    assert body["user_is_fop"] is False
+
+
+@pytest.mark.parametrize("header, matches", [
+    ('"other", {etag}', True),
+    ('W/{etag}', True),
+    ('*', True),
+    ('"other", W/"x,y"', False),
+    ('{etag_prefix}"', False),
+    ('', False),
+])
+def test_if_none_match_list_wildcard_and_weak_tags(client, fake, user_id, header, matches):
+    seed_user(fake, user_id)
+    fake.seed("categories", [{"user_id": None, "name": "Дохід від ФОП", "type": "income"}])
+    etag = client.get("/categories/", params={"user_id": user_id}).headers["etag"]
+
+    value = header.format(etag=etag, etag_prefix=etag[:-5])
+    response = client.get("/categories/", params={"user_id": user_id}, headers={"If-None-Match": value})
+
+    assert response.status_code == (304 if matches else 200)
+
+
+def test_non_fop_user_sees_only_categories_marked_false(client, fake, user_id):
+    seed_user(fake, user_id, is_fop=False)
+    fake.seed("categories", [
+        {"user_id": None, "name": "Зарплата", "type": "income", "is_fop_only": False},
+        {"user_id": None, "name": "Дохід від ФОП", "type": "income", "is_fop_only": True},
+    ])
+    fake.tables["categories"].append({"id": "legacy", "user_id": None, "name": "Без позначки", "type": "income", "is_fop_only": None})
+
+    body = client.get("/categories/", params={"user_id": user_id}).json()
+
+    assert [c["name"] for c in body["all"]] == ["Зарплата"]
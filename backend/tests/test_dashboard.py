@@ -0,0 +1,33 @@
+from tests.conftest import seed_transactions, seed_user
+
+
+def test_dashboard_summary_is_lifetime_and_tax_matches_ledger_calculation(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+    seed_transactions(fake, user_id, [
+        ("2024-11-20", "income", 1000.0), ("2025-01-10", "income", 120000.0), ("2025-05-02", "expense", 5000.0),
+    ])
+
+    response = client.get("/dashboard", params={"user_id": user_id, "as_of": "2025-05-15"})
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    # Список транзакцій — за поточний місяць, підсумок — за весь час
+    assert [row["transaction_date"] for row in body["transactions"]] == ["2025-05-02"]
+    assert body["period"] == {"start_date": "2025-05-01", "end_date": "2025-05-31"}
+    assert body["summary"]["totalIncome"] == 121000.0
+    assert body["summary"]["monthsCount"] == 3
+
+    ledger = client.get("/tax/calculate", params={"user_id": user_id, "source": "ledger", "as_of": "2025-05-15"}).json()
+    assert body["tax"]["taxes"] == ledger["taxes"]
+    assert body["tax"]["income"] == ledger["income"]
+    assert body["tax"]["taxes"]["single_tax"] == 0.0
+
+
+def test_dashboard_summary_respects_explicit_end_date(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+    seed_transactions(fake, user_id, [("2024-11-20", "income", 1000.0), ("2025-01-10", "income", 120000.0)])
+
+    response = client.get("/dashboard", params={"user_id": user_id, "end_date": "2024-12-31", "as_of": "2025-05-15"})
+
+    assert response.status_code == 200
+    assert response.json()["summary"]["totalIncome"] == 1000.0
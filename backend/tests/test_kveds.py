@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import services.kved_index as kved_index
+from main import app
+from services.kved_index import KvedIndex, load_sections
+
+
+def _search(client, q, **params):
+    response = client.get("/kveds/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return [item["code"] for item in response.json()["results"]]
+
+
+def test_search_by_code(client):
+    assert _search(client, "62", limit=3) == ["62.01", "62.02", "62.03"]
+    assert _search(client, "62.01")[0] == "62.01"
+    assert _search(client, "6201") == ["62.01"]
+
+
+def test_search_by_name_with_apostrophes_and_typos(client):
+    assert _search(client, "програмування")[0] == "62.01"
+    assert _search(client, "Компютерне програмування")[0] == "62.01"
+    assert _search(client, "комп’ютерне програм")[0] == "62.01"
+    assert _search(client, "прогрмування")[0] == "62.01"
+    assert _search(client, "хліб")[0] == "10.71"
+    assert _search(client, "zzzz") == []
+
+
+def test_get_by_code(client):
+    response = client.get("/kveds/6201")
+    assert response.status_code == 200
+    assert response.json()["section"]["id"] == "J"
+    assert response.json()["division"]["id"] == "62"
+    assert client.get("/kveds/99.99").status_code == 404
+
+
+def test_sections_catalog(client):
+    listing = client.get("/kveds/sections")
+    assert listing.status_code == 200
+    assert listing.headers["cache-control"] == "public, max-age=3600"
+    by_id = {s["id"]: s for s in listing.json()}
+    assert set(by_id["J"]) == {"id", "title", "items"}
+
+    section = client.get("/kveds/sections/j")
+    assert section.status_code == 200
+    groups = section.json()["groups"]
+    assert sum(len(g["items"]) for g in groups) == by_id["J"]["items"]
+    assert "62.01" in [item["code"] for g in groups for item in g["items"]]
+    assert client.get("/kveds/sections/ZZ").status_code == 404
+
+
+def test_shipped_chunks_match_manifest():
+    sections = load_sections(kved_index.DEFAULT_SOURCE_PATH)
+    with open(f"{kved_index.DEFAULT_SOURCE_PATH}/manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    assert manifest["source_sha256"]
+    assert [s["id"] for s in sections] == [entry["id"] for entry in manifest["sections"]]
+    assert len(KvedIndex(sections)) == sum(entry["items"] for entry in manifest["sections"])
+
+
+def test_missing_classifier_fails_startup(monkeypatch, tmp_path, fake):
+    monkeypatch.setattr(kved_index, "KVED_SOURCE_PATH", str(tmp_path / "missing"))
+    monkeypatch.setattr(kved_index, "_index", None)
+
+    with pytest.raises(FileNotFoundError):
+        with TestClient(app):
+            pass
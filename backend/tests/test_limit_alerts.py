@@ -0,0 +1,77 @@
+import asyncio
+
+from services.limit_monitor import APPROACHING, EXCEEDED, check_limits
+from services.rollup_service import get_year_income
+from tests.conftest import seed_transactions, seed_user
+
+# Ліміт 3-ї групи на 2025 рік
+LIMIT_2025 = 9_336_000.0
+
+
+def _create(client, user_id, amount, day="2025-06-01", type="income"):
+    response = client.post("/transactions/", json={"user_id": user_id, "type": type, "amount": amount, "date": day})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _levels(alerts):
+    return [alert["level"] for alert in alerts]
+
+
+def _stored_levels(client, user_id):
+    response = client.get("/tax/limits", params={"user_id": user_id, "year": 2025})
+    assert response.status_code == 200
+    return _levels(response.json()["alerts"])
+
+
+def test_thresholds_fire_once_and_clear(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+
+    assert _create(client, user_id, 8_000_000)["limit_alerts"] == []
+    approaching = _create(client, user_id, 500_000)
+    assert _levels(approaching["limit_alerts"]) == [APPROACHING]
+    assert approaching["limit_alerts"][0]["income"] == 8_500_000.0
+    # Дохід і далі між 90% і 100%, витрати на дохід не впливають: повторного сповіщення немає
+    assert _create(client, user_id, 100_000)["limit_alerts"] == []
+    assert _create(client, user_id, 5_000_000, type="expense")["limit_alerts"] == []
+    # Інший рік — свій лічильник
+    assert _create(client, user_id, 100_000, day="2024-06-01")["limit_alerts"] == []
+
+    exceeded = _create(client, user_id, 1_000_000)
+    assert _levels(exceeded["limit_alerts"]) == [EXCEEDED]
+    assert sorted(_stored_levels(client, user_id)) == sorted([APPROACHING, EXCEEDED])
+
+    big = exceeded["db_response"][0]["transaction_id"]
+    response = client.delete(f"/transactions/{big}", params={"user_id": user_id})
+    assert response.status_code == 200
+    assert _stored_levels(client, user_id) == [APPROACHING]
+
+
+def test_concurrent_writes_report_a_crossing_once(fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+    seed_transactions(fake, user_id, [("2025-02-01", "income", LIMIT_2025 * 0.95)])
+
+    async def scenario():
+        return await asyncio.gather(*(check_limits(user_id, {2025: 1000.0}) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert sorted(_levels(alerts) for alerts in results) == [[], [], [APPROACHING]]
+
+
+def test_crossing_is_confirmed_against_the_ledger(fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+    rows = seed_transactions(fake, user_id, [("2025-02-01", "income", LIMIT_2025 * 0.95)])
+
+    async def scenario():
+        # Лічильник бачить 95%, а рядок уже видалено з журналу в обхід API
+        await get_year_income(user_id, 2025)
+        fake.tables["transactions"].remove(rows[0])
+        alerts = await check_limits(user_id, {2025: 1.0})
+        return alerts, await get_year_income(user_id, 2025)
+
+    alerts, income = asyncio.run(scenario())
+
+    assert alerts == []
+    # Розбіжність лічильника з журналом скидає агрегати: наступне читання бачить журнал
+    assert income == 0.0
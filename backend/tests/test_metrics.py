@@ -0,0 +1,38 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core.metrics import DependencyTransport, dependency_duration, dependency_errors
+
+
+def _count(dependency, operation, outcome):
+    counts, _ = dependency_duration._series.get((dependency, operation, outcome), ([0], [0.0]))
+    return sum(counts)
+
+
+def _call(handler, dependency):
+    async def scenario():
+        async with httpx.AsyncClient(transport=DependencyTransport(dependency, httpx.MockTransport(handler))) as client:
+            return await client.get("http://dependency.local/rest/v1/transactions")
+    return asyncio.run(scenario())
+
+
+def test_success_and_http_error_are_labelled():
+    _call(lambda request: httpx.Response(200, json=[]), "test-ok")
+    _call(lambda request: httpx.Response(503, json={"message": "down"}), "test-ok")
+
+    assert _count("test-ok", "GET transactions", "ok") == 1
+    assert _count("test-ok", "GET transactions", "http_error") == 1
+    assert dependency_errors._values[("test-ok", "GET transactions", "http_error")] == 1
+
+
+def test_exception_is_recorded_as_error():
+    def handler(request):
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    with pytest.raises(httpx.ConnectTimeout):
+        _call(handler, "test-error")
+
+    assert _count("test-error", "GET transactions", "error") == 1
+    assert dependency_errors._values[("test-error", "GET transactions", "error")] == 1
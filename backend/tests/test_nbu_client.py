@@ -0,0 +1,157 @@
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from services.nbu_client import CircuitBreaker, CircuitOpenError, NbuClient
+
+
+class _Nbu:
+    """API НБУ в пам'яті: статус відповіді і "засувка" на кожну дату, лічильник звернень."""
+
+    def __init__(self):
+        self.calls = []
+        self.status = {}
+        self.gates = {}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        day = request.url.params["date"]
+        self.calls.append(day)
+        if day in self.gates:
+            await self.gates[day].wait()
+        status = self.status.get(day, 200)
+        if status != 200:
+            return httpx.Response(status)
+        return httpx.Response(200, json=[{"cc": "USD", "rate": 41.5}, {"cc": "EUR", "rate": 45.0}])
+
+
+def _client(nbu, **breaker):
+    client = NbuClient(breaker=CircuitBreaker(**breaker))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(nbu.handle))
+    return client
+
+
+def test_concurrent_requests_for_one_day_are_coalesced():
+    nbu = _Nbu()
+
+    async def scenario():
+        client = _client(nbu)
+        nbu.gates["20250110"] = gate = asyncio.Event()
+        waiting = [asyncio.create_task(client.fetch_day(date(2025, 1, 10))) for _ in range(5)]
+        other = asyncio.create_task(client.fetch_day(date(2025, 1, 11)))
+        await asyncio.sleep(0.01)
+        # Скасування одного з тих, хто чекає, не скасовує спільний запит
+        waiting[0].cancel()
+        gate.set()
+        results = await asyncio.gather(*waiting[1:], other)
+        stats = client.stats()
+        await client.aclose()
+        return results, stats
+
+    results, stats = asyncio.run(scenario())
+
+    assert sorted(nbu.calls) == ["20250110", "20250111"]
+    assert all(r == {"USD": 41.5, "EUR": 45.0} for r in results)
+    assert (stats["requests_made"], stats["coalesced"], stats["in_flight"]) == (2, 4, 0)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    nbu = _Nbu()
+    nbu.status = {"20250101": 500, "20250102": 503}
+
+    async def scenario():
+        client = _client(nbu, failure_threshold=2, reset_timeout=60.0)
+        for day in (1, 2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.fetch_day(date(2025, 1, day))
+        with pytest.raises(CircuitOpenError):
+            await client.fetch_day(date(2025, 1, 3))
+        stats = client.stats()
+        await client.aclose()
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert nbu.calls == ["20250101", "20250102"]
+    assert (stats["circuit_state"], stats["rejected"]) == ("open", 1)
+
+
+def test_half_open_admits_one_probe_and_closes_on_success():
+    nbu = _Nbu()
+    nbu.status = {"20250101": 500}
+
+    async def scenario():
+        client = _client(nbu, failure_threshold=1, reset_timeout=0.0)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.fetch_day(date(2025, 1, 1))
+        nbu.gates["20250102"] = gate = asyncio.Event()
+        probe = asyncio.create_task(client.fetch_day(date(2025, 1, 2)))
+        await asyncio.sleep(0.01)
+        with pytest.raises(CircuitOpenError):
+            await client.fetch_day(date(2025, 1, 3))
+        gate.set()
+        await probe
+        assert client.breaker.state == "closed"
+        await client.fetch_day(date(2025, 1, 3))
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert nbu.calls == ["20250101", "20250102", "20250103"]
+
+
+def test_request_started_while_closed_does_not_release_the_probe():
+    nbu = _Nbu()
+    nbu.status = {"20250101": 500, "20250102": 500, "20250103": 500}
+
+    async def scenario():
+        client = _client(nbu, failure_threshold=2, reset_timeout=0.0)
+        # Повільний запит, початий ще в замкненому стані
+        nbu.gates["20250101"] = slow_gate = asyncio.Event()
+        slow = asyncio.create_task(client.fetch_day(date(2025, 1, 1)))
+        await asyncio.sleep(0.01)
+        for day in (2, 3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.fetch_day(date(2025, 1, day))
+        # Розімкнено, пауза нульова — пробний запит висить
+        nbu.gates["20250104"] = probe_gate = asyncio.Event()
+        probe = asyncio.create_task(client.fetch_day(date(2025, 1, 4)))
+        await asyncio.sleep(0.01)
+
+        slow_gate.set()
+        with pytest.raises(httpx.HTTPStatusError):
+            await slow
+        # Проба досі в польоті: другий пробний запит не пропускається
+        with pytest.raises(CircuitOpenError):
+            await client.fetch_day(date(2025, 1, 5))
+
+        probe_gate.set()
+        await probe
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert "20250105" not in nbu.calls
+
+
+def test_cancelled_probe_is_released():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    nbu = _Nbu()
+
+    async def scenario():
+        client = NbuClient(breaker=breaker)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(nbu.handle))
+        nbu.gates["20250101"] = asyncio.Event()
+        probe = asyncio.create_task(client._request_day(date(2025, 1, 1)))
+        await asyncio.sleep(0.01)
+        assert breaker.acquire() == (False, False)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert breaker.acquire() == (True, True)
@@ -0,0 +1,233 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+import core.database as database
+from core.sql_storage import DuplicateKeyError, InvalidRowError, PostgresStorage, SqliteStorage
+from repositories.rest import categories as rest_categories, profiles as rest_profiles, \
+    settings as rest_settings, transactions as rest_transactions
+from repositories.sql import categories as sql_categories, profiles as sql_profiles, \
+    settings as sql_settings, transactions as sql_transactions
+
+
+@pytest.fixture(params=["supabase", "sqlite"])
+def repos(request):
+    """Ті самі сценарії для REST-репозиторіїв (PostgREST у пам'яті) і SQL-репозиторіїв на SQLite."""
+    if request.param == "supabase":
+        request.getfixturevalue("fake")
+        yield SimpleNamespace(transactions=rest_transactions, settings=rest_settings,
+                              profiles=rest_profiles, categories=rest_categories)
+        return
+
+    storage = SqliteStorage(":memory:")
+    database._storage = storage
+    yield SimpleNamespace(transactions=sql_transactions, settings=sql_settings,
+                          profiles=sql_profiles, categories=sql_categories)
+    asyncio.run(storage.close())
+    database._storage = None
+
+
+def _tx(user_id, day, tx_type="income", amount=100.0, category_id=None, currency="UAH", original=None):
+    return {
+        "user_id": user_id, "category_id": category_id, "transaction_type": tx_type, "transaction_amount": amount,
+        "transaction_date": day, "notes": None, "is_foreign_currency": currency != "UAH", "currency_code": currency,
+        "amount_original": original, "exchange_rate": 1.0 if original is None else amount / original,
+    }
+
+
+def test_ledger_reads_and_keyset_pages(repos):
+    user_id, other = str(uuid.uuid4()), str(uuid.uuid4())
+
+    async def scenario():
+        tx = repos.transactions
+        rows = await tx.insert([_tx(user_id, f"2025-0{m}-10", "income" if m % 2 else "expense", 10.0 * m) for m in range(1, 7)])
+        await tx.insert(_tx(other, "2025-03-10"))
+        assert len(rows) == 6 and all(row["transaction_id"] for row in rows)
+
+        assert (await tx.get(rows[0]["transaction_id"], user_id))["transaction_amount"] == 10.0
+        assert await tx.get(rows[0]["transaction_id"], other) is None
+
+        page = await tx.list_page(user_id, 1, 2, start_date=date(2025, 2, 1), end_date=date(2025, 5, 31))
+        assert [r["transaction_date"] for r in page] == ["2025-04-10", "2025-03-10"]
+        incomes = await tx.list_page(user_id, 0, 10, type="income")
+        assert [r["transaction_date"] for r in incomes] == ["2025-05-10", "2025-03-10", "2025-01-10"]
+
+        seen, cursor = [], None
+        while True:
+            chunk = await tx.list_after(user_id, cursor, 4)
+            seen.extend(r["transaction_date"] for r in chunk)
+            if len(chunk) < 4:
+                break
+            last = chunk[-1]
+            cursor = (last["transaction_date"], last["created_at"], last["transaction_id"])
+        assert seen == [f"2025-0{m}-10" for m in range(6, 0, -1)]
+
+    asyncio.run(scenario())
+
+
+def test_single_and_batch_mutations_return_rows(repos):
+    user_id = str(uuid.uuid4())
+
+    async def scenario():
+        tx = repos.transactions
+        rows = await tx.insert([_tx(user_id, "2025-01-10", amount=float(i)) for i in range(5)])
+        ids = sorted(r["transaction_id"] for r in rows)
+
+        updated = await tx.update(ids[0], user_id, {"notes": "змінено"})
+        assert [r["notes"] for r in updated] == ["змінено"]
+        assert await tx.update(str(uuid.uuid4()), user_id, {"notes": "x"}) == []
+
+        matching = await tx.list_matching(user_id, ids[1], 10, columns="transaction_id")
+        assert [r["transaction_id"] for r in matching] == ids[2:]
+        by_ids = await tx.list_by_ids(user_id, ids[:2] + [str(uuid.uuid4())], "transaction_id")
+        assert sorted(r["transaction_id"] for r in by_ids) == ids[:2]
+
+        many = await tx.update_many(user_id, ids[2:], {"transaction_type": "expense"})
+        assert sorted(r["transaction_id"] for r in many) == ids[2:]
+        assert [r["transaction_id"] for r in await tx.list_matching(user_id, None, 10, type="expense")] == ids[2:]
+
+        deleted = await tx.delete(ids[0], user_id)
+        assert [r["transaction_id"] for r in deleted] == [ids[0]]
+        assert await tx.delete(ids[0], user_id) == []
+        assert sorted(r["transaction_id"] for r in await tx.delete_many(user_id, ids)) == ids[1:]
+
+    asyncio.run(scenario())
+
+
+def test_aggregate_by_month(repos):
+    user_id = str(uuid.uuid4())
+    category_id = str(uuid.uuid4())
+
+    async def scenario():
+        if repos.transactions is rest_transactions:
+            # У Supabase transactions.category_id — зовнішній ключ
+            await repos.categories.insert({"id": category_id, "user_id": user_id, "name": "Оренда", "type": "expense"})
+        await repos.transactions.insert([
+            _tx(user_id, "2025-01-10", amount=100.0), _tx(user_id, "2025-01-20", amount=50.5),
+            _tx(user_id, "2025-01-25", amount=4100.0, currency="USD", original=100.0),
+            _tx(user_id, "2025-02-01", "expense", 30.0, category_id), _tx(user_id, "2024-12-31", amount=1.0),
+        ])
+        key = lambda g: (g["month"], g["transaction_type"], str(g["category_id"]), str(g["currency_code"]))
+        plain = sorted(await repos.transactions.aggregate_by_month(user_id, start_date=date(2025, 1, 1)), key=key)
+        by_currency = sorted(await repos.transactions.aggregate_by_month(user_id, date(2025, 1, 1), date(2025, 1, 31), True), key=key)
+        return plain, by_currency
+
+    plain, by_currency = asyncio.run(scenario())
+    assert [(g["month"], g["transaction_type"], g["category_id"], g["amount"], g["tx_count"]) for g in plain] == [
+        ("2025-01", "income", None, 4250.5, 3), ("2025-02", "expense", category_id, 30.0, 1),
+    ]
+    assert [(g["currency_code"], g["amount"], g["amount_original"], g["tx_count"]) for g in by_currency] == [
+        ("UAH", 150.5, 150.5, 2), ("USD", 4100.0, 100.0, 1),
+    ]
+
+
+def test_patch_financials_recomputes_in_one_statement(repos):
+    user_id = str(uuid.uuid4())
+
+    async def scenario():
+        tx = repos.transactions
+        row, = await tx.insert([_tx(user_id, "2025-01-10", amount=4100.0, currency="USD", original=100.0)])
+        tx_id = row["transaction_id"]
+
+        amount_only, = await tx.patch_financials(tx_id, user_id, {"amount": 200.0})
+        assert (amount_only["transaction_amount"], amount_only["amount_original"], amount_only["exchange_rate"]) == (8200.0, 200.0, 41.0)
+        assert (amount_only["old_transaction_amount"], amount_only["old_transaction_date"]) == (4100.0, "2025-01-10")
+
+        # Нова дата без курсу НБУ для неї — рядок не змінюється
+        assert await tx.patch_financials(tx_id, user_id, {"date": "2025-02-03"}) == []
+        assert await tx.patch_financials(tx_id, user_id, {"date": "2025-02-03", "nbu_rate": 42.0,
+                                                          "rate_currency": "EUR", "rate_date": "2025-02-03"}) == []
+        moved, = await tx.patch_financials(tx_id, user_id, {"date": "2025-02-03", "transaction_type": "expense", "nbu_rate": 42.0,
+                                                            "rate_currency": "USD", "rate_date": "2025-02-03"})
+        assert (moved["transaction_amount"], moved["transaction_date"], moved["transaction_type"]) == (8400.0, "2025-02-03", "expense")
+        assert (moved["old_transaction_type"], moved["old_transaction_amount"]) == ("income", 8200.0)
+
+        uah, = await tx.patch_financials(tx_id, user_id, {"currency": "UAH", "amount": 500.0})
+        assert (uah["transaction_amount"], uah["amount_original"], uah["exchange_rate"], uah["is_foreign_currency"]) == (500.0, None, 1.0, False)
+        manual, = await tx.patch_financials(tx_id, user_id, {"currency": "EUR", "manual_rate": 45.0})
+        assert (manual["transaction_amount"], manual["amount_original"], manual["currency_code"]) == (22500.0, 500.0, "EUR")
+
+        assert await tx.patch_financials(str(uuid.uuid4()), user_id, {"amount": 1.0}) == []
+
+    asyncio.run(scenario())
+
+
+def test_settings_profiles_and_categories(repos):
+    user_id = str(uuid.uuid4())
+
+    async def scenario():
+        assert await repos.settings.get(user_id) is None
+        await repos.settings.upsert(user_id, {"fop_group": 3, "income_tax_percent": 5.0})
+        merged = await repos.settings.upsert(user_id, {"is_vat_payer": True})
+        assert (merged[0]["fop_group"], merged[0]["is_vat_payer"]) == (3, True)
+        assert (await repos.settings.get(user_id, "fop_group, is_vat_payer")) == {"fop_group": 3, "is_vat_payer": True}
+
+        await repos.profiles.insert({"id": user_id, "full_name": "Тест", "is_fop": False})
+        with pytest.raises(DuplicateKeyError):
+            await repos.profiles.insert({"id": user_id, "full_name": "Дубль", "is_fop": True})
+        assert (await repos.profiles.update(user_id, {"full_name": "Нове"}))[0]["full_name"] == "Нове"
+        assert user_id in await repos.profiles.list_ids(0, 10)
+        assert [p["id"] for p in await repos.profiles.delete(user_id)] == [user_id]
+
+        system = (await repos.categories.insert({"user_id": None, "name": "Системна", "type": "income"}))[0]
+        own = (await repos.categories.insert({"user_id": user_id, "name": "Своя", "type": "expense"}))[0]
+        assert own["is_fop_only"] is False
+        assert system["id"] in [c["id"] for c in await repos.categories.list_system()]
+        assert [c["name"] for c in await repos.categories.list_own(user_id)] == ["Своя"]
+        assert (await repos.categories.update_name(own["id"], user_id, "Перейменована"))[0]["name"] == "Перейменована"
+        assert await repos.categories.delete(system["id"], user_id) == []
+        assert [c["id"] for c in await repos.categories.delete(own["id"], user_id)] == [own["id"]]
+
+    asyncio.run(scenario())
+
+
+class _Connection:
+    """Двійник з'єднання asyncpg: рахує prepare і fetch, повертає передані параметри як рядок."""
+
+    def __init__(self):
+        self.prepared, self.fetched = [], []
+
+    async def prepare(self, query):
+        self.prepared.append(query)
+
+        class Statement:
+            def get_parameters(self):
+                return [SimpleNamespace(name="uuid"), SimpleNamespace(name="numeric")]
+
+            async def fetch(self, *args):
+                return [{"id": args[0], "amount": args[1]}]
+
+        return Statement()
+
+    async def fetch(self, query, *args):
+        self.fetched.append(query)
+        return [{"id": args[0], "amount": args[1]}]
+
+
+def test_postgres_prepares_each_query_text_once():
+    connection = _Connection()
+
+    @asynccontextmanager
+    async def acquire():
+        yield connection
+
+    storage = PostgresStorage("postgresql://unused")
+    storage._pool = SimpleNamespace(acquire=acquire)
+    row_id = str(uuid.uuid4())
+    sql = "SELECT id, amount FROM transactions WHERE id = ? AND amount > ?"
+
+    async def scenario():
+        return [await storage.fetch(sql, [row_id, 1.5]) for _ in range(3)]
+
+    results = asyncio.run(scenario())
+
+    assert connection.prepared == ["SELECT id, amount FROM transactions WHERE id = $1 AND amount > $2"]
+    assert connection.fetched == connection.prepared * 2
+    assert results[0] == results[2] == [{"id": row_id, "amount": 1.5}]
+    with pytest.raises(InvalidRowError):
+        asyncio.run(storage.fetch(sql, ["not-a-uuid", 1.0]))
+    assert len(connection.prepared) == 1
@@ -0,0 +1,89 @@
+import asyncio
+
+import services.rollup_service as rollup_service
+from services.rollup_service import get_summary, rebuild_user, record_rows
+from tests.conftest import seed_transactions, seed_user
+
+
+def _concurrent_write_during_scan(monkeypatch, fake, user_id, seen_by_scan: bool):
+    """Під час першої сторінки сканування журналу в нього записується нова транзакція."""
+    scan = rollup_service.transactions_repo.list_matching
+    written = []
+
+    async def list_matching(*args, **kwargs):
+        if not written:
+            if seen_by_scan:
+                row = seed_transactions(fake, user_id, [("2025-03-10", "income", 500.0)])[0]
+                page = await scan(*args, **kwargs)
+            else:
+                page = await scan(*args, **kwargs)
+                row = seed_transactions(fake, user_id, [("2025-03-10", "income", 500.0)])[0]
+            written.append(await record_rows(user_id, inserted=[row]))
+            return page
+        return await scan(*args, **kwargs)
+
+    monkeypatch.setattr(rollup_service.transactions_repo, "list_matching", list_matching)
+
+
+def test_write_missed_by_scan_is_not_lost(monkeypatch, fake, user_id):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-01-05", "income", 1000.0), ("2025-02-01", "expense", 200.0)])
+    _concurrent_write_during_scan(monkeypatch, fake, user_id, seen_by_scan=False)
+
+    summary = asyncio.run(get_summary(user_id))
+
+    assert summary["totalIncome"] == 1500.0
+    assert summary["totalExpense"] == 200.0
+
+
+def test_write_seen_by_scan_is_counted_once(monkeypatch, fake, user_id):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-01-05", "income", 1000.0)])
+    _concurrent_write_during_scan(monkeypatch, fake, user_id, seen_by_scan=True)
+
+    summary = asyncio.run(get_summary(user_id))
+
+    assert summary["totalIncome"] == 1500.0
+
+
+def test_record_rows_is_idempotent(fake, user_id):
+    seed_user(fake, user_id)
+    rows = seed_transactions(fake, user_id, [("2025-01-05", "income", 1000.0)])
+
+    async def scenario():
+        await get_summary(user_id)
+        new = seed_transactions(fake, user_id, [("2025-04-01", "income", 300.0)])
+        first = await record_rows(user_id, inserted=new)
+        repeated = await record_rows(user_id, inserted=new)
+        moved = dict(rows[0], transaction_date="2024-12-31")
+        year_change = await record_rows(user_id, removed=rows, inserted=[moved])
+        return first, repeated, year_change, await get_summary(user_id)
+
+    first, repeated, year_change, summary = asyncio.run(scenario())
+
+    assert first == {2025: 300.0}
+    assert repeated == {}
+    assert year_change == {2024: 1000.0, 2025: -1000.0}
+    assert summary["totalIncome"] == 1300.0
+
+
+def test_concurrent_rebuilds_scan_once(monkeypatch, fake, user_id):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-01-05", "income", 1000.0)])
+    scan = rollup_service.transactions_repo.list_matching
+    scans = []
+
+    async def list_matching(*args, **kwargs):
+        scans.append(args)
+        await asyncio.sleep(0)
+        return await scan(*args, **kwargs)
+
+    monkeypatch.setattr(rollup_service.transactions_repo, "list_matching", list_matching)
+
+    async def scenario():
+        await asyncio.gather(*(get_summary(user_id) for _ in range(5)))
+        await rebuild_user(user_id)
+        return await get_summary(user_id)
+
+    assert asyncio.run(scenario())["totalIncome"] == 1000.0
+    assert len(scans) == 2
@@ -0,0 +1,139 @@
+import uuid
+
+from routers import transactions as transactions_router
+from tests.conftest import seed_transactions, seed_user
+
+
+def _summary(client, user_id):
+    response = client.get("/transactions/summary", params={"user_id": user_id})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_delete_returns_404_for_missing_or_foreign_row(client, fake, user_id):
+    seed_user(fake, user_id)
+    other = str(uuid.uuid4())
+    row, = seed_transactions(fake, other, [("2025-01-10", "income", 1000.0)])
+
+    before = fake.requests
+    assert client.delete(f"/transactions/{uuid.uuid4()}", params={"user_id": user_id}).status_code == 404
+    assert client.delete(f"/transactions/{row['transaction_id']}", params={"user_id": user_id}).status_code == 404
+    assert fake.requests - before == 2
+    assert len(fake.tables["transactions"]) == 1
+
+
+def test_delete_updates_summary_from_returned_row(client, fake, user_id):
+    seed_user(fake, user_id)
+    kept, removed = seed_transactions(fake, user_id, [("2025-01-10", "income", 1000.0), ("2025-02-10", "income", 250.0)])
+    assert _summary(client, user_id)["totalIncome"] == 1250.0
+
+    response = client.delete(f"/transactions/{removed['transaction_id']}", params={"user_id": user_id})
+
+    assert response.status_code == 200, response.text
+    assert [row["transaction_id"] for row in fake.tables["transactions"]] == [kept["transaction_id"]]
+    assert _summary(client, user_id)["totalIncome"] == 1000.0
+
+
+def test_category_only_patch_is_one_update(client, fake, user_id):
+    seed_user(fake, user_id)
+    category, = fake.seed("categories", [{"user_id": user_id, "name": "Оренда", "type": "expense"}])
+    row, = seed_transactions(fake, user_id, [("2025-01-10", "expense", 300.0)])
+    assert _summary(client, user_id)["totalExpense"] == 300.0
+
+    missing = client.patch(f"/transactions/{uuid.uuid4()}", params={"user_id": user_id}, json={"category_id": category["id"]})
+    assert missing.status_code == 404
+
+    before = fake.requests
+    response = client.patch(f"/transactions/{row['transaction_id']}", params={"user_id": user_id},
+                            json={"category_id": category["id"], "description": "офіс"})
+    assert response.status_code == 200, response.text
+    assert fake.requests - before == 1
+    assert response.json()["changes"] == {"category_id": category["id"], "notes": "офіс"}
+    assert fake.tables["transactions"][0]["category_id"] == category["id"]
+    assert _summary(client, user_id)["totalExpense"] == 300.0
+
+
+def test_amount_patch_moves_rollups(client, fake, user_id):
+    seed_user(fake, user_id)
+    row, = seed_transactions(fake, user_id, [("2025-01-10", "income", 1000.0)])
+    assert _summary(client, user_id)["totalIncome"] == 1000.0
+
+    response = client.patch(f"/transactions/{row['transaction_id']}", params={"user_id": user_id}, json={"amount": 400.0, "type": "expense"})
+
+    assert response.status_code == 200, response.text
+    summary = _summary(client, user_id)
+    assert (summary["totalIncome"], summary["totalExpense"]) == (0.0, 400.0)
+
+
+def test_settings_patch_upserts_and_merges(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=0)
+
+    created = client.patch(f"/settings/{user_id}", json={"fop_group": 2, "income_tax_percent": None})
+    assert created.status_code == 200, created.text
+    updated = client.patch(f"/settings/{user_id}", json={"is_zed": True})
+    assert updated.status_code == 200, updated.text
+
+    rows = fake.tables["fop_settings"]
+    assert len(rows) == 1
+    assert (rows[0]["fop_group"], rows[0]["is_zed"]) == (2, True)
+
+
+def test_duplicate_profile_is_409(client, fake, user_id):
+    seed_user(fake, user_id)
+
+    response = client.post("/profile/", json={"user_id": user_id, "full_name": "Ще раз", "is_fop": True})
+
+    assert response.status_code == 409
+    assert [p["full_name"] for p in fake.tables["profiles"]] == ["Тест"]
+
+
+def test_amount_patch_is_one_database_call(client, fake, user_id):
+    seed_user(fake, user_id)
+    row, = seed_transactions(fake, user_id, [("2025-01-10", "income", 1000.0)])
+    _summary(client, user_id)
+
+    before = fake.requests
+    response = client.patch(f"/transactions/{row['transaction_id']}", params={"user_id": user_id}, json={"amount": 400.0})
+
+    assert response.status_code == 200, response.text
+    # Один виклик patch_transaction_financials + налаштування для перевірки лімітів
+    assert fake.requests - before == 2
+    assert response.json()["full_data"][0]["transaction_amount"] == 400.0
+    assert _summary(client, user_id)["totalIncome"] == 400.0
+
+
+def test_currency_patch_takes_nbu_rate_for_new_pair(client, fake, user_id, monkeypatch):
+    seed_user(fake, user_id)
+    row, = seed_transactions(fake, user_id, [("2025-01-10", "income", 1000.0)])
+    asked = []
+
+    async def rate(currency, day):
+        asked.append((currency, day.isoformat()))
+        return 41.5
+
+    monkeypatch.setattr(transactions_router, "get_nbu_rate", rate)
+    response = client.patch(f"/transactions/{row['transaction_id']}", params={"user_id": user_id},
+                            json={"amount": 100.0, "currency": "USD", "date": "2025-02-03"})
+
+    assert response.status_code == 200, response.text
+    assert asked == [("USD", "2025-02-03")]
+    stored = fake.tables["transactions"][0]
+    assert (stored["transaction_amount"], stored["amount_original"], stored["exchange_rate"]) == (4150.0, 100.0, 41.5)
+    assert (stored["currency_code"], stored["is_foreign_currency"], stored["transaction_date"]) == ("USD", True, "2025-02-03")
+    assert _summary(client, user_id)["totalIncome"] == 4150.0
+
+
+def test_patch_without_nbu_rate_is_400_and_missing_row_404(client, fake, user_id, monkeypatch):
+    seed_user(fake, user_id)
+    row, = seed_transactions(fake, user_id, [("2025-01-10", "income", 1000.0)])
+
+    async def no_rate(currency, day):
+        return 0
+
+    monkeypatch.setattr(transactions_router, "get_nbu_rate", no_rate)
+    unavailable = client.patch(f"/transactions/{row['transaction_id']}", params={"user_id": user_id},
+                               json={"currency": "USD", "date": "2025-02-03"})
+    missing = client.patch(f"/transactions/{uuid.uuid4()}", params={"user_id": user_id}, json={"amount": 1.0})
+
+    assert (unavailable.status_code, missing.status_code) == (400, 404)
+    assert fake.tables["transactions"][0]["currency_code"] == "UAH"
@@ -0,0 +1,145 @@
+from datetime import date
+from itertools import product
+
+import pytest
+
+from models.common import ActivityType, FopGroup, ReportingPeriod
+from models.setting import FopSettingsBase
+from services.tax_service import TaxService
+
+# Сітка: усі групи, з налаштованими ставками і без, з ПДВ і без, з працівниками і землею
+SETTINGS = [
+    FopSettingsBase(
+        fop_group=group, is_vat_payer=vat, income_tax_percent=percent, military_tax_percent=military,
+        has_employees=employees > 0, employees_count=employees,
+        activity_type=ActivityType.AGRICULTURE if group == FopGroup.GROUP_4 else ActivityType.SERVICES,
+        land_area_ha=land, normative_land_value=40000.0 if land else None,
+    )
+    for group, vat, (percent, military), employees, land in product(
+        FopGroup, (False, True), ((None, None), (5.0, 1.0), (3.0, 1.5)), (0, 12), (None, 25.0)
+    )
+]
+INCOMES = [0.0, 1.0, 9999.99, 1_185_000.0, 1_330_000.0, 5_900_000.0, 8_285_700.0, 12_000_000.0]
+# Дати з різними наборами правил: 2024 (дві редакції), 2025, 2026 і "сьогодні"
+DATES = [None, date(2024, 2, 15), date(2024, 7, 1), date(2025, 12, 31), date(2026, 3, 1)]
+
+GRID = list(product(SETTINGS, INCOMES, DATES))
+GRID_SETTINGS = [st for st, _, _ in GRID]
+GRID_INCOMES = [income for _, income, _ in GRID]
+GRID_DATES = [on_date for _, _, on_date in GRID]
+
+
+@pytest.mark.parametrize("period", list(ReportingPeriod))
+def test_calculate_taxes_batch_matches_scalar_on_grid(period):
+    batch = TaxService.calculate_taxes_batch(GRID_SETTINGS, GRID_INCOMES, period, GRID_DATES)
+
+    assert batch == [TaxService.calculate_taxes(st, income, period, on_date) for st, income, on_date in GRID]
+
+
+def test_restrictions_and_warnings_batch_match_scalar_on_grid():
+    errors = TaxService.verify_group_restrictions_batch(GRID_SETTINGS, GRID_INCOMES, iter(GRID_DATES))
+    warnings = TaxService.get_warnings_batch(GRID_SETTINGS, GRID_INCOMES, GRID_DATES)
+
+    assert errors == [TaxService.verify_group_restrictions(st, income, on_date) for st, income, on_date in GRID]
+    assert warnings == [TaxService.get_warnings(st, income, on_date) for st, income, on_date in GRID]
+
+
+def test_evaluate_batch_takes_monthly_income_as_is():
+    monthly = [income / 7 if i % 2 else 0.0 for i, income in enumerate(GRID_INCOMES)]
+
+    batch = TaxService.evaluate_batch(GRID_SETTINGS, GRID_INCOMES, monthly, ReportingPeriod.QUARTER, (d for d in GRID_DATES))
+
+    expected = [
+        {
+            "taxes": TaxService.calculate_taxes(st, m, ReportingPeriod.QUARTER, on_date),
+            "errors": TaxService.verify_group_restrictions(st, income, on_date),
+            "warnings": TaxService.get_warnings(st, income, on_date),
+        }
+        for (st, income, on_date), m in zip(GRID, monthly)
+    ]
+    assert batch == expected
+    # Місяць без доходу — без єдиного податку 3-ї групи, а не річний / 12
+    g3 = FopSettingsBase(fop_group=FopGroup.GROUP_3)
+    zero, = TaxService.evaluate_batch([g3], [1_200_000.0], [0.0], on_dates=[date(2025, 6, 1)])
+    assert (zero["taxes"]["single_tax"], zero["taxes"]["military_tax"]) == (0.0, 0.0)
+
+
+def test_simulate_spreads_annual_income_evenly():
+    result = TaxService.simulate(FopSettingsBase(fop_group=FopGroup.GROUP_3), [1_200_000.0], on_date=date(2025, 6, 1))
+
+    current = next(sc for sc in result["scenarios"] if sc["is_current"])
+    assert (current["single_tax"], current["military_tax"], current["esv"]) == ([5000.0], [1000.0], [1760.0])
+
+
+# Фіксовані очікувані суми: обидва шляхи (скалярний і пакетний) мають їх відтворити
+G3 = FopSettingsBase(fop_group=FopGroup.GROUP_3)
+G3_VAT = FopSettingsBase(fop_group=FopGroup.GROUP_3, is_vat_payer=True)
+G1 = FopSettingsBase(fop_group=FopGroup.GROUP_1)
+G1_STAFF = FopSettingsBase(fop_group=FopGroup.GROUP_1, has_employees=True, employees_count=1)
+G2 = FopSettingsBase(fop_group=FopGroup.GROUP_2)
+G4 = FopSettingsBase(fop_group=FopGroup.GROUP_4, activity_type=ActivityType.AGRICULTURE, land_area_ha=25.0, normative_land_value=40000.0)
+
+TAX_CASES = [
+    # (налаштування, місячний дохід, період, дата) -> (єдиний податок, ЄСВ, військовий збір, усього за місяць)
+    (G3, 100000.0, ReportingPeriod.MONTH, date(2025, 6, 1), (5000.0, 1760.0, 1000.0, 7760.0)),
+    (G3, 100000.0, ReportingPeriod.MONTH, date(2024, 2, 15), (5000.0, 1562.0, 0.0, 6562.0)),
+    (G3, 100000.0, ReportingPeriod.MONTH, date(2024, 4, 1), (5000.0, 1760.0, 0.0, 6760.0)),
+    (G3_VAT, 100000.0, ReportingPeriod.QUARTER, date(2025, 6, 1), (9000.0, 5280.0, 3000.0, 5760.0)),
+    (G1, 0.0, ReportingPeriod.MONTH, date(2025, 12, 31), (302.8, 1760.0, 800.0, 2862.8)),
+    (G1, 0.0, ReportingPeriod.QUARTER, date(2026, 1, 1), (998.4, 5707.02, 2594.1, 3099.84)),
+    (G2, 50000.0, ReportingPeriod.YEAR, date(2025, 6, 1), (19200.0, 21120.0, 9600.0, 4160.0)),
+    (G4, 0.0, ReportingPeriod.MONTH, date(2025, 6, 1), (791.67, 1760.0, 800.0, 3351.67)),
+]
+
+LIMIT_CASES = [
+    # (налаштування, річний дохід, дата) -> (помилки, попередження)
+    (G1, 1_336_000.0, date(2025, 6, 1), ([], ["LIMIT_APPROACHING", "VAT_REGISTRATION_REQUIRED"])),
+    (G1_STAFF, 1_336_000.01, date(2025, 6, 1), (
+        ["GROUP_1_VIOLATION: Income exceeds UAH 1,336,000", "GROUP_1_VIOLATION: Employees are prohibited"],
+        ["LIMIT_APPROACHING", "VAT_REGISTRATION_REQUIRED"])),
+    (G3, 9_000_000.0, date(2024, 12, 31), (
+        ["AUTO_TRANSITION_GENERAL: Income exceeds UAH 8,285,700. Transition to general system required."],
+        ["LIMIT_APPROACHING", "VAT_REGISTRATION_REQUIRED"])),
+    (G3, 9_000_000.0, date(2025, 1, 1), ([], ["LIMIT_APPROACHING", "VAT_REGISTRATION_REQUIRED"])),
+    (G3, 8_402_399.0, date(2025, 1, 1), ([], ["VAT_REGISTRATION_REQUIRED"])),
+    (G3_VAT, 8_402_400.0, date(2025, 1, 1), ([], ["LIMIT_APPROACHING"])),
+    (G2, 500_000.0, date(2025, 6, 1), ([], [])),
+    (G4, 50_000_000.0, date(2025, 6, 1), ([], ["VAT_REGISTRATION_REQUIRED"])),
+]
+
+
+def _taxes(row):
+    return (row["single_tax"], row["esv"], row["military_tax"], row["total_monthly_tax"])
+
+
+@pytest.mark.parametrize("settings, income, period, on_date, expected", TAX_CASES)
+def test_taxes_match_fixed_values(settings, income, period, on_date, expected):
+    assert _taxes(TaxService.calculate_taxes(settings, income, period, on_date)) == expected
+    # Пакет з повторами тих самих налаштувань — один профіль на кілька рядків
+    batch = TaxService.calculate_taxes_batch([settings] * 3, [income] * 3, period, [on_date] * 3)
+    assert [_taxes(row) for row in batch] == [expected] * 3
+
+
+def test_mixed_batch_matches_fixed_values():
+    batch = TaxService.calculate_taxes_batch(
+        [c[0] for c in TAX_CASES], [c[1] for c in TAX_CASES], ReportingPeriod.MONTH, [c[3] for c in TAX_CASES]
+    )
+    monthly_cases = [c for c in TAX_CASES if c[2] == ReportingPeriod.MONTH]
+    monthly_rows = [row for row, c in zip(batch, TAX_CASES) if c[2] == ReportingPeriod.MONTH]
+    assert [_taxes(row) for row in monthly_rows] == [c[4] for c in monthly_cases]
+
+
+@pytest.mark.parametrize("settings, income, on_date, expected", LIMIT_CASES)
+def test_limits_match_fixed_values(settings, income, on_date, expected):
+    errors, warnings = expected
+    assert TaxService.verify_group_restrictions(settings, income, on_date) == errors
+    assert TaxService.get_warnings(settings, income, on_date) == warnings
+    assert TaxService.verify_group_restrictions_batch([settings], [income], [on_date]) == [errors]
+    assert TaxService.get_warnings_batch([settings], [income], [on_date]) == [warnings]
+
+
+def test_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        TaxService.calculate_taxes_batch(SETTINGS[:2], INCOMES[:1])
+    with pytest.raises(ValueError):
+        TaxService.get_warnings_batch(SETTINGS[:2], INCOMES[:2], DATES[:1])
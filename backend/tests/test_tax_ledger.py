@@ -0,0 +1,44 @@
+import pytest
+
+from tests.conftest import seed_transactions, seed_user
+
+
+@pytest.fixture
+def ledger_user(fake, user_id):
+    # 3-я група, 5%: лише один дохід у січні і витрата, яка в податок не входить
+    seed_user(fake, user_id, fop_group=3)
+    seed_transactions(fake, user_id, [("2025-01-10", "income", 120000.0), ("2025-05-02", "expense", 5000.0)])
+    return user_id
+
+
+def _calculate(client, user_id, **params):
+    response = client.get("/tax/calculate", params={"user_id": user_id, "source": "ledger", **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_month_without_income_is_taxed_as_zero(client, ledger_user):
+    body = _calculate(client, ledger_user, period="month", as_of="2025-05-15")
+
+    assert body["income"] == {"as_of": "2025-05-15", "month": 0.0, "quarter": 0.0, "year_to_date": 120000.0}
+    assert body["taxes"]["single_tax"] == 0.0
+    assert body["taxes"]["military_tax"] == 0.0
+
+
+def test_period_income_is_used_as_is(client, ledger_user):
+    quarter = _calculate(client, ledger_user, period="quarter", as_of="2025-03-31")
+    empty_quarter = _calculate(client, ledger_user, period="quarter", as_of="2025-06-30")
+    year = _calculate(client, ledger_user, period="year", as_of="2025-12-31")
+
+    assert quarter["taxes"]["single_tax"] == 6000.0
+    assert empty_quarter["taxes"]["single_tax"] == 0.0
+    assert year["taxes"]["single_tax"] == 6000.0
+
+
+def test_query_income_still_falls_back_to_annual(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+
+    response = client.get("/tax/calculate", params={"user_id": user_id, "annual_income": 120000, "as_of": "2025-05-15"})
+
+    assert response.status_code == 200
+    assert response.json()["taxes"]["single_tax"] == 500.0
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+import core.tax_rules as tax_rules_module
+import routers.tax as tax_router
+from core.tax_rules import RULE_SETS, CompiledTaxRules, tax_rules
+from services.tax_service import TaxService
+from tests.conftest import seed_user
+
+JAN_2024, APR_2024, Y2025, Y2026 = RULE_SETS
+
+
+class _Today(date):
+    """date, у якої "сьогодні" — 18.10.2026."""
+
+    @classmethod
+    def today(cls):
+        return cls(2026, 10, 18)
+
+
+@pytest.mark.parametrize("on_date, expected", [
+    # До першого набору — найраніший відомий
+    (date(2023, 12, 31), JAN_2024),
+    (date(2024, 1, 1), JAN_2024),
+    (date(2024, 3, 31), JAN_2024),
+    (date(2024, 4, 1), APR_2024),
+    (date(2024, 12, 31), APR_2024),
+    (date(2025, 1, 1), Y2025),
+    (date(2025, 12, 31), Y2025),
+    (date(2026, 1, 1), Y2026),
+    (date(2030, 6, 15), Y2026),
+])
+def test_rule_set_is_chosen_at_its_boundaries(on_date, expected):
+    # Свіжий індекс: кеш по місяцях не підміняє пошук bisect
+    assert CompiledTaxRules(RULE_SETS).for_date(on_date) is expected
+    assert tax_rules.for_date(on_date) is expected
+
+
+def test_rule_sets_are_sorted_on_compile():
+    rules = CompiledTaxRules(list(reversed(RULE_SETS)))
+
+    assert rules.rule_sets == tuple(RULE_SETS)
+    assert rules.for_date(date(2024, 4, 1)) is APR_2024
+    with pytest.raises(ValueError):
+        CompiledTaxRules([])
+
+
+def test_default_date_is_today(monkeypatch):
+    monkeypatch.setattr(tax_rules_module, "date", _Today)
+
+    assert CompiledTaxRules(RULE_SETS).for_date() is Y2026
+
+
+@pytest.mark.parametrize("on_date, rules", [(date(2024, 2, 15), JAN_2024), (date(2024, 7, 1), APR_2024)])
+def test_payment_calendar_2024_has_no_military_tax(on_date, rules):
+    calendar = TaxService.get_payment_calendar(on_date)
+
+    assert not [e for e in calendar if e["event"].startswith("Військовий збір")]
+    assert calendar[0]["amount"] == rules.min_esv
+    assert [e["amount"] for e in calendar if e["event"] == "Єдиний податок" and "amount" in e] == [302.8, 1420.0]
+
+
+@pytest.mark.parametrize("on_date, rules", [(date(2025, 12, 31), Y2025), (date(2026, 1, 1), Y2026)])
+def test_payment_calendar_from_2025_adds_military_tax(on_date, rules):
+    calendar = {(e["event"], e["group"]): e for e in TaxService.get_payment_calendar(on_date)}
+
+    assert calendar[("ЄСВ (Єдиний соціальний внесок)", "Усі (1, 2, 3, 4)")]["amount"] == rules.min_esv
+    assert calendar[("Єдиний податок", "1")]["amount"] == rules.single_tax_g1
+    assert calendar[("Єдиний податок", "2")]["amount"] == rules.single_tax_g2
+    assert calendar[("Військовий збір (фіксований)", "1, 2, 4")]["amount"] == rules.fixed_military_tax
+    assert ("Військовий збір (1% від доходу)", "3") in calendar
+
+
+def test_calculate_without_as_of_uses_todays_rules(client, fake, user_id, monkeypatch):
+    seed_user(fake, user_id, fop_group=1)
+    monkeypatch.setattr(tax_router, "date_type", _Today)
+
+    response = client.get("/tax/calculate", params={"user_id": user_id})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["taxes"]["single_tax"], body["taxes"]["esv"]) == (Y2026.single_tax_g1, Y2026.min_esv)
+    assert body["calendar"] == TaxService.get_payment_calendar(date(2026, 10, 18))
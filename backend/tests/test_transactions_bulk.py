@@ -0,0 +1,113 @@
+import uuid
+
+import pytest
+
+import routers.transactions as transactions_router
+from tests.conftest import seed_transactions, seed_user
+
+
+def _summary(client, user_id):
+    response = client.get("/transactions/summary", params={"user_id": user_id})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _bulk_delete(client, user_id, body):
+    return client.request("DELETE", "/transactions/bulk", params={"user_id": user_id}, json=body)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(transactions_router, "BULK_MUTATION_CHUNK", 2)
+
+
+def test_bulk_delete_by_ids_reports_each_item(client, fake, user_id, small_chunks):
+    seed_user(fake, user_id)
+    own = seed_transactions(fake, user_id, [("2025-01-10", "income", 100.0), ("2025-01-11", "income", 200.0), ("2025-01-12", "income", 300.0)])
+    foreign, = seed_transactions(fake, str(uuid.uuid4()), [("2025-01-10", "income", 1.0)])
+    assert _summary(client, user_id)["totalIncome"] == 600.0
+    missing = str(uuid.uuid4())
+    ids = [own[0]["transaction_id"], own[2]["transaction_id"], foreign["transaction_id"], missing, own[0]["transaction_id"]]
+
+    response = _bulk_delete(client, user_id, {"ids": ids})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["total"], body["deleted"], body["not_found"], body["failed"]) == (4, 2, 2, 0)
+    assert [item["status"] for item in body["items"]] == ["deleted", "deleted", "not_found", "not_found"]
+    assert len(fake.tables["transactions"]) == 2
+    assert _summary(client, user_id)["totalIncome"] == 200.0
+
+
+def test_bulk_delete_by_filter_spans_pages(client, fake, user_id, small_chunks):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-01-%02d" % day, "expense", 10.0) for day in range(1, 13)]
+                      + [("2025-01-05", "income", 500.0), ("2025-02-01", "expense", 7.0)])
+    assert _summary(client, user_id)["totalExpense"] == 127.0
+
+    response = _bulk_delete(client, user_id, {"filter": {"type": "expense", "start_date": "2025-01-01", "end_date": "2025-01-31"}})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["deleted"] == 12
+    summary = _summary(client, user_id)
+    assert (summary["totalIncome"], summary["totalExpense"]) == (500.0, 7.0)
+
+
+def test_bulk_category_patch_applies_to_the_selected_set(client, fake, user_id, small_chunks):
+    seed_user(fake, user_id)
+    old, new = fake.seed("categories", [
+        {"user_id": user_id, "name": "Стара", "type": "expense"}, {"user_id": user_id, "name": "Нова", "type": "expense"},
+    ])
+    seed_transactions(fake, user_id, [
+        {"user_id": user_id, "category_id": old["id"] if i < 7 else None, "transaction_type": "expense", "transaction_amount": 10.0,
+         "transaction_date": "2025-03-01", "notes": None, "is_foreign_currency": False, "currency_code": "UAH",
+         "amount_original": None, "exchange_rate": 1.0}
+        for i in range(9)
+    ])
+
+    response = client.patch("/transactions/bulk", params={"user_id": user_id},
+                            json={"filter": {"category_id": old["id"]}, "patch": {"category_id": new["id"]}})
+
+    assert response.status_code == 200, response.text
+    assert (response.json()["total"], response.json()["updated"]) == (7, 7)
+    assert sorted(str(row["category_id"]) for row in fake.tables["transactions"]) == sorted([new["id"]] * 7 + ["None"] * 2)
+
+
+def test_bulk_amount_patch_keeps_summary_consistent(client, fake, user_id, small_chunks):
+    seed_user(fake, user_id)
+    rows = seed_transactions(fake, user_id, [("2024-12-20", "income", 100.0), ("2025-01-10", "income", 200.0), ("2025-02-10", "expense", 300.0)])
+    assert _summary(client, user_id)["totalIncome"] == 300.0
+
+    response = client.patch("/transactions/bulk", params={"user_id": user_id}, json={
+        "ids": [row["transaction_id"] for row in rows[:2]] + [str(uuid.uuid4())], "patch": {"amount": 50.0},
+    })
+
+    assert response.status_code == 200, response.text
+    assert (response.json()["updated"], response.json()["not_found"]) == (2, 1)
+    summary = _summary(client, user_id)
+    assert (summary["totalIncome"], summary["totalExpense"]) == (100.0, 300.0)
+    rebuilt = client.post("/transactions/summary/rebuild", params={"user_id": user_id}).json()["summary"]
+    assert (rebuilt["totalIncome"], rebuilt["totalExpense"]) == (100.0, 300.0)
+
+
+@pytest.mark.parametrize("body", [
+    {"ids": ["a"], "filter": {"type": "income"}},
+    {},
+    {"ids": []},
+    {"filter": {}},
+])
+def test_bulk_delete_rejects_bad_selection(client, fake, user_id, body):
+    assert _bulk_delete(client, user_id, body).status_code == 400
+
+
+def test_bulk_patch_rejects_empty_patch_and_oversized_selection(client, fake, user_id, monkeypatch):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-01-10", "income", 1.0)] * 3)
+    monkeypatch.setattr(transactions_router, "MAX_BULK_MUTATION_ITEMS", 2)
+
+    empty = client.patch("/transactions/bulk", params={"user_id": user_id}, json={"ids": ["a"], "patch": {}})
+    assert empty.status_code == 400
+    oversized = client.patch("/transactions/bulk", params={"user_id": user_id},
+                             json={"filter": {"type": "income"}, "patch": {"description": "x"}})
+    assert oversized.status_code == 400
+    assert all(row["notes"] is None for row in fake.tables["transactions"])
@@ -0,0 +1,71 @@
+import base64
+import json
+
+import pytest
+
+from tests.conftest import seed_transactions, seed_user
+
+
+def _cursor(*values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode().rstrip("=")
+
+
+def _pages(client, user_id, limit):
+    pages, cursor = [], None
+    while True:
+        params = {"user_id": user_id, "limit": limit, "pagination": "cursor"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/transactions/", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_pages_cover_ledger_once_in_order(client, fake, user_id):
+    seed_user(fake, user_id)
+    # Кілька рядків на одну дату: порядок всередині дня — created_at, потім transaction_id
+    seed_transactions(fake, user_id, [
+        ("2025-03-01", "income", 100.0), ("2025-03-01", "income", 200.0), ("2025-03-01", "expense", 50.0),
+        ("2025-02-15", "income", 300.0), ("2025-02-15", "expense", 10.0),
+        ("2025-01-31", "income", 400.0), ("2024-12-31", "income", 500.0),
+    ])
+
+    pages = _pages(client, user_id, limit=3)
+    rows = [row for page in pages for row in page]
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert len({row["transaction_id"] for row in rows}) == 7
+    keys = [(row["transaction_date"], row["created_at"], row["transaction_id"]) for row in rows]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_new_rows_do_not_shift_next_page(client, fake, user_id):
+    seed_user(fake, user_id)
+    seed_transactions(fake, user_id, [("2025-01-%02d" % day, "income", float(day)) for day in range(1, 7)])
+
+    first = client.get("/transactions/", params={"user_id": user_id, "limit": 3, "pagination": "cursor"}).json()
+    seed_transactions(fake, user_id, [("2025-02-01", "income", 999.0)])
+    second = client.get("/transactions/", params={"user_id": user_id, "limit": 3, "cursor": first["next_cursor"]}).json()
+
+    assert [row["transaction_date"] for row in first["items"] + second["items"]] == [
+        "2025-01-06", "2025-01-05", "2025-01-04", "2025-01-03", "2025-01-02", "2025-01-01"
+    ]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64-json",
+    _cursor("2025-13-01", "2025-01-01T10:00:00+00:00", "2b1b8c1e-5d8f-4a59-9c8a-9f0d3c7e1a11"),
+    _cursor("2025-01-01", "yesterday", "2b1b8c1e-5d8f-4a59-9c8a-9f0d3c7e1a11"),
+    _cursor("2025-01-01", '2025-01-01",transaction_id.neq.x', "2b1b8c1e-5d8f-4a59-9c8a-9f0d3c7e1a11"),
+    _cursor("2025-01-01", "2025-01-01T10:00:00+00:00", "1),user_id.neq.(x"),
+    _cursor("2025-01-01", "2025-01-01T10:00:00+00:00"),
+])
+def test_malformed_cursor_is_rejected(client, fake, user_id, cursor):
+    response = client.get("/transactions/", params={"user_id": user_id, "cursor": cursor})
+
+    assert response.status_code == 400
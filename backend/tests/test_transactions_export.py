@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+
+import routers.transactions as transactions_router
+from tests.conftest import seed_transactions, seed_user
+
+
+def _seed_ledger(fake, user_id):
+    salary, = fake.seed("categories", [{"user_id": None, "name": "Дохід від ФОП", "type": "income"}])
+    rent, = fake.seed("categories", [{"user_id": user_id, "name": "Оренда, офіс", "type": "expense"}])
+    rows = [
+        ("2025-01-10", "income", 1000.0, salary["id"]), ("2025-01-15", "expense", 300.0, rent["id"]),
+        ("2025-02-01", "income", 2000.0, salary["id"]), ("2025-02-20", "expense", 50.5, None),
+        ("2025-03-05", "income", 750.0, None),
+    ]
+    seed_transactions(fake, user_id, [
+        {"user_id": user_id, "transaction_date": d, "transaction_type": t, "transaction_amount": a, "category_id": c,
+         "currency_code": "UAH", "is_foreign_currency": False, "amount_original": None, "exchange_rate": 1.0,
+         "notes": "рядок, з комою"}
+        for d, t, a, c in rows
+    ])
+
+
+def test_csv_export_streams_all_chunks_with_category_names(client, fake, user_id, monkeypatch):
+    seed_user(fake, user_id)
+    _seed_ledger(fake, user_id)
+    monkeypatch.setattr(transactions_router, "EXPORT_CHUNK_SIZE", 2)
+
+    response = client.get("/transactions/export", params={"user_id": user_id})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="transactions.csv"' in response.headers["content-disposition"]
+    assert response.text.startswith("\ufeff")
+    rows = list(csv.DictReader(io.StringIO(response.text.lstrip("\ufeff"))))
+    assert list(rows[0]) == transactions_router.EXPORT_COLUMNS
+    assert [row["transaction_date"] for row in rows] == ["2025-03-05", "2025-02-20", "2025-02-01", "2025-01-15", "2025-01-10"]
+    assert [row["category_name"] for row in rows] == ["", "", "Дохід від ФОП", "Оренда, офіс", "Дохід від ФОП"]
+    assert rows[0]["notes"] == "рядок, з комою"
+
+
+def test_ndjson_export_applies_filters(client, fake, user_id):
+    seed_user(fake, user_id)
+    _seed_ledger(fake, user_id)
+
+    response = client.get("/transactions/export", params={
+        "user_id": user_id, "format": "ndjson", "type": "income", "start_date": "2025-02-01", "end_date": "2025-03-31",
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert [(i["transaction_date"], i["transaction_amount"]) for i in items] == [("2025-03-05", 750.0), ("2025-02-01", 2000.0)]
+
+
+def test_export_rejects_unknown_format(client, fake, user_id):
+    assert client.get("/transactions/export", params={"user_id": user_id, "format": "xlsx"}).status_code == 400
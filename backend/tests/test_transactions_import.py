@@ -0,0 +1,100 @@
+import json
+
+import routers.transactions as transactions_router
+from tests.conftest import seed_user
+
+
+def _import(client, user_id, body, content_type="text/csv", **params):
+    return client.post(
+        "/transactions/bulk", params={"user_id": user_id, **params},
+        content=body.encode("utf-8"), headers={"content-type": content_type}
+    )
+
+
+def test_generic_csv_is_parsed_and_inserted(client, fake, user_id):
+    seed_user(fake, user_id)
+    body = (
+        "date,type,amount,currency,description\n"
+        "2024-03-01,income,\"1 000,50\",UAH,Оплата\n"
+        "2024-03-02,expense,200,UAH,\"Кава, тістечко\"\n"
+        "not-a-date,income,10,UAH,\n"
+    )
+    report = _import(client, user_id, body).json()
+
+    assert (report["total"], report["created"], report["failed"]) == (3, 2, 1)
+    assert [r["status"] for r in report["rows"]] == ["created", "created", "error"]
+    assert report["rows"][0]["amount_uah"] == 1000.5
+    stored = [r for r in fake.tables["transactions"] if r["user_id"] == user_id]
+    assert sorted(r["notes"] for r in stored) == ["Кава, тістечко", "Оплата"]
+
+
+def test_monobank_sign_defines_type(client, fake, user_id):
+    seed_user(fake, user_id)
+    body = (
+        "Дата i час операції,Деталі операції,MCC,Сума в валюті картки (UAH),Сума в валюті операції,Валюта\n"
+        "01.03.2024 10:00:00,Кав'ярня,5814,-120.00,-120.00,UAH\n"
+        "02.03.2024 11:30:00,Поповнення,4829,5000.00,5000.00,UAH\n"
+    )
+    report = _import(client, user_id, body, format="monobank").json()
+
+    assert report["created"] == 2
+    types = {r["notes"]: (r["transaction_type"], r["transaction_amount"]) for r in fake.tables["transactions"]}
+    assert types == {"Кав'ярня": ("expense", 120.0), "Поповнення": ("income", 5000.0)}
+
+
+def test_ndjson_dry_run_writes_nothing(client, fake, user_id):
+    body = "\n".join([
+        json.dumps({"type": "income", "amount": 10, "date": "2024-01-05"}),
+        json.dumps({"type": "income", "amount": -1, "date": "2024-01-05"}),
+        "{not json",
+    ])
+    report = _import(client, user_id, body, content_type="application/x-ndjson", dry_run="true").json()
+
+    assert [r["status"] for r in report["rows"]] == ["valid", "error", "error"]
+    assert fake.tables["transactions"] == []
+
+
+def test_ndjson_rows_with_escaped_quotes_stay_separate(client, fake, user_id):
+    seed_user(fake, user_id)
+    body = "\n".join(json.dumps({"type": "expense", "amount": 100 + i, "date": "2024-01-05", "description": description})
+                     for i, description in enumerate(['Monitor 27" 4K', "Кабель", 'Стіл "Loft"']))
+    report = _import(client, user_id, body, content_type="application/x-ndjson").json()
+
+    assert (report["total"], report["created"], report["failed"]) == (3, 3, 0)
+    assert sorted(r["notes"] for r in fake.tables["transactions"]) == ["Monitor 27\" 4K", "Кабель", "Стіл \"Loft\""]
+
+
+def test_csv_field_with_newline_is_one_record(client, fake, user_id):
+    seed_user(fake, user_id)
+    body = 'date,type,amount,description\n2024-03-01,income,10,"два\nрядки, ""лапки"""\n2024-03-02,income,20,\n'
+    report = _import(client, user_id, body).json()
+
+    assert (report["total"], report["created"]) == (2, 2)
+    assert 'два\nрядки, "лапки"' in [r["notes"] for r in fake.tables["transactions"]]
+
+
+def test_bad_row_does_not_fail_the_whole_batch(client, fake, user_id, monkeypatch):
+    seed_user(fake, user_id)
+    category = fake.seed("categories", [{"user_id": user_id, "name": "Послуги", "type": "income"}])[0]
+    monkeypatch.setattr(transactions_router, "IMPORT_BATCH_SIZE", 8)
+    lines = ["date,type,amount,category_id"]
+    for i in range(10):
+        category_id = "00000000-0000-0000-0000-00000000dead" if i in (3, 7) else category["id"]
+        lines.append(f"2024-02-{i + 1:02d},income,{100 + i},{category_id}")
+    requests_before = fake.requests
+
+    report = _import(client, user_id, "\n".join(lines) + "\n").json()
+
+    statuses = {r["row"]: r["status"] for r in report["rows"]}
+    assert [n for n, s in statuses.items() if s == "error"] == [4, 8]
+    assert report["created"] == 8
+    assert "Рядок відхилено базою" in report["rows"][3]["error"]
+    stored = sorted(r["transaction_amount"] for r in fake.tables["transactions"])
+    assert stored == [100 + i for i in range(10) if i not in (3, 7)]
+    # Погані рядки шукаються поділом пачки навпіл, а не вставкою кожного рядка окремо
+    assert fake.requests - requests_before < 20
+
+
+def test_unknown_format_is_rejected(client, user_id):
+    response = _import(client, user_id, "a,b\n", format="swift")
+    assert response.status_code == 400
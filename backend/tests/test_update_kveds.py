@@ -0,0 +1,132 @@
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import sys
+
+import pytest
+
+from tests.conftest import BACKEND_DIR
+
+_spec = importlib.util.spec_from_file_location(
+    "update_kveds", os.path.join(os.path.dirname(BACKEND_DIR), "scripts", "update_kveds.py")
+)
+update_kveds = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(update_kveds)
+
+
+def _entry(section, name, division=None, class_code=None):
+    return {"Код секції": section, "Код розділу \n": division, "Код групи \n": None, "Код класу": class_code, "Назва": name}
+
+
+CLASSIFIER = [
+    _entry("A", "Сільське господарство"),
+    _entry("A", "Рослинництво", division="01"),
+    _entry("A", "Вирощування зернових культур", class_code="01.11"),
+    _entry("J", "Інформація та телекомунікації"),
+    _entry("J", "Комп'ютерне програмування", division="62"),
+    _entry("J", "Комп'ютерне програмування", class_code="62.01"),
+    _entry("J", "Консультування з питань інформатизації", class_code="62.02"),
+]
+
+
+def _write_source(path, entries):
+    raw = ("\ufeff" + json.dumps(entries, ensure_ascii=False, indent=1)).encode("utf-8")
+    path.write_bytes(raw)
+    return raw
+
+
+def _run(monkeypatch, source, out_dir, *extra):
+    monkeypatch.setattr(sys, "argv", ["update_kveds.py", "--source", str(source), "--out-dir", str(out_dir), "--js-out", "", *extra])
+    update_kveds.main()
+    with open(out_dir / "manifest.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_iter_entries_streams_across_chunk_boundaries(monkeypatch):
+    raw = ("\ufeff" + json.dumps(CLASSIFIER, ensure_ascii=False)).encode("utf-8")
+    # Крихітні шматки ріжуть і об'єкти, і багатобайтові літери UTF-8
+    monkeypatch.setattr(update_kveds, "CHUNK_SIZE", 7)
+    hasher = hashlib.sha256()
+
+    entries = list(update_kveds.iter_entries(io.BytesIO(raw), hasher))
+
+    assert entries == CLASSIFIER
+    assert hasher.hexdigest() == hashlib.sha256(raw).hexdigest()
+
+
+def test_iter_entries_rejects_truncated_source():
+    raw = json.dumps(CLASSIFIER, ensure_ascii=False).encode("utf-8")[:-20]
+
+    with pytest.raises(ValueError):
+        list(update_kveds.iter_entries(io.BytesIO(raw), hashlib.sha256()))
+
+
+def test_regeneration_writes_chunks_and_skips_unchanged_source(monkeypatch, tmp_path, capsys):
+    source, out_dir = tmp_path / "kved.json", tmp_path / "kveds"
+    raw = _write_source(source, CLASSIFIER)
+
+    manifest = _run(monkeypatch, source, out_dir)
+
+    assert manifest["source_sha256"] == hashlib.sha256(raw).hexdigest()
+    assert [(s["id"], s["items"]) for s in manifest["sections"]] == [("A", 1), ("J", 2)]
+    with open(out_dir / "section-J.json", encoding="utf-8") as f:
+        assert [item["code"] for item in json.load(f)["groups"][0]["items"]] == ["62.01", "62.02"]
+
+    mtime = os.stat(out_dir / "section-A.json").st_mtime_ns
+    _run(monkeypatch, source, out_dir)
+    assert "nothing to do" in capsys.readouterr().out
+    assert os.stat(out_dir / "section-A.json").st_mtime_ns == mtime
+
+
+def test_removed_section_is_pruned_after_the_manifest(monkeypatch, tmp_path):
+    source, out_dir = tmp_path / "kved.json", tmp_path / "kveds"
+    _write_source(source, CLASSIFIER)
+    _run(monkeypatch, source, out_dir)
+    _write_source(source, CLASSIFIER[3:])
+
+    manifest = _run(monkeypatch, source, out_dir)
+
+    assert [s["id"] for s in manifest["sections"]] == ["J"]
+    assert sorted(os.listdir(out_dir)) == ["manifest.json", "section-J.json"]
+
+
+def test_failed_manifest_write_keeps_previous_output_consistent(monkeypatch, tmp_path):
+    source, out_dir = tmp_path / "kved.json", tmp_path / "kveds"
+    _write_source(source, CLASSIFIER)
+    before = _run(monkeypatch, source, out_dir)
+    _write_source(source, CLASSIFIER[3:])
+
+    write = update_kveds.write_if_changed
+
+    def failing_write(path, content):
+        if path.endswith("manifest.json"):
+            raise OSError("disk full")
+        return write(path, content)
+
+    monkeypatch.setattr(update_kveds, "write_if_changed", failing_write)
+    with pytest.raises(OSError):
+        _run(monkeypatch, source, out_dir)
+
+    # Старий маніфест і всі файли, на які він посилається, на місці; тимчасових файлів немає
+    with open(out_dir / "manifest.json", encoding="utf-8") as f:
+        assert json.load(f) == before
+    assert sorted(os.listdir(out_dir)) == ["manifest.json", "section-A.json", "section-J.json"]
+
+
+def test_sections_module_regenerates_chunks_without_the_classifier(monkeypatch, tmp_path):
+    source, out_dir = tmp_path / "kved.json", tmp_path / "kveds"
+    _write_source(source, CLASSIFIER)
+    sections = update_kveds.transform(CLASSIFIER)
+    module = tmp_path / "kveds.js"
+    module.write_text("export const KVED_SECTIONS = " + json.dumps(sections, ensure_ascii=False, indent=2) + ";\n", encoding="utf-8")
+    from_classifier = _run(monkeypatch, source, out_dir)
+    chunk = (out_dir / "section-J.json").read_bytes()
+
+    manifest = _run(monkeypatch, source, out_dir, "--from-sections", str(module))
+
+    assert manifest["source"] == str(module)
+    assert manifest["source_sha256"] == hashlib.sha256(module.read_bytes()).hexdigest()
+    assert manifest["sections"] == from_classifier["sections"]
+    assert (out_dir / "section-J.json").read_bytes() == chunk
@@ -0,0 +1,51 @@
+from tests.conftest import seed_user
+
+
+def _single_tax(client, user_id):
+    response = client.get("/tax/calculate", params={"user_id": user_id, "monthly_income": 100000, "as_of": "2025-05-15"})
+    assert response.status_code == 200, response.text
+    return response.json()["taxes"]["single_tax"]
+
+
+def test_settings_are_cached_until_patch(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=3)
+    assert _single_tax(client, user_id) == 5000.0
+
+    # Зміна в обхід API не видна до кінця TTL — відповідь іде з кешу
+    fake.tables["fop_settings"][0]["income_tax_percent"] = 4.0
+    assert _single_tax(client, user_id) == 5000.0
+
+    response = client.patch(f"/settings/{user_id}", json={"income_tax_percent": 3.0})
+    assert response.status_code == 200, response.text
+    assert _single_tax(client, user_id) == 3000.0
+
+
+def test_settings_patch_creates_missing_row_and_drops_cached_absence(client, fake, user_id):
+    seed_user(fake, user_id, fop_group=0)
+    assert client.get("/tax/calculate", params={"user_id": user_id}).status_code == 404
+
+    response = client.patch(f"/settings/{user_id}", json={"fop_group": 3, "income_tax_percent": 5.0})
+    assert response.status_code == 200, response.text
+    assert _single_tax(client, user_id) == 5000.0
+
+
+def test_profile_is_cached_until_patch_or_delete(client, fake, user_id):
+    seed_user(fake, user_id)
+    assert client.get(f"/profile/{user_id}").json()["full_name"] == "Тест"
+
+    fake.tables["profiles"][0]["full_name"] = "Змінено в обхід API"
+    assert client.get(f"/profile/{user_id}").json()["full_name"] == "Тест"
+
+    assert client.patch(f"/profile/{user_id}", json={"full_name": "Нове ім'я"}).status_code == 200
+    assert client.get(f"/profile/{user_id}").json()["full_name"] == "Нове ім'я"
+
+    assert client.delete(f"/profile/{user_id}").status_code == 200
+    assert client.get(f"/profile/{user_id}").status_code == 404
+
+
+def test_profile_create_replaces_cached_absence(client, fake, user_id):
+    assert client.get(f"/profile/{user_id}").status_code == 404
+
+    response = client.post("/profile/", json={"user_id": user_id, "full_name": "Новий", "is_fop": True})
+    assert response.status_code == 201, response.text
+    assert client.get(f"/profile/{user_id}").json()["full_name"] == "Новий"
@@ -71,6 +71,17 @@ export default {
     return api.patch(`/settings/${userId}`, data);
   },
 
+  // --- КВЕД ---
+  getKvedSections() {
+    return api.get('/kveds/sections');
+  },
+  getKvedSection(sectionId) {
+    return api.get(`/kveds/sections/${sectionId}`);
+  },
+  searchKveds(q, limit = 50) {
+    return api.get('/kveds/search', { params: { q, limit } });
+  },
+
   // === ДОДАЙТЕ ЦІ РЯДКИ, ЩОБ ВИПРАВИТИ ПОМИЛКУ ===
   // Дозволяє викликати api.get, api.post, api.patch напряму з компонентів
   get: (url, config) => api.get(url, config),
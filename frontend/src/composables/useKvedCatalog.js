@@ -0,0 +1,45 @@
+import { ref, computed, watch, onMounted } from 'vue';
+import { useKvedStore } from '@/stores/kvedStore';
+
+const SEARCH_DEBOUNCE_MS = 250;
+
+// Список КВЕД для екранів вибору: без запиту — каталог секцій, із запитом — пошук на backend.
+// Відповідь на застарілий запит (користувач уже друкує далі) відкидається.
+export function useKvedCatalog(query) {
+  const store = useKvedStore();
+  const results = ref([]);
+  const isSearching = ref(false);
+  let timer = null;
+  let latest = 0;
+
+  onMounted(() => store.fetchSections());
+
+  watch(query, (value) => {
+    clearTimeout(timer);
+    const requestId = ++latest;
+    const q = value.trim();
+    if (!q) {
+      results.value = [];
+      isSearching.value = false;
+      return;
+    }
+    isSearching.value = true;
+    timer = setTimeout(async () => {
+      try {
+        const found = await store.search(q);
+        if (requestId === latest) results.value = found;
+      } catch (e) {
+        console.error("KVED search error:", e);
+        if (requestId === latest) results.value = [];
+      } finally {
+        if (requestId === latest) isSearching.value = false;
+      }
+    }, SEARCH_DEBOUNCE_MS);
+  });
+
+  const sections = computed(() => (query.value.trim() ? results.value : store.catalog));
+
+  const isSectionLoaded = (id) => Boolean(store.groupsBySection[id]);
+
+  return { sections, isSearching, openSection: store.fetchSection, isSectionLoaded };
+}
@@ -0,0 +1,61 @@
+import { defineStore } from 'pinia';
+import api from '@/api';
+
+// Каталог КВЕД з backend: список секцій — одразу, вміст секції — коли її розгортають,
+// пошук — на сервері. Завантажене лишається в сторі до кінця сесії.
+export const useKvedStore = defineStore('kveds', {
+  state: () => ({
+    sections: [], // [{ id, title, items }]
+    groupsBySection: {}, // id секції -> розділи з видами діяльності
+    isLoading: false,
+    error: null
+  }),
+
+  getters: {
+    // Дерево для перегляду: розділи є лише в уже розгорнутих секціях
+    catalog: (state) => state.sections.map(section => ({
+      ...section,
+      groups: state.groupsBySection[section.id] || []
+    }))
+  },
+
+  actions: {
+    async fetchSections() {
+      if (this.sections.length) return;
+      this.isLoading = true;
+      try {
+        const res = await api.getKvedSections();
+        this.sections = res.data;
+      } catch (e) {
+        console.error("Error fetching KVED sections:", e);
+        this.error = "Не вдалося завантажити КВЕДи";
+      } finally {
+        this.isLoading = false;
+      }
+    },
+
+    async fetchSection(sectionId) {
+      if (this.groupsBySection[sectionId]) return;
+      try {
+        const res = await api.getKvedSection(sectionId);
+        this.groupsBySection[sectionId] = res.data.groups;
+      } catch (e) {
+        console.error("Error fetching KVED section:", e);
+      }
+    },
+
+    // Результати пошуку в тій самій формі, що й каталог: секція -> розділ -> види діяльності
+    async search(query) {
+      const res = await api.searchKveds(query);
+      const sections = {};
+      for (const item of res.data.results) {
+        const section = sections[item.section.id] ||= { ...item.section, groups: {} };
+        const group = section.groups[item.division.id] ||= { ...item.division, items: [] };
+        group.items.push({ code: item.code, name: item.name, allowedGroups: item.allowedGroups });
+      }
+      return Object.values(sections)
+        .sort((a, b) => a.id.localeCompare(b.id))
+        .map(section => ({ ...section, groups: Object.values(section.groups).sort((a, b) => a.id.localeCompare(b.id)) }));
+    }
+  }
+});
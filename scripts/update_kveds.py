@@ -1,19 +1,106 @@
+import argparse
+import codecs
+import hashlib
 import json
-import urllib.request
 import os
+import sys
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
 
 URL = "https://data.gov.ua/dataset/f8a741b9-af17-48e2-8178-8e161c244549/resource/878a36b5-31af-4c36-86e6-5dbf432e9331/download/kved.json"
 
-def fetch_data():
-    print(f"Fetching data from {URL}...")
-    with urllib.request.urlopen(URL) as response:
-        return json.loads(response.read().decode('utf-8'))
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Per-section chunks + manifest.json, shipped with the backend and loaded by services/kved_index.py at startup
+DEFAULT_OUT_DIR = os.path.join(ROOT, "backend", "data", "kveds")
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 64 * 1024
+
+
+def open_source(source, manifest, force):
+    """
+    Returns (stream, meta) for a URL or a local file, or (None, None) if the server
+    says the source has not changed since the last run (ETag / Last-Modified).
+    """
+    if not source.startswith(("http://", "https://")):
+        return open(source, "rb"), {}
+
+    request = urllib.request.Request(source)
+    if not force:
+        if manifest.get("etag"):
+            request.add_header("If-None-Match", manifest["etag"])
+        if manifest.get("last_modified"):
+            request.add_header("If-Modified-Since", manifest["last_modified"])
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, None
+        raise
+    return response, {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+
+
+def hash_file(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def iter_entries(stream, hasher):
+    """
+    Streams the objects of a top-level JSON array one by one, so the whole
+    download never sits in memory as a single string. Every raw chunk also goes
+    into hasher, so the content hash comes for free.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace / separators between elements
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
 
-def transform(data):
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array of KVED entries")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                entry, pos = decoder.raw_decode(buffer, pos)
+                yield entry
+                continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # The element is cut by the chunk boundary: read more
+
+        if eof:
+            raise ValueError("Unexpected end of KVED source")
+        chunk = stream.read(CHUNK_SIZE)
+        eof = not chunk
+        hasher.update(chunk)
+        # Drop what is already parsed, keep the unfinished tail
+        buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        pos = 0
+
+
+def transform(entries):
     sections = {}
-    
+
     # First pass: map everything
-    for entry in data:
+    for entry in entries:
         section_code = entry.get("Код секції")
         division_code = entry.get("Код розділу \n")
         group_code = entry.get("Код групи \n")
@@ -25,7 +112,7 @@ def transform(data):
 
         if section_code not in sections:
             sections[section_code] = {"id": section_code, "title": f"Секція {section_code}. {name}", "groups": {}}
-        
+
         section = sections[section_code]
 
         if division_code and not group_code and not class_code:
@@ -42,7 +129,7 @@ def transform(data):
             div = class_code[:2]
             if div not in section["groups"]:
                 section["groups"][div] = {"id": div, "title": f"Розділ {div}", "items": []}
-            
+
             section["groups"][div]["items"].append({
                 "code": class_code,
                 "name": name,
@@ -58,25 +145,177 @@ def transform(data):
             g = s["groups"][g_code]
             if g["items"]: # Only include groups that have classes
                 s_groups.append(g)
-        
+
         if s_groups:
             s["groups"] = s_groups
             final_list.append(s)
-            
+
     return final_list
 
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_if_changed(path, content):
+    """
+    Atomic write that leaves the file (and its mtime) alone when content is the same:
+    the content goes to a temp file in the same directory, is fsynced and then
+    os.replace()d over the target, so readers see either the old or the new file.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def write_chunks(sections, out_dir, previous):
+    """
+    One file per section; only sections whose content hash changed are rewritten.
+    Nothing is deleted here: files of sections that disappeared are returned as stale
+    and removed only after the new manifest is in place (prune_chunks).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    old_hashes = {s["id"]: s["sha256"] for s in previous.get("sections", [])}
+    old_files = {s["file"] for s in previous.get("sections", [])}
+
+    entries = []
+    written = 0
+    for section in sections:
+        content = json.dumps(section, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        file_name = f"section-{section['id']}.json"
+        path = os.path.join(out_dir, file_name)
+        if old_hashes.get(section["id"]) != digest or not os.path.exists(path):
+            written += write_if_changed(path, content)
+        entries.append({
+            "id": section["id"],
+            "title": section["title"],
+            "file": file_name,
+            "sha256": digest,
+            "items": sum(len(g["items"]) for g in section["groups"]),
+        })
+
+    # Sections that disappeared from the classifier
+    stale = sorted(old_files - {e["file"] for e in entries})
+    return entries, written, stale
+
+
+def prune_chunks(out_dir, stale):
+    """Removes chunk files the current manifest no longer references."""
+    for file_name in stale:
+        stale_path = os.path.join(out_dir, file_name)
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+
+def read_sections(path):
+    """
+    Already transformed sections: a JSON array or the legacy frontend module
+    "export const KVED_SECTIONS = [...];" (the array between "=" and the final ";").
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if not path.endswith(".json"):
+        text = text[text.index("=") + 1:].strip().rstrip(";")
+    return json.loads(text)
+
+
+def write_js_module(sections, js_out):
+    content = "export const KVED_SECTIONS = " + json.dumps(sections, ensure_ascii=False, indent=2) + ";\n"
+    return write_if_changed(js_out, content)
+
+
+def chunks_present(out_dir, manifest):
+    return bool(manifest.get("sections")) and all(
+        os.path.exists(os.path.join(out_dir, s["file"])) for s in manifest["sections"]
+    )
+
+
 def main():
-    raw_data = fetch_data()
-    transformed_data = transform(raw_data)
-    
-    output_path = "/Users/tsiptakvyacheslav/Sofiia_Practice/fin-assistant/frontend/src/constants/kveds.js"
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("export const KVED_SECTIONS = ")
-        json.dump(transformed_data, f, ensure_ascii=False, indent=2)
-        f.write(";\n")
-    
-    print(f"Successfully updated {output_path}")
+    parser = argparse.ArgumentParser(description="Regenerate KVED sections from the data.gov.ua classifier")
+    parser.add_argument("--source", default=URL, help="URL or path to a local copy of kved.json (offline)")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR, help="Directory for per-section chunks and manifest.json")
+    parser.add_argument("--from-sections", metavar="PATH",
+                        help="Take already transformed sections (JSON array or legacy KVED_SECTIONS module) instead of the classifier")
+    parser.add_argument("--js-out", default="", help="Also write a single JS module with all sections (off by default)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the source has not changed")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.out_dir)
+    up_to_date = not args.force and chunks_present(args.out_dir, manifest)
+
+    if args.from_sections:
+        print(f"Reading sections from {args.from_sections}...")
+        source, meta = args.from_sections, {}
+        source_sha256 = hash_file(source)
+        sections = read_sections(source)
+    else:
+        source = args.source
+        # A local file is cheap to hash before parsing: skip everything if it is the same
+        is_local = not source.startswith(("http://", "https://"))
+        if up_to_date and is_local and hash_file(source) == manifest.get("source_sha256"):
+            print(f"{source} unchanged (sha256 {manifest['source_sha256'][:12]}), nothing to do")
+            return
+
+        print(f"Reading {source}...")
+        stream, meta = open_source(source, manifest if up_to_date else {}, args.force)
+        if stream is None:
+            print("Source not modified since the last run, nothing to do")
+            return
+
+        hasher = hashlib.sha256()
+        with stream:
+            sections = transform(iter_entries(stream, hasher))
+        source_sha256 = hasher.hexdigest()
+
+    if up_to_date and source_sha256 == manifest.get("source_sha256"):
+        print(f"Source unchanged (sha256 {source_sha256[:12]}), nothing to do")
+        return
+    if not sections:
+        sys.exit("No KVED sections parsed from the source, keeping the previous output")
+
+    entries, written, stale = write_chunks(sections, args.out_dir, manifest)
+    new_manifest = {
+        "version": MANIFEST_VERSION,
+        "source": source,
+        "source_sha256": source_sha256,
+        "etag": (meta or {}).get("etag"),
+        "last_modified": (meta or {}).get("last_modified"),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sections": entries,
+    }
+    # Manifest goes after the chunks: readers never see it pointing at chunks that are not written yet,
+    # and the old manifest keeps pointing at existing files until the new one replaces it
+    write_if_changed(
+        os.path.join(args.out_dir, MANIFEST_NAME),
+        json.dumps(new_manifest, ensure_ascii=False, indent=2) + "\n",
+    )
+    prune_chunks(args.out_dir, stale)
+    print(f"Sections: {len(entries)}, rewritten: {written}, removed: {len(stale)}, manifest: {os.path.join(args.out_dir, MANIFEST_NAME)}")
+
+    if args.js_out:
+        changed = write_js_module(sections, args.js_out)
+        print(f"{'Updated' if changed else 'Unchanged'} {args.js_out}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,38 @@
+-- Суми журналу по (місяць, тип, категорія[, валюта]) для repositories/rest/transactions.py:
+-- групування відбувається в базі, а не постраничним читанням усіх рядків через PostgREST.
+-- Результат має ті самі колонки, що й GROUP BY у repositories/sql/transactions.py.
+create or replace function public.aggregate_transactions_by_month(
+    p_user_id uuid,
+    p_start_date date default null,
+    p_end_date date default null,
+    p_by_currency boolean default false
+)
+returns table (
+    month text,
+    transaction_type text,
+    category_id uuid,
+    currency_code text,
+    amount numeric,
+    amount_original numeric,
+    tx_count bigint
+)
+language sql
+stable
+as $$
+    select to_char(t.transaction_date, 'YYYY-MM') as month,
+           t.transaction_type,
+           t.category_id,
+           case when p_by_currency then t.currency_code end as currency_code,
+           sum(t.transaction_amount) as amount,
+           sum(coalesce(t.amount_original, t.transaction_amount)) as amount_original,
+           count(*) as tx_count
+    from public.transactions t
+    where t.user_id = p_user_id
+      and (p_start_date is null or t.transaction_date >= p_start_date)
+      and (p_end_date is null or t.transaction_date <= p_end_date)
+    group by 1, 2, 3, 4
+$$;
+
+-- Той самий індекс, що в core/sql_storage.py (INDEXES): фільтр (user_id, період) без скану таблиці
+create index if not exists idx_transactions_user_date
+    on public.transactions (user_id, transaction_date desc, created_at desc, transaction_id desc);
@@ -0,0 +1,60 @@
+-- Часткове оновлення транзакції з перерахунком сум одним UPDATE (routers/transactions.py, patch_transaction):
+-- нова сума в гривні, курс і валютні поля рахуються з поточного рядка в базі, без читання й запису окремими запитами.
+-- Курс НБУ застосовується, лише якщо він потрібен і виданий саме для нової пари (валюта, дата);
+-- інакше рядок не змінюється і функція нічого не повертає.
+-- Поруч з новою версією рядка повертаються old_transaction_date / _type / _amount (для лічильників доходу).
+create or replace function public.patch_transaction_financials(
+    p_transaction_id uuid,
+    p_user_id uuid,
+    p_transaction_type text default null,
+    p_category_id uuid default null,
+    p_notes text default null,
+    p_amount numeric default null,
+    p_date date default null,
+    p_currency text default null,
+    p_manual_rate numeric default null,
+    p_reset_rate boolean default false,
+    p_nbu_rate numeric default null,
+    p_rate_currency text default null,
+    p_rate_date date default null
+)
+returns setof jsonb
+language sql
+as $$
+    with calc as (
+        select n.*, case
+            when n.new_currency = 'UAH' then 1
+            when p_manual_rate > 0 then p_manual_rate
+            when p_reset_rate or n.new_currency <> n.old_currency or n.new_date <> n.old_date
+                then case when n.new_currency = p_rate_currency and n.new_date = p_rate_date then p_nbu_rate end
+            else n.old_rate
+        end as rate
+        from (
+            select transaction_id as id, transaction_type as old_type, category_id as old_category_id, notes as old_notes,
+                   transaction_date as old_date, transaction_amount as old_amount, currency_code as old_currency,
+                   exchange_rate as old_rate,
+                   coalesce(p_amount, amount_original, transaction_amount) as new_amount,
+                   coalesce(p_date, transaction_date) as new_date,
+                   coalesce(p_currency, currency_code) as new_currency
+            from public.transactions
+            where transaction_id = p_transaction_id and user_id = p_user_id
+            for update
+        ) as n
+    ), updated as (
+        update public.transactions t set
+            transaction_type = coalesce(p_transaction_type, calc.old_type),
+            category_id = coalesce(p_category_id, calc.old_category_id),
+            notes = coalesce(p_notes, calc.old_notes),
+            transaction_date = calc.new_date,
+            currency_code = calc.new_currency,
+            is_foreign_currency = calc.new_currency <> 'UAH',
+            exchange_rate = calc.rate,
+            amount_original = case when calc.new_currency = 'UAH' then null else calc.new_amount end,
+            transaction_amount = round(calc.new_amount * calc.rate, 2)
+        from calc
+        where t.transaction_id = calc.id and calc.rate is not null
+        returning t.*, calc.old_date as old_transaction_date, calc.old_type as old_transaction_type,
+                  calc.old_amount as old_transaction_amount
+    )
+    select to_jsonb(updated) from updated
+$$;